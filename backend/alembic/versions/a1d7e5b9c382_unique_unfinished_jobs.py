@@ -0,0 +1,42 @@
+"""one unfinished background job per target
+
+Revision ID: a1d7e5b9c382
+Revises: f3c8a2d5e719
+Create Date: 2026-10-17 11:02:47.118305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1d7e5b9c382'
+down_revision: Union[str, None] = 'f3c8a2d5e719'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep only the newest unfinished job per target before enforcing it
+    op.execute("""
+        UPDATE background_jobs
+        SET status = 'abandoned', finished_at = now()
+        WHERE status IN ('pending', 'running')
+          AND id NOT IN (
+              SELECT max(id) FROM background_jobs
+              WHERE status IN ('pending', 'running')
+              GROUP BY kind, target_id
+          )
+    """)
+    op.drop_index('ix_background_jobs_kind_target_id', table_name='background_jobs')
+    op.create_index(
+        'uq_background_jobs_unfinished_kind_target_id', 'background_jobs', ['kind', 'target_id'],
+        unique=True, postgresql_where=sa.text("status IN ('pending', 'running')")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_background_jobs_unfinished_kind_target_id', table_name='background_jobs')
+    op.create_index('ix_background_jobs_kind_target_id', 'background_jobs', ['kind', 'target_id'], unique=False)
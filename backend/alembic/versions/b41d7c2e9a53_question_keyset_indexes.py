@@ -0,0 +1,30 @@
+"""question keyset pagination indexes
+
+Revision ID: b41d7c2e9a53
+Revises: 9e19e0d6868c
+Create Date: 2026-10-16 09:12:04.381920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b41d7c2e9a53'
+down_revision: Union[str, None] = '9e19e0d6868c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_questions_created_at_id', 'questions', ['created_at', 'id'], unique=False)
+    op.create_index('ix_questions_topic_id_created_at_id', 'questions', ['topic_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_questions_asker_id_created_at_id', 'questions', ['asker_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_questions_asker_id_created_at_id', table_name='questions')
+    op.drop_index('ix_questions_topic_id_created_at_id', table_name='questions')
+    op.drop_index('ix_questions_created_at_id', table_name='questions')
@@ -0,0 +1,42 @@
+"""image derivative urls
+
+Revision ID: b6f3d2a8c415
+Revises: a8d4e61c9f35
+Create Date: 2026-10-16 18:05:12.481930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6f3d2a8c415'
+down_revision: Union[str, None] = 'a8d4e61c9f35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    for table in ('questions', 'answers'):
+        op.add_column(table, sa.Column('image_thumb_url', sa.String(length=500), nullable=True))
+        op.add_column(table, sa.Column('image_card_url', sa.String(length=500), nullable=True))
+        op.add_column(table, sa.Column('image_full_url', sa.String(length=500), nullable=True))
+
+    op.add_column('stored_images', sa.Column('thumb_url', sa.String(length=500), nullable=True))
+    op.add_column('stored_images', sa.Column('card_url', sa.String(length=500), nullable=True))
+    op.add_column('stored_images', sa.Column('full_url', sa.String(length=500), nullable=True))
+    op.create_index('ix_stored_images_url', 'stored_images', ['url'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_stored_images_url', table_name='stored_images')
+    op.drop_column('stored_images', 'full_url')
+    op.drop_column('stored_images', 'card_url')
+    op.drop_column('stored_images', 'thumb_url')
+
+    for table in ('answers', 'questions'):
+        op.drop_column(table, 'image_full_url')
+        op.drop_column(table, 'image_card_url')
+        op.drop_column(table, 'image_thumb_url')
@@ -0,0 +1,65 @@
+"""cascading deletes and background jobs
+
+Revision ID: c2e7f4a9b316
+Revises: b6f3d2a8c415
+Create Date: 2026-10-16 19:32:40.275164
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2e7f4a9b316'
+down_revision: Union[str, None] = 'b6f3d2a8c415'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The initial schema's foreign keys carry Postgres' default names
+    op.drop_constraint('questions_topic_id_fkey', 'questions', type_='foreignkey')
+    op.create_foreign_key(
+        'questions_topic_id_fkey', 'questions', 'topics',
+        ['topic_id'], ['id'], ondelete='CASCADE'
+    )
+    op.drop_constraint('answers_question_id_fkey', 'answers', type_='foreignkey')
+    op.create_foreign_key(
+        'answers_question_id_fkey', 'answers', 'questions',
+        ['question_id'], ['id'], ondelete='CASCADE'
+    )
+
+    op.create_table('background_jobs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(length=50), nullable=False),
+    sa.Column('target_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('total', sa.Integer(), nullable=False),
+    sa.Column('processed', sa.Integer(), nullable=False),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('requested_by_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['requested_by_id'], ['users.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_background_jobs_kind_target_id', 'background_jobs', ['kind', 'target_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_background_jobs_kind_target_id', table_name='background_jobs')
+    op.drop_table('background_jobs')
+
+    op.drop_constraint('answers_question_id_fkey', 'answers', type_='foreignkey')
+    op.create_foreign_key(
+        'answers_question_id_fkey', 'answers', 'questions',
+        ['question_id'], ['id']
+    )
+    op.drop_constraint('questions_topic_id_fkey', 'questions', type_='foreignkey')
+    op.create_foreign_key(
+        'questions_topic_id_fkey', 'questions', 'topics',
+        ['topic_id'], ['id']
+    )
@@ -0,0 +1,37 @@
+"""back to a gin trigram index for question suggestions
+
+Revision ID: c5a8e3f1d047
+Revises: a1d7e5b9c382
+Create Date: 2026-10-17 14:22:06.518934
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5a8e3f1d047'
+down_revision: Union[str, None] = 'a1d7e5b9c382'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # gist_trgm_ops signatures saturate on long questions, making the index
+    # lossy; GIN stays exact for the ILIKE filter and the suggestion query
+    # ranks a bounded candidate set instead of relying on KNN order
+    op.drop_index('ix_questions_ask_trgm', table_name='questions', postgresql_using='gist')
+    op.create_index(
+        'ix_questions_ask_trgm', 'questions', ['ask'], unique=False,
+        postgresql_using='gin', postgresql_ops={'ask': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_questions_ask_trgm', table_name='questions', postgresql_using='gin')
+    op.create_index(
+        'ix_questions_ask_trgm', 'questions', ['ask'], unique=False,
+        postgresql_using='gist', postgresql_ops={'ask': 'gist_trgm_ops'},
+    )
@@ -0,0 +1,43 @@
+"""full-text search vectors on questions and answers
+
+Revision ID: c7e2a9f04b18
+Revises: b41d7c2e9a53
+Create Date: 2026-10-16 10:03:51.227410
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e2a9f04b18'
+down_revision: Union[str, None] = 'b41d7c2e9a53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('questions', sa.Column(
+        'ask_tsv',
+        postgresql.TSVECTOR(),
+        sa.Computed("to_tsvector('english', ask)", persisted=True),
+        nullable=True,
+    ))
+    op.create_index('ix_questions_ask_tsv', 'questions', ['ask_tsv'], unique=False, postgresql_using='gin')
+    op.add_column('answers', sa.Column(
+        'response_tsv',
+        postgresql.TSVECTOR(),
+        sa.Computed("to_tsvector('english', response)", persisted=True),
+        nullable=True,
+    ))
+    op.create_index('ix_answers_response_tsv', 'answers', ['response_tsv'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_answers_response_tsv', table_name='answers', postgresql_using='gin')
+    op.drop_column('answers', 'response_tsv')
+    op.drop_index('ix_questions_ask_tsv', table_name='questions', postgresql_using='gin')
+    op.drop_column('questions', 'ask_tsv')
@@ -0,0 +1,57 @@
+"""question answer_count and last_activity_at
+
+Revision ID: d4a9c1e7b250
+Revises: c2e7f4a9b316
+Create Date: 2026-10-16 21:14:52.903417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a9c1e7b250'
+down_revision: Union[str, None] = 'c2e7f4a9b316'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('questions', sa.Column('answer_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('questions', sa.Column('last_activity_at', sa.DateTime(timezone=True), nullable=True))
+
+    # Backfill: every question starts at its creation, then answered
+    # questions take their count and newest answer from one GROUP BY pass
+    op.execute("UPDATE questions SET last_activity_at = created_at")
+    op.execute("""
+        UPDATE questions q
+        SET answer_count = a.answer_count,
+            last_activity_at = greatest(q.created_at, a.last_answer_at)
+        FROM (
+            SELECT question_id, count(*) AS answer_count, max(created_at) AS last_answer_at
+            FROM answers
+            GROUP BY question_id
+        ) a
+        WHERE a.question_id = q.id
+    """)
+    op.alter_column(
+        'questions', 'last_activity_at',
+        nullable=False, server_default=sa.text('now()')
+    )
+
+    op.create_index('ix_questions_last_activity_at_id', 'questions', ['last_activity_at', 'id'], unique=False)
+    op.create_index('ix_questions_answer_count_id', 'questions', ['answer_count', 'id'], unique=False)
+    op.create_index(
+        'ix_questions_unanswered_created_at_id', 'questions', ['created_at', 'id'],
+        unique=False, postgresql_where=sa.text('answer_count = 0')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_questions_unanswered_created_at_id', table_name='questions')
+    op.drop_index('ix_questions_answer_count_id', table_name='questions')
+    op.drop_index('ix_questions_last_activity_at_id', table_name='questions')
+    op.drop_column('questions', 'last_activity_at')
+    op.drop_column('questions', 'answer_count')
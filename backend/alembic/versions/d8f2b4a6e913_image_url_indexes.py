@@ -0,0 +1,49 @@
+"""partial image_url indexes on questions and answers
+
+Revision ID: d8f2b4a6e913
+Revises: c5a8e3f1d047
+Create Date: 2026-10-17 15:03:44.271590
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8f2b4a6e913'
+down_revision: Union[str, None] = 'c5a8e3f1d047'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A finished render updates every row using the image by URL
+    op.create_index(
+        'ix_questions_image_url', 'questions', ['image_url'], unique=False,
+        postgresql_where=sa.text('image_url IS NOT NULL')
+    )
+    op.create_index(
+        'ix_answers_image_url', 'answers', ['image_url'], unique=False,
+        postgresql_where=sa.text('image_url IS NOT NULL')
+    )
+
+    # Rows written while their image was rendering could miss the render's
+    # UPDATE and keep NULL variants; copy them from the stored upload
+    for table in ('questions', 'answers'):
+        op.execute(f"""
+            UPDATE {table} t
+            SET image_thumb_url = s.thumb_url,
+                image_card_url = s.card_url,
+                image_full_url = s.full_url
+            FROM stored_images s
+            WHERE s.url = t.image_url
+              AND s.card_url IS NOT NULL
+              AND t.image_card_url IS NULL
+        """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_answers_image_url', table_name='answers')
+    op.drop_index('ix_questions_image_url', table_name='questions')
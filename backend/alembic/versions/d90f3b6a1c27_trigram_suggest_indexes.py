@@ -0,0 +1,35 @@
+"""trigram indexes for search suggestions
+
+Revision ID: d90f3b6a1c27
+Revises: c7e2a9f04b18
+Create Date: 2026-10-16 11:20:37.554102
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd90f3b6a1c27'
+down_revision: Union[str, None] = 'c7e2a9f04b18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_questions_ask_trgm', 'questions', ['ask'], unique=False,
+        postgresql_using='gin', postgresql_ops={'ask': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_topics_name_trgm', 'topics', ['name'], unique=False,
+        postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_topics_name_trgm', table_name='topics', postgresql_using='gin')
+    op.drop_index('ix_questions_ask_trgm', table_name='questions', postgresql_using='gin')
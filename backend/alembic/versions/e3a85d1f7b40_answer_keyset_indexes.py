@@ -0,0 +1,28 @@
+"""answer keyset pagination indexes
+
+Revision ID: e3a85d1f7b40
+Revises: d90f3b6a1c27
+Create Date: 2026-10-16 12:41:09.730215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3a85d1f7b40'
+down_revision: Union[str, None] = 'd90f3b6a1c27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_answers_created_at_id', 'answers', ['created_at', 'id'], unique=False)
+    op.create_index('ix_answers_question_id_created_at_id', 'answers', ['question_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_answers_question_id_created_at_id', table_name='answers')
+    op.drop_index('ix_answers_created_at_id', table_name='answers')
@@ -0,0 +1,35 @@
+"""gist trigram index for question suggestions
+
+Revision ID: e8b1f6d3a924
+Revises: d4a9c1e7b250
+Create Date: 2026-10-17 09:41:18.206375
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b1f6d3a924'
+down_revision: Union[str, None] = 'd4a9c1e7b250'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # GiST can serve ORDER BY term <<-> ask LIMIT n; GIN can only find matches
+    op.drop_index('ix_questions_ask_trgm', table_name='questions', postgresql_using='gin')
+    op.create_index(
+        'ix_questions_ask_trgm', 'questions', ['ask'], unique=False,
+        postgresql_using='gist', postgresql_ops={'ask': 'gist_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_questions_ask_trgm', table_name='questions', postgresql_using='gist')
+    op.create_index(
+        'ix_questions_ask_trgm', 'questions', ['ask'], unique=False,
+        postgresql_using='gin', postgresql_ops={'ask': 'gin_trgm_ops'},
+    )
@@ -0,0 +1,29 @@
+"""stored image derivative status
+
+Revision ID: f3c8a2d5e719
+Revises: e8b1f6d3a924
+Create Date: 2026-10-17 10:26:03.551842
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c8a2d5e719'
+down_revision: Union[str, None] = 'e8b1f6d3a924'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('stored_images', sa.Column('derivative_status', sa.String(length=20), nullable=True))
+    op.add_column('stored_images', sa.Column('derivative_attempts', sa.Integer(), server_default='0', nullable=False))
+    op.execute("UPDATE stored_images SET derivative_status = 'ready' WHERE card_url IS NOT NULL")
+
+
+def downgrade() -> None:
+    op.drop_column('stored_images', 'derivative_attempts')
+    op.drop_column('stored_images', 'derivative_status')
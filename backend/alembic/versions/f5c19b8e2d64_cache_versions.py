@@ -0,0 +1,32 @@
+"""cache versions table
+
+Revision ID: f5c19b8e2d64
+Revises: e3a85d1f7b40
+Create Date: 2026-10-16 14:02:37.418306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5c19b8e2d64'
+down_revision: Union[str, None] = 'e3a85d1f7b40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    cache_versions = op.create_table('cache_versions',
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.bulk_insert(cache_versions, [{'name': 'topics', 'version': 0}])
+
+
+def downgrade() -> None:
+    op.drop_table('cache_versions')
@@ -1,9 +1,18 @@
 import os
-import functools
+import hashlib
+import threading
+import time
 import requests
-from jose import jwt, JWTError
+from typing import Dict, Optional
+from jose import jwk, jwt, JWTError
+from jose.backends.base import Key
+from jose.exceptions import JWKError
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from app.cache import TTLCache
+from app.config import settings
+from app.constants import JWT_ALGORITHM_RS256
+from app.logger import log_warning
 
 # Auth0 Configuration with validation
 AUTH0_DOMAIN = os.getenv("AUTH0_DOMAIN")
@@ -19,22 +28,182 @@ JWKS_URL = f"{ISSUER}.well-known/jwks.json"
 
 security = HTTPBearer()
 
+# Payloads of tokens that already passed verification, keyed by token digest
+verified_token_cache = TTLCache(maxsize=settings.TOKEN_CACHE_MAX_SIZE)
 
-@functools.lru_cache()
-def get_jwks() -> dict:
+
+def token_cache_key(token: str) -> bytes:
+    """Digest a bearer token so raw tokens are never held as cache keys."""
+    return hashlib.sha256(token.encode()).digest()
+
+
+class JWKSKeyStore:
     """
-    Fetch and cache Auth0 JWKS.
-    Raises HTTPException if unable to fetch JWKS.
+    Auth0 signing keys indexed by key ID (kid).
+
+    Keys are parsed into jose Key objects once per fetch, so verification is a
+    dict lookup instead of a scan plus re-parse. The key set is refreshed in a
+    background thread every `ttl` seconds; a token carrying an unknown kid
+    triggers a single-flight, rate-limited refetch (Auth0 key rotation). Failed
+    fetches back off exponentially and previously fetched keys keep serving,
+    so an Auth0 outage does not cost every request a network timeout.
     """
-    try:
-        response = requests.get(JWKS_URL, timeout=10)
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Unable to verify authentication"
+
+    def __init__(
+        self,
+        url: str,
+        ttl: float,
+        fetch_timeout: float,
+        min_refetch_interval: float,
+        max_backoff: float,
+    ):
+        self.url = url
+        self.ttl = ttl
+        self.fetch_timeout = fetch_timeout
+        self.min_refetch_interval = min_refetch_interval
+        self.max_backoff = max_backoff
+
+        self._keys: Dict[str, Key] = {}
+        self._fetched_at: Optional[float] = None
+        self._last_attempt: Optional[float] = None
+        self._retry_at = 0.0
+        self._failures = 0
+        self._fetch_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._refresher: Optional[threading.Thread] = None
+
+    def get_key(self, kid: str) -> Optional[Key]:
+        """
+        Return the parsed signing key for `kid`, or None if Auth0 doesn't know it.
+
+        Raises:
+            HTTPException: 503 if no keys have ever been fetched and the
+                endpoint is currently unreachable.
+        """
+        key = self._keys.get(kid)
+        if key is not None and not self._needs_lazy_refresh():
+            return key
+
+        if key is None:
+            # Cold start or key rotation: refetch, but not more often than
+            # min_refetch_interval so forged kids can't hammer Auth0.
+            self.refresh(min_interval=0 if not self._keys else self.min_refetch_interval)
+        else:
+            self.refresh(min_interval=self.ttl)
+
+        if not self._keys:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Unable to verify authentication"
+            )
+        return self._keys.get(kid)
+
+    def refresh(self, min_interval: float = 0) -> None:
+        """
+        Fetch the key set unless a fetch happened within `min_interval` seconds
+        or the store is backing off after failures.
+
+        Concurrent callers share one fetch: whoever holds the lock fetches and
+        the rest wait for it to finish, then use its result.
+        """
+        if not self._fetch_lock.acquire(blocking=False):
+            with self._fetch_lock:
+                return
+
+        try:
+            now = time.monotonic()
+            if now < self._retry_at:
+                return
+            if self._last_attempt is not None and now - self._last_attempt < min_interval:
+                return
+            self._fetch(now)
+        finally:
+            self._fetch_lock.release()
+
+    def start_background_refresh(self) -> None:
+        """Start the daemon thread that keeps the key set fresh."""
+        if self._refresher is not None and self._refresher.is_alive():
+            return
+        self._stop.clear()
+        self._refresher = threading.Thread(
+            target=self._refresh_loop,
+            name="jwks-refresh",
+            daemon=True,
         )
+        self._refresher.start()
+
+    def stop_background_refresh(self) -> None:
+        """Stop the refresh thread (used on application shutdown)."""
+        self._stop.set()
+
+    def stats(self) -> dict:
+        """Key store state for diagnostics."""
+        now = time.monotonic()
+        return {
+            "keys": len(self._keys),
+            "age_seconds": None if self._fetched_at is None else round(now - self._fetched_at, 1),
+            "consecutive_failures": self._failures,
+            "backoff_seconds": max(0.0, round(self._retry_at - now, 1)),
+        }
+
+    def _needs_lazy_refresh(self) -> bool:
+        """Keys are past their TTL and no background thread is refreshing them."""
+        if self._refresher is not None and self._refresher.is_alive():
+            return False
+        return self._fetched_at is None or time.monotonic() - self._fetched_at > self.ttl
+
+    def _next_refresh_delay(self) -> float:
+        now = time.monotonic()
+        if self._failures:
+            return max(1.0, self._retry_at - now)
+        if self._fetched_at is None:
+            return 1.0
+        return max(1.0, self._fetched_at + self.ttl - now)
+
+    def _refresh_loop(self) -> None:
+        while not self._stop.wait(self._next_refresh_delay()):
+            self.refresh(min_interval=0)
+
+    def _fetch(self, now: float) -> None:
+        self._last_attempt = now
+        try:
+            response = requests.get(self.url, timeout=self.fetch_timeout)
+            response.raise_for_status()
+            keys = self._parse(response.json())
+        except (requests.RequestException, ValueError, KeyError, JWKError) as e:
+            self._failures += 1
+            backoff = min(self.max_backoff, self.min_refetch_interval * 2 ** (self._failures - 1))
+            self._retry_at = time.monotonic() + backoff
+            log_warning(
+                f"JWKS fetch failed ({type(e).__name__}); retrying in {backoff:.0f}s, "
+                f"serving {len(self._keys)} cached key(s)"
+            )
+            return
+
+        # Swap the whole dict so readers never see a partially built key set
+        self._keys = keys
+        self._fetched_at = time.monotonic()
+        self._failures = 0
+        self._retry_at = 0.0
+
+    @staticmethod
+    def _parse(jwks: dict) -> Dict[str, Key]:
+        keys: Dict[str, Key] = {}
+        for key_data in jwks["keys"]:
+            kid = key_data.get("kid")
+            if not kid or key_data.get("use", "sig") != "sig":
+                continue
+            keys[kid] = jwk.construct(key_data, key_data.get("alg", JWT_ALGORITHM_RS256))
+        return keys
+
+
+jwks_store = JWKSKeyStore(
+    JWKS_URL,
+    ttl=settings.JWKS_CACHE_TTL_SECONDS,
+    fetch_timeout=settings.JWKS_FETCH_TIMEOUT_SECONDS,
+    min_refetch_interval=settings.JWKS_MIN_REFETCH_INTERVAL_SECONDS,
+    max_backoff=settings.JWKS_MAX_BACKOFF_SECONDS,
+)
 
 
 def get_unverified_header(token: str) -> dict:
@@ -90,12 +259,8 @@ def _verify_auth0_token(token: str, unverified_header: dict) -> dict:
             detail="Invalid Auth0 token: missing key ID"
         )
     
-    # Find matching RSA key
-    jwks = get_jwks()
-    rsa_key = next(
-        (key for key in jwks["keys"] if key["kid"] == kid),
-        None
-    )
+    # Look up the parsed RSA key by kid
+    rsa_key = jwks_store.get_key(kid)
     
     if not rsa_key:
         raise HTTPException(
@@ -137,10 +302,24 @@ def verify_token(
         HTTPException: If token is invalid, expired, or improperly signed.
     """
     token = credentials.credentials
+
+    # Warm sessions reuse the same token; skip signature verification for it
+    cache_key = token_cache_key(token)
+    payload = verified_token_cache.get(cache_key)
+    if payload is not None:
+        return payload
+
     unverified_header = get_unverified_header(token)
     
     # Route to appropriate verification based on algorithm
     if unverified_header.get("alg") == "HS256":
-        return _verify_demo_token(token)
-    
-    return _verify_auth0_token(token, unverified_header)
\ No newline at end of file
+        payload = _verify_demo_token(token)
+    else:
+        payload = _verify_auth0_token(token, unverified_header)
+
+    # Only tokens with an expiry are cached, and never past that expiry
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        verified_token_cache.set(cache_key, payload, expires_at=exp)
+
+    return payload
\ No newline at end of file
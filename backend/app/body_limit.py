@@ -0,0 +1,97 @@
+"""
+Request body size limits enforced while the body streams in.
+
+Multipart parsing reads the whole request before a handler runs, so a size
+check inside the handler comes too late: the worker has already received
+(and spooled) everything the client sent. This middleware rejects requests
+whose Content-Length is over the limit without reading them, and aborts
+chunked or mislabelled bodies as soon as the running total passes it.
+"""
+import json
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class BodyTooLarge(Exception):
+    """Raised from receive() once a body passes its limit."""
+
+
+class BodySizeLimitMiddleware:
+    """
+    Enforce per-path-prefix body limits.
+
+    Args:
+        app: ASGI app
+        limits: {path prefix: max body bytes}
+    """
+
+    def __init__(self, app: ASGIApp, limits: dict[str, int]):
+        self.app = app
+        self.limits = limits
+
+    def _limit_for(self, path: str):
+        for prefix, limit in self.limits.items():
+            if path == prefix or path.startswith(prefix.rstrip("/") + "/"):
+                return limit
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        limit = self._limit_for(scope["path"]) if scope["type"] == "http" else None
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > limit:
+            await self._reject(send, limit)
+            return
+
+        received = 0
+        exceeded = False
+        response_started = False
+
+        async def limited_receive() -> Message:
+            nonlocal received, exceeded
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    exceeded = True
+                    raise BodyTooLarge()
+            return message
+
+        async def guarded_send(message: Message) -> None:
+            nonlocal response_started
+            # Whatever the app makes of the aborted body (typically a 400
+            # "error parsing the body") is replaced by the 413 below
+            if exceeded:
+                return
+            response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:
+            # BodyTooLarge itself, or whatever the app wrapped it in
+            if not exceeded:
+                raise
+
+        if exceeded and not response_started:
+            await self._reject(send, limit)
+
+    @staticmethod
+    async def _reject(send: Send, limit: int) -> None:
+        body = json.dumps({
+            "detail": f"Request body too large: the limit is {limit // (1024 * 1024)}MB."
+        }).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"connection", b"close"),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
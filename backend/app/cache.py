@@ -0,0 +1,199 @@
+"""
+Caching primitives: an in-process LRU and pluggable shared cache backends.
+"""
+import json
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from app.config import settings
+from app.exceptions import ConfigurationError
+from app.logger import log_warning
+
+
+class TTLCache:
+    """
+    Thread-safe, size-bounded LRU cache with a per-entry expiry.
+
+    Entries expire at an absolute wall-clock deadline (seconds since the
+    epoch), so callers can pin an entry to an external expiry such as a
+    JWT's `exp` claim. Hit and miss counters are kept for diagnostics.
+    """
+
+    def __init__(self, maxsize: int, default_ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, tuple[Any, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or `default` if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        expires_at: Optional[float] = None,
+    ) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Seconds until expiry (defaults to `default_ttl`)
+            expires_at: Absolute expiry timestamp; takes precedence over `ttl`
+        """
+        if expires_at is None:
+            ttl = self.default_ttl if ttl is None else ttl
+            expires_at = None if ttl is None else time.time() + ttl
+
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove a key if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        """Size and hit/miss counters."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class CacheBackend:
+    """
+    Async key/value cache interface for values shared between workers.
+
+    Values must be JSON-serializable so they can live out of process.
+    """
+
+    async def get(self, key: str) -> Any:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        raise NotImplementedError
+
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def stats(self) -> dict:
+        return {}
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Per-process backend. Invalidations only reach the current worker, so
+    entries rely on a short TTL to bound staleness across workers.
+    """
+
+    def __init__(self, maxsize: int):
+        self._cache = TTLCache(maxsize=maxsize)
+
+    async def get(self, key: str) -> Any:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        self._cache.set(key, value, ttl=ttl)
+
+    async def delete(self, key: str) -> None:
+        self._cache.delete(key)
+
+    def stats(self) -> dict:
+        return {"backend": "memory", **self._cache.stats()}
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Redis-backed cache shared by every worker, so an invalidation in one
+    worker is seen by all. Redis errors degrade to cache misses.
+    """
+
+    def __init__(self, url: str, namespace: str):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise ConfigurationError(
+                "CACHE_REDIS_URL is set but the 'redis' package is not installed"
+            ) from e
+
+        self._client = redis.from_url(url)
+        self._namespace = namespace
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, key: str) -> str:
+        return f"questionaura:{self._namespace}:{key}"
+
+    async def get(self, key: str) -> Any:
+        try:
+            raw = await self._client.get(self._key(key))
+        except Exception as e:
+            log_warning(f"Redis cache get failed: {type(e).__name__} - {e}")
+            raw = None
+
+        if raw is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(raw)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        try:
+            await self._client.set(self._key(key), json.dumps(value), ex=max(1, math.ceil(ttl)))
+        except Exception as e:
+            log_warning(f"Redis cache set failed: {type(e).__name__} - {e}")
+
+    async def delete(self, key: str) -> None:
+        try:
+            await self._client.delete(self._key(key))
+        except Exception as e:
+            log_warning(f"Redis cache delete failed: {type(e).__name__} - {e}")
+
+    def stats(self) -> dict:
+        return {"backend": "redis", "hits": self.hits, "misses": self.misses}
+
+
+def create_cache_backend(namespace: str, maxsize: int) -> CacheBackend:
+    """Shared Redis backend when CACHE_REDIS_URL is configured, else in-process."""
+    if settings.CACHE_REDIS_URL:
+        return RedisCacheBackend(settings.CACHE_REDIS_URL, namespace)
+    return MemoryCacheBackend(maxsize)
@@ -0,0 +1,35 @@
+"""
+Version stamps for caches that outlive a transaction.
+
+A writer bumps a named row in `cache_versions` in the same transaction as
+the data it changes, so the stamp commits (and replicates) together with
+that data. Readers compare or key their cached copies by the stamp, which
+makes an invalidation visible to every worker without a shared bus.
+"""
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.cache_version import CacheVersion
+
+
+async def read_cache_version(db: AsyncSession, name: str) -> int:
+    """The current stamp for `name`; 0 until it is first bumped."""
+    version = await db.scalar(
+        select(CacheVersion.version).where(CacheVersion.name == name)
+    )
+    return version or 0
+
+
+async def bump_cache_version(db: AsyncSession, name: str) -> None:
+    """
+    Mark every cached copy stamped with `name` stale.
+
+    Call inside the transaction that changes the data, before commit.
+    """
+    result = await db.execute(
+        update(CacheVersion)
+        .where(CacheVersion.name == name)
+        .values(version=CacheVersion.version + 1)
+    )
+    if result.rowcount == 0:
+        await db.execute(insert(CacheVersion).values(name=name, version=1))
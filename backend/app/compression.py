@@ -0,0 +1,205 @@
+"""
+Response compression middleware.
+
+Compresses JSON and text responses with brotli (when the `brotli` package is
+installed) or gzip, depending on the client's Accept-Encoding. Responses
+smaller than COMPRESSION_MIN_SIZE and paths under COMPRESSION_EXCLUDED_PATHS
+are sent as-is.
+
+Responses that carry an ETag keep their compressed bytes in an LRU keyed by
+URL, ETag and encoding, so hot cacheable payloads (the topics catalog,
+popular question pages) are compressed once rather than on every hit.
+"""
+import gzip
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.cache import TTLCache
+from app.config import settings
+
+try:
+    import brotli
+except ImportError:  # optional; gzip only
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+
+def _accepted_encodings(header: str) -> set[str]:
+    """Codings from Accept-Encoding, minus any the client refused with q=0."""
+    accepted = set()
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        quality = params.strip()
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        if coding:
+            accepted.add(coding)
+    return accepted
+
+
+def _weaken(etag: str) -> str:
+    # Compressed bytes are a different representation; like nginx, weaken the
+    # validator instead of claiming byte equality. If-None-Match still matches
+    # because it uses weak comparison.
+    return etag if etag.startswith("W/") else f"W/{etag}"
+
+
+class CompressionStats:
+    def __init__(self):
+        self.compressed = 0
+        self.cache_hits = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "compressed": self.compressed,
+            "cache_hits": self.cache_hits,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "ratio": round(self.bytes_out / self.bytes_in, 4) if self.bytes_in else None,
+        }
+
+
+compression_stats = CompressionStats()
+
+
+class CompressionMiddleware:
+    """ASGI middleware that compresses single-body responses."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 5,
+        use_brotli: bool = True,
+        excluded_paths: tuple[str, ...] = (),
+        cache_size: int = 256,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.use_brotli = use_brotli and brotli is not None
+        self.excluded_paths = excluded_paths
+        self.cache = TTLCache(maxsize=cache_size)
+        self.stats = compression_stats
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self._excluded(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        encoding = self._choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, passthrough
+
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            if start_message is None:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            if message.get("more_body", False) or not self._should_compress(start_message, body):
+                # Streaming or ineligible: send untouched
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            compressed = self._compress(scope, start_message, body, encoding)
+            headers = MutableHeaders(raw=start_message["headers"])
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            if "etag" in headers:
+                headers["ETag"] = _weaken(headers["etag"])
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed, "more_body": False})
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _excluded(self, path: str) -> bool:
+        return any(path == prefix or path.startswith(prefix.rstrip("/") + "/") for prefix in self.excluded_paths)
+
+    def _choose_encoding(self, accept_encoding: str) -> Optional[str]:
+        accepted = _accepted_encodings(accept_encoding)
+        if self.use_brotli and "br" in accepted:
+            return "br"
+        if "gzip" in accepted:
+            return "gzip"
+        return None
+
+    def _should_compress(self, start_message: Message, body: bytes) -> bool:
+        if start_message["status"] != 200 or len(body) < self.minimum_size:
+            return False
+        headers = Headers(raw=start_message["headers"])
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "")
+        return content_type.startswith(COMPRESSIBLE_TYPES)
+
+    def _compress(self, scope: Scope, start_message: Message, body: bytes, encoding: str) -> bytes:
+        etag = Headers(raw=start_message["headers"]).get("etag")
+        cache_key = None
+        if etag:
+            # The ETag identifies the content for this URL only (list ETags
+            # don't encode every query option), so key on both
+            cache_key = (scope["path"], scope.get("query_string", b""), etag, encoding)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                self.stats.cache_hits += 1
+                return cached
+
+        if encoding == "br":
+            compressed = brotli.compress(body, quality=self.brotli_quality)
+        else:
+            compressed = gzip.compress(body, compresslevel=self.gzip_level)
+
+        self.stats.compressed += 1
+        self.stats.bytes_in += len(body)
+        self.stats.bytes_out += len(compressed)
+        if cache_key is not None:
+            self.cache.set(cache_key, compressed)
+        return compressed
+
+
+def compression_options() -> dict:
+    """CompressionMiddleware keyword arguments from settings."""
+    return {
+        "minimum_size": settings.COMPRESSION_MIN_SIZE,
+        "gzip_level": settings.COMPRESSION_GZIP_LEVEL,
+        "brotli_quality": settings.COMPRESSION_BROTLI_QUALITY,
+        "use_brotli": settings.COMPRESSION_BROTLI,
+        "excluded_paths": tuple(settings.compression_excluded_paths_list),
+        "cache_size": settings.COMPRESSION_CACHE_SIZE,
+    }
@@ -6,7 +6,7 @@ NEVER use os.getenv() outside this file.
 """
 from pydantic_settings import BaseSettings
 from pydantic import Field, field_validator
-from typing import Optional
+from typing import Literal, Optional
 
 
 class Settings(BaseSettings):
@@ -24,6 +24,58 @@ class Settings(BaseSettings):
         description="PostgreSQL database URL"
     )
     
+    DATABASE_ASYNC: bool = Field(
+        default=True,
+        description="Use the async engine (asyncpg) instead of running the sync driver in a threadpool"
+    )
+    
+    # Read replicas - OPTIONAL (all traffic goes to DATABASE_URL if not configured)
+    DATABASE_REPLICA_URLS: Optional[str] = Field(
+        None,
+        description="Comma-separated database URLs of read replicas used by read-only endpoints"
+    )
+    
+    READ_YOUR_WRITES_SECONDS: float = Field(
+        default=5.0,
+        description="After a client writes, its reads go to the primary for this many seconds"
+    )
+    
+    READ_YOUR_WRITES_MAX_CLIENTS: int = Field(
+        default=10000,
+        description="Maximum number of recently writing clients tracked per worker for read-your-writes"
+    )
+    
+    # Connection pool
+    DB_POOL_SIZE: int = Field(
+        default=5,
+        description="Connections kept open in the pool"
+    )
+    
+    DB_MAX_OVERFLOW: int = Field(
+        default=10,
+        description="Extra connections allowed beyond DB_POOL_SIZE under load"
+    )
+    
+    DB_POOL_TIMEOUT: float = Field(
+        default=30.0,
+        description="Seconds to wait for a free connection before failing"
+    )
+    
+    DB_POOL_RECYCLE: int = Field(
+        default=1800,
+        description="Replace connections older than this many seconds (-1 disables)"
+    )
+    
+    DB_POOL_PRE_PING: bool = Field(
+        default=True,
+        description="Test connections on checkout and transparently replace dead ones"
+    )
+    
+    DB_PGBOUNCER_MODE: bool = Field(
+        default=False,
+        description="Disable server-side prepared statement caching for PgBouncer transaction pooling"
+    )
+    
     # Auth0 - REQUIRED, no defaults
     AUTH0_DOMAIN: str = Field(
         ...,
@@ -35,6 +87,176 @@ class Settings(BaseSettings):
         description="Auth0 API audience identifier"
     )
     
+    # JWKS key cache
+    JWKS_CACHE_TTL_SECONDS: int = Field(
+        default=3600,
+        description="How long fetched Auth0 signing keys are used before a background refresh"
+    )
+    
+    JWKS_FETCH_TIMEOUT_SECONDS: float = Field(
+        default=10.0,
+        description="Timeout for a single JWKS fetch"
+    )
+    
+    JWKS_MIN_REFETCH_INTERVAL_SECONDS: int = Field(
+        default=30,
+        description="Minimum gap between refetches triggered by tokens with an unknown key ID"
+    )
+    
+    JWKS_MAX_BACKOFF_SECONDS: int = Field(
+        default=300,
+        description="Upper bound on the retry delay after consecutive JWKS fetch failures"
+    )
+    
+    TOKEN_CACHE_MAX_SIZE: int = Field(
+        default=10000,
+        description="Maximum number of verified token payloads kept in memory"
+    )
+    
+    # Shared cache - OPTIONAL (per-process caches are used if not configured)
+    CACHE_REDIS_URL: Optional[str] = Field(
+        None,
+        description="Redis URL for caches shared across workers (requires the 'redis' package)"
+    )
+    
+    USER_CACHE_TTL_SECONDS: int = Field(
+        default=30,
+        description="How long a resolved user is reused before get_current_user queries again"
+    )
+    
+    USER_CACHE_MAX_SIZE: int = Field(
+        default=10000,
+        description="Maximum number of users kept in the in-process user cache"
+    )
+    
+    # Topics catalog
+    TOPIC_CATALOG_CHECK_INTERVAL_SECONDS: float = Field(
+        default=5.0,
+        description="How often each worker checks whether another worker changed topics"
+    )
+    
+    # Question list counts
+    QUESTIONS_COUNT_STRATEGY: Literal["exact", "cached", "estimated", "none"] = Field(
+        default="exact",
+        description="Default total-count strategy for GET /questions (clients may override per request)"
+    )
+    
+    QUESTION_COUNT_CACHE_TTL_SECONDS: int = Field(
+        default=60,
+        description="How long a cached question count is reused before it is recomputed"
+    )
+    
+    # HTTP caching (Cache-Control sent with ETags on read endpoints)
+    CACHE_CONTROL_TOPICS: str = Field(
+        default="public, max-age=300",
+        description="Cache-Control for GET /topics and GET /topics/{id}"
+    )
+    
+    CACHE_CONTROL_QUESTIONS: str = Field(
+        default="public, no-cache",
+        description="Cache-Control for question lists and question detail endpoints"
+    )
+    
+    CACHE_CONTROL_ANSWERS: str = Field(
+        default="public, no-cache",
+        description="Cache-Control for answer lists and answer detail endpoints"
+    )
+    
+    # Response compression
+    COMPRESSION_MIN_SIZE: int = Field(
+        default=1024,
+        description="Responses smaller than this many bytes are sent uncompressed"
+    )
+    
+    COMPRESSION_GZIP_LEVEL: int = Field(
+        default=6,
+        description="gzip compression level (1-9)"
+    )
+    
+    COMPRESSION_BROTLI: bool = Field(
+        default=True,
+        description="Prefer brotli for clients that accept it (requires the 'brotli' package)"
+    )
+    
+    COMPRESSION_BROTLI_QUALITY: int = Field(
+        default=5,
+        description="brotli quality (0-11)"
+    )
+    
+    COMPRESSION_EXCLUDED_PATHS: str = Field(
+        default="/upload",
+        description="Comma-separated path prefixes that are never compressed"
+    )
+    
+    COMPRESSION_CACHE_SIZE: int = Field(
+        default=256,
+        description="Compressed bodies of ETag-bearing responses kept for reuse"
+    )
+    
+    # Image storage
+    STORAGE_BACKEND: Literal["cloudinary", "local"] = Field(
+        default="cloudinary",
+        description="Where uploaded images are stored"
+    )
+    
+    STORAGE_LOCAL_DIR: str = Field(
+        default="media",
+        description="Directory for the local storage backend"
+    )
+    
+    STORAGE_LOCAL_BASE_URL: str = Field(
+        default="http://localhost:8000/media",
+        description="Public URL prefix for files in STORAGE_LOCAL_DIR (served at /media)"
+    )
+    
+    # Upload pool
+    UPLOAD_POOL_WORKERS: int = Field(
+        default=4,
+        description="Uploads to the storage backend that run at once per worker"
+    )
+    
+    UPLOAD_POOL_MAX_QUEUE: int = Field(
+        default=8,
+        description="Uploads allowed to wait for a free slot before new ones get 503"
+    )
+    
+    UPLOAD_RETRY_AFTER_SECONDS: int = Field(
+        default=5,
+        description="Retry-After sent with 503 when the upload pool is saturated"
+    )
+    
+    # Image derivatives
+    IMAGE_DERIVATIVE_WORKERS: int = Field(
+        default=2,
+        description="Processes that render resized WebP derivatives of uploads"
+    )
+    
+    IMAGE_DERIVATIVE_MAX_PENDING: int = Field(
+        default=32,
+        description="Derivative jobs allowed to wait; uploads beyond this skip derivatives"
+    )
+    
+    IMAGE_LIST_VARIANT: Literal["thumb", "card", "full", "original"] = Field(
+        default="card",
+        description="Image variant list endpoints return in image_url by default"
+    )
+    
+    # Background deletes
+    TOPIC_DELETE_INLINE_MAX_ROWS: int = Field(
+        default=2000,
+        description="Topics with more questions and answers (together) than this are deleted by a background job"
+    )
+    
+    DELETE_JOB_BATCH_SIZE: int = Field(
+        default=1000,
+        description="Rows removed per transaction by background delete jobs"
+    )
+    
+    JOB_STALE_AFTER_SECONDS: int = Field(
+        default=300,
+        description="An unfinished job whose progress hasn't moved for this long is treated as abandoned (must exceed the slowest batch)"
+    )
+    
     # Demo JWT - REQUIRED, no default
     DEMO_JWT_SECRET: str = Field(
         ...,
@@ -82,6 +304,18 @@ class Settings(BaseSettings):
             self.CLOUDINARY_API_SECRET
         ])
     
+    @property
+    def database_replica_urls_list(self) -> list[str]:
+        """Parse replica URLs from comma-separated string."""
+        if not self.DATABASE_REPLICA_URLS:
+            return []
+        return [url.strip() for url in self.DATABASE_REPLICA_URLS.split(",") if url.strip()]
+    
+    @property
+    def compression_excluded_paths_list(self) -> list[str]:
+        """Parse excluded path prefixes from comma-separated string."""
+        return [path.strip() for path in self.COMPRESSION_EXCLUDED_PATHS.split(",") if path.strip()]
+    
     @property
     def cors_origins_list(self) -> list[str]:
         """Parse CORS origins from comma-separated string."""
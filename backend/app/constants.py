@@ -16,11 +16,41 @@ ALLOWED_IMAGE_TYPES = {
     "image/webp"
 }
 
+# Streaming uploads
+IMAGE_SNIFF_BYTES = 12  # Enough to identify JPEG, PNG, GIF and WebP signatures
+UPLOAD_HASH_CHUNK_SIZE = 64 * 1024
+# Whole request body limit for /upload: the file plus multipart framing
+UPLOAD_MAX_BODY_BYTES = MAX_FILE_SIZE_BYTES + 64 * 1024
+
+# Image Derivatives (WebP; longest edge in pixels, never upscaled)
+IMAGE_DERIVATIVE_SIZES = {
+    "thumb": 160,
+    "card": 640,
+    "full": 1600,
+}
+IMAGE_DERIVATIVE_QUALITY = 80
+IMAGE_DERIVATIVE_CONTENT_TYPE = "image/webp"
+IMAGE_DERIVATIVE_MAX_ATTEMPTS = 3  # Failed renders retried on re-upload until this many
+
 # JWT Token Settings
 DEMO_JWT_EXPIRATION_HOURS = 24
 JWT_ALGORITHM_HS256 = "HS256"
 JWT_ALGORITHM_RS256 = "RS256"
 
+# Full-Text Search
+SEARCH_TEXT_CONFIG = "english"  # Must match the generated tsvector columns
+SEARCH_ANSWER_RANK_WEIGHT = 0.5  # Answer matches count for less than question matches
+SEARCH_SNIPPETS_PER_QUESTION = 3
+
+# Search Suggestions
+SUGGEST_MIN_QUESTION_TERM_LENGTH = 3  # pg_trgm can't use its index for shorter terms
+SUGGEST_TITLE_LENGTH = 120
+SUGGEST_QUESTION_CANDIDATES = 200  # ILIKE matches ranked per keystroke
+
+# Question List Previews (GET /questions?preview=N)
+QUESTION_PREVIEW_MIN_LENGTH = 20
+QUESTION_PREVIEW_MAX_LENGTH = 2000
+
 # Rate Limiting
 UPLOAD_RATE_LIMIT = "5/minute"
 API_RATE_LIMIT_GENERAL = "100/minute"
@@ -1,39 +1,321 @@
-import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+import hashlib
+import random
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+from uuid import uuid4
+from fastapi import Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+from sqlalchemy.sql.dml import UpdateBase
+from starlette.concurrency import run_in_threadpool
 from dotenv import load_dotenv
 
+from app.cache import TTLCache, create_cache_backend
+from app.config import settings
+from app.pool_metrics import InstrumentedAsyncAdaptedQueuePool, InstrumentedQueuePool
+
 load_dotenv()
 
-DATABASE_URL = os.getenv(
-    "DATABASE_URL",
-    "postgresql://localhost/questionaura_dev"
-)
+DATABASE_URL = settings.DATABASE_URL
 
 # Only log SQL in development mode
-ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
+ENVIRONMENT = settings.ENVIRONMENT
+
+# Async driver to swap in for each sync backend when DATABASE_ASYNC is on
+ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+}
+
+
+def to_async_url(url: str) -> str:
+    """Rewrite a sync database URL to use the matching async driver."""
+    url_obj = make_url(url)
+    backend = url_obj.get_backend_name()
+    driver = ASYNC_DRIVERS.get(backend)
+    if driver is None:
+        raise ValueError(f"No async driver configured for '{backend}' databases")
+    return url_obj.set(drivername=f"{backend}+{driver}").render_as_string(hide_password=False)
+
+
+def pool_options() -> dict:
+    """Pool sizing and health settings shared by every engine."""
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+def async_connect_args(url: str) -> dict:
+    """
+    Driver options for async engines.
+
+    PgBouncer in transaction mode hands each transaction a different server
+    connection, so prepared statements cached on one connection don't exist
+    on the next. PgBouncer mode turns off asyncpg's statement caches and
+    gives every prepared statement a unique name.
+    """
+    if not settings.DB_PGBOUNCER_MODE or make_url(url).get_backend_name() != "postgresql":
+        return {}
+    return {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+    }
+
+
+class RoutingSession(Session):
+    """
+    Session that can send reads to a replica.
+
+    Sessions flagged with `info["use_replica"]` read from a randomly chosen
+    replica until they write; flushes and DML always go to the primary, and
+    once a session has written every later statement does too, so a handler
+    always reads its own writes. The engines come from the session's info,
+    set by the sessionmaker.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        is_write = self._flushing or isinstance(clause, UpdateBase)
+        if is_write:
+            self.info["wrote"] = True
+
+        replicas = self.info.get("replicas")
+        if replicas and self.info.get("use_replica") and not self.info.get("wrote"):
+            return random.choice(replicas)
+        return self.info["primary"]
+
+
+def _create_engine(url: str):
+    return create_engine(
+        url,
+        echo=ENVIRONMENT == "development",
+        poolclass=InstrumentedQueuePool,
+        **pool_options(),
+    )
 
-engine = create_engine(
-    DATABASE_URL,
-    echo=ENVIRONMENT == "development",
-)
 
+def _create_async_engine(url: str):
+    return create_async_engine(
+        to_async_url(url),
+        echo=ENVIRONMENT == "development",
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        connect_args=async_connect_args(url),
+        **pool_options(),
+    )
+
+
+engine = _create_engine(DATABASE_URL)
+replica_engines = [_create_engine(url) for url in settings.database_replica_urls_list]
+
+# Plain primary-bound sessions for scripts (seeding, maintenance)
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
     bind=engine,
 )
 
+RoutingSessionLocal = sessionmaker(
+    class_=RoutingSession,
+    autocommit=False,
+    autoflush=False,
+    info={"primary": engine, "replicas": replica_engines},
+)
+
+async_engine = None
+async_replica_engines = []
+AsyncSessionLocal = None
+
+if settings.DATABASE_ASYNC:
+    async_engine = _create_async_engine(DATABASE_URL)
+    async_replica_engines = [
+        _create_async_engine(url) for url in settings.database_replica_urls_list
+    ]
+
+    AsyncSessionLocal = async_sessionmaker(
+        sync_session_class=RoutingSession,
+        autoflush=False,
+        expire_on_commit=False,
+        info={
+            "primary": async_engine.sync_engine,
+            "replicas": [eng.sync_engine for eng in async_replica_engines],
+        },
+    )
+
 Base = declarative_base()
 
+# Client key -> True while that client's recent write may not have reached
+# the replicas yet. Marked synchronously on commit, so the write is visible
+# to this worker before the response goes out.
+recent_writers = TTLCache(
+    maxsize=settings.READ_YOUR_WRITES_MAX_CLIENTS,
+    default_ttl=settings.READ_YOUR_WRITES_SECONDS,
+)
+
+# Also published to Redis when configured, so other workers see it too
+shared_recent_writers = (
+    create_cache_backend("recent_writes", maxsize=settings.READ_YOUR_WRITES_MAX_CLIENTS)
+    if settings.CACHE_REDIS_URL
+    else None
+)
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _remember_write(session: Session) -> None:
+    key = session.info.get("client_key")
+    if session.info.get("wrote") and key:
+        recent_writers.set(key, True)
+        session.info["committed_write"] = True
+
+
+def client_key(request: Request) -> Optional[str]:
+    """Stable per-client key for read-your-writes tracking (the bearer token digest)."""
+    authorization = request.headers.get("authorization")
+    if not authorization:
+        return None
+    return hashlib.sha256(authorization.encode()).hexdigest()
+
+
+async def wrote_recently(key: Optional[str]) -> bool:
+    """Whether this client committed a write within READ_YOUR_WRITES_SECONDS."""
+    if key is None:
+        return False
+    if recent_writers.get(key):
+        return True
+    if shared_recent_writers is not None:
+        return bool(await shared_recent_writers.get(key))
+    return False
+
+
+def serving_engines() -> dict:
+    """Engines that serve requests in the current mode, by name."""
+    if async_engine is not None:
+        primary, replicas = async_engine.sync_engine, [eng.sync_engine for eng in async_replica_engines]
+    else:
+        primary, replicas = engine, replica_engines
+
+    engines = {"primary": primary}
+    for index, replica in enumerate(replicas):
+        engines[f"replica_{index}"] = replica
+    return engines
+
+
+def pool_status() -> dict:
+    """Occupancy and checkout metrics for each serving engine's pool."""
+    return {name: eng.pool.status_dict() for name, eng in serving_engines().items()}
+
+
+class ThreadedSession:
+    """
+    AsyncSession-compatible facade over a synchronous Session.
+
+    Used when DATABASE_ASYNC is off so routers can be written once against the
+    AsyncSession API. Every call that may touch the database runs in the
+    threadpool, so a slow query never blocks the event loop.
+    """
+
+    def __init__(self, sync_session: Session):
+        self.sync_session = sync_session
+
+    @property
+    def info(self) -> dict:
+        return self.sync_session.info
+
+    def add(self, instance: Any) -> None:
+        self.sync_session.add(instance)
+
+    def add_all(self, instances: Any) -> None:
+        self.sync_session.add_all(instances)
+
+    async def execute(self, statement: Any, *args: Any, **kwargs: Any) -> Any:
+        return await run_in_threadpool(self.sync_session.execute, statement, *args, **kwargs)
+
+    async def scalar(self, statement: Any, *args: Any, **kwargs: Any) -> Any:
+        return await run_in_threadpool(self.sync_session.scalar, statement, *args, **kwargs)
+
+    async def scalars(self, statement: Any, *args: Any, **kwargs: Any) -> Any:
+        return await run_in_threadpool(self.sync_session.scalars, statement, *args, **kwargs)
+
+    async def get(self, entity: Any, ident: Any, **kwargs: Any) -> Any:
+        return await run_in_threadpool(self.sync_session.get, entity, ident, **kwargs)
+
+    async def delete(self, instance: Any) -> None:
+        await run_in_threadpool(self.sync_session.delete, instance)
+
+    async def flush(self) -> None:
+        await run_in_threadpool(self.sync_session.flush)
+
+    async def refresh(self, instance: Any, attribute_names: Any = None) -> None:
+        await run_in_threadpool(self.sync_session.refresh, instance, attribute_names)
+
+    async def commit(self) -> None:
+        await run_in_threadpool(self.sync_session.commit)
+
+    async def rollback(self) -> None:
+        await run_in_threadpool(self.sync_session.rollback)
+
+    async def close(self) -> None:
+        await run_in_threadpool(self.sync_session.close)
+
+
+@asynccontextmanager
+async def session_scope(use_replica: bool = False, client_key: Optional[str] = None) -> AsyncIterator[AsyncSession]:
+    """
+    Open a request-style session outside of dependency injection (startup
+    hooks, background jobs). Closed on exit.
+    """
+    if AsyncSessionLocal is not None:
+        db = AsyncSessionLocal()
+    else:
+        db = ThreadedSession(RoutingSessionLocal())
+    db.info["client_key"] = client_key
+    db.info["use_replica"] = use_replica
+
+    try:
+        yield db
+    finally:
+        await db.close()
+        if db.info.get("committed_write") and client_key and shared_recent_writers is not None:
+            await shared_recent_writers.set(client_key, True, ttl=settings.READ_YOUR_WRITES_SECONDS)
+
+
 # Dependency to get database session
-def get_db():
+async def get_db(request: Request) -> AsyncIterator[AsyncSession]:
     """
     Creates a new database session for each request.
     Automatically closes the session after the request is done.
+
+    Yields an AsyncSession when DATABASE_ASYNC is enabled, otherwise a
+    ThreadedSession exposing the same awaitable API. Every statement goes to
+    the primary.
     """
-    db = SessionLocal()
-    try:
+    async with session_scope(use_replica=False, client_key=client_key(request)) as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
+
+
+async def get_read_db(request: Request) -> AsyncIterator[AsyncSession]:
+    """
+    Session for read-only handlers.
+
+    Reads go to a replica when DATABASE_REPLICA_URLS is set, unless the
+    client wrote within READ_YOUR_WRITES_SECONDS (replication lag could hide
+    the write) or the session itself writes.
+    """
+    key = client_key(request)
+    use_replica = bool(replica_engines) and not await wrote_recently(key)
+    async with session_scope(use_replica=use_replica, client_key=key) as db:
+        yield db
+
+
+async def dispose_engines() -> None:
+    """Close all pooled connections. Called on application shutdown."""
+    for async_eng in [async_engine, *async_replica_engines]:
+        if async_eng is not None:
+            await async_eng.dispose()
+    for sync_eng in [engine, *replica_engines]:
+        await run_in_threadpool(sync_eng.dispose)
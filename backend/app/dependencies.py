@@ -1,35 +1,98 @@
+from datetime import datetime
+from typing import Optional
 from fastapi import Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from app.cache import create_cache_backend
+from app.config import settings
 from app.database import get_db
 from app.auth import verify_token
 from app.models.user import User
 
+# auth0_id -> user row snapshot, so authenticated requests skip the user lookup
+user_cache = create_cache_backend("users", maxsize=settings.USER_CACHE_MAX_SIZE)
+
+USER_SNAPSHOT_FIELDS = ("id", "auth0_id", "email", "first_name", "last_name")
+USER_SNAPSHOT_TIMESTAMPS = ("created_at", "updated_at")
+
+
+def snapshot_user(user: User) -> dict:
+    """JSON-serializable copy of the user columns."""
+    snapshot = {field: getattr(user, field) for field in USER_SNAPSHOT_FIELDS}
+    for field in USER_SNAPSHOT_TIMESTAMPS:
+        snapshot[field] = getattr(user, field).isoformat()
+    return snapshot
+
+
+def _user_from_snapshot(snapshot: dict) -> User:
+    """
+    Rebuild a detached User from a snapshot.
+
+    The instance carries its identity key, so it can be attached to a
+    session (e.g. assigned to a relationship) without being re-inserted.
+    """
+    user = User(
+        **{field: snapshot[field] for field in USER_SNAPSHOT_FIELDS},
+        **{field: datetime.fromisoformat(snapshot[field]) for field in USER_SNAPSHOT_TIMESTAMPS},
+    )
+    make_transient_to_detached(user)
+    return user
+
+
+async def invalidate_cached_user(auth0_id: str) -> None:
+    """Drop a user's cached row. Call after any write to that user."""
+    await user_cache.delete(auth0_id)
+
+
+async def get_cached_user(auth0_id: str) -> Optional[User]:
+    """The cached user row as a detached User, or None on a miss."""
+    snapshot: Optional[dict] = await user_cache.get(auth0_id)
+    if snapshot is None:
+        return None
+    return _user_from_snapshot(snapshot)
+
+
+async def remember_user(snapshot: dict) -> User:
+    """
+    Cache a committed user row snapshot (see snapshot_user) and return it
+    as a detached User. Writers call this instead of invalidating when
+    they already hold the new row.
+    """
+    await user_cache.set(snapshot["auth0_id"], snapshot, ttl=settings.USER_CACHE_TTL_SECONDS)
+    return _user_from_snapshot(snapshot)
+
 
 async def get_current_user(
     payload: dict = Depends(verify_token),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> User:
     """
     Get current authenticated user from database.
-    
+
     Args:
         payload: JWT payload from Auth0 (contains 'sub' claim)
         db: Database session
-    
+
     Returns:
         User: Authenticated user object
-    
+
     Raises:
         HTTPException: 404 if user doesn't exist in database
     """
     auth0_id = payload["sub"]
-    
-    user = db.query(User).filter(User.auth0_id == auth0_id).first()
-    
+
+    cached = await get_cached_user(auth0_id)
+    if cached is not None:
+        return cached
+
+    user = await db.scalar(select(User).where(User.auth0_id == auth0_id))
+
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found. Please sync your account."
         )
-    
+
+    await user_cache.set(auth0_id, snapshot_user(user), ttl=settings.USER_CACHE_TTL_SECONDS)
     return user
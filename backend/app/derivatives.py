@@ -0,0 +1,258 @@
+"""
+Background pipeline for resized image derivatives.
+
+Feed cards render question and answer images at a few hundred pixels, so
+serving the original upload wastes megabytes per page. After an upload is
+stored, its bytes are rendered into WebP variants (see IMAGE_DERIVATIVE_SIZES)
+on a process pool, since resizing and encoding are CPU-bound and would hold
+the GIL in a thread. The variants are stored next to the original and their
+URLs recorded on the stored_images row and on every question and answer that
+uses the image (found through their partial image_url indexes). None of
+this happens on the request path: the upload response returns the original
+URL immediately, and list endpoints fall back to it until the variants
+exist. Variant files are saved through the bounded upload pool, like the
+originals; when it is saturated the render is dropped and retried on the
+next upload of the same bytes.
+
+Each upload's outcome is kept in stored_images.derivative_status, so
+re-uploading the same bytes only renders again when no render has finished
+yet or a failed one has attempts left; images that can't have derivatives
+(animated) are never retried. An upload whose render is still running isn't
+scheduled a second time.
+"""
+import asyncio
+import io
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.constants import IMAGE_DERIVATIVE_CONTENT_TYPE, IMAGE_DERIVATIVE_MAX_ATTEMPTS
+from app.database import session_scope
+from app.imaging import render_derivatives
+from app.logger import log_error, log_warning
+from app.models.answer import Answer
+from app.models.question import Question
+from app.models.stored_image import StoredImage
+from app.storage import StorageBackend
+from app.upload_pool import UploadPoolSaturated, upload_pool
+
+# Question/Answer column for each variant
+VARIANT_COLUMNS = {
+    "thumb": "image_thumb_url",
+    "card": "image_card_url",
+    "full": "image_full_url",
+}
+
+
+async def image_variant_columns(db: AsyncSession, image_url: Optional[str]) -> dict:
+    """
+    Variant column values for a question or answer whose image is
+    `image_url`: the stored derivatives if that upload has them, else None
+    for each (external URLs, or derivatives still rendering).
+
+    Call in the transaction that writes the question or answer. The upload's
+    row is share-locked until commit, so a render finishing meanwhile waits
+    for the write and its UPDATE then sees the new row; without the lock
+    the row could commit with NULL variants after the render had passed it.
+    """
+    columns = dict.fromkeys(VARIANT_COLUMNS.values())
+    if not image_url:
+        return columns
+
+    # Not autoflushed: pending changes would lock the question or answer row
+    # first, the opposite order to a render's
+    with db.no_autoflush:
+        rows = (await db.execute(
+            select(StoredImage.thumb_url, StoredImage.card_url, StoredImage.full_url)
+            .where(StoredImage.url == image_url)
+            .with_for_update(read=True)
+        )).all()
+    row = next((row for row in rows if row.card_url is not None), None)
+    if row is not None:
+        columns.update({
+            "image_thumb_url": row.thumb_url,
+            "image_card_url": row.card_url,
+            "image_full_url": row.full_url,
+        })
+    return columns
+
+
+def needs_derivatives(image: StoredImage) -> bool:
+    """Whether a re-upload of `image` should render its derivatives (again)."""
+    if image.derivative_status in ("ready", "unsupported"):
+        return False
+    return image.derivative_attempts < IMAGE_DERIVATIVE_MAX_ATTEMPTS
+
+
+async def record_derivatives(backend: str, digest: str, source_url: str, urls: dict[str, str]) -> None:
+    """Store variant URLs on the upload's row and on everything already using it."""
+    columns = {VARIANT_COLUMNS[name]: url for name, url in urls.items()}
+    async with session_scope() as db:
+        await db.execute(
+            update(StoredImage)
+            .where(StoredImage.backend == backend, StoredImage.sha256 == digest)
+            .values(
+                thumb_url=urls.get("thumb"),
+                card_url=urls.get("card"),
+                full_url=urls.get("full"),
+                derivative_status="ready",
+            )
+        )
+        # Index scans on ix_questions_image_url / ix_answers_image_url;
+        # updated_at moves too, so cached list pages revalidate
+        for model in (Question, Answer):
+            await db.execute(
+                update(model).where(model.image_url == source_url).values(**columns)
+            )
+        await db.commit()
+
+
+async def record_derivative_outcome(backend: str, digest: str, outcome: str) -> None:
+    """Mark an upload's render "unsupported" or "failed" (counting the attempt)."""
+    values = {"derivative_status": outcome}
+    if outcome == "failed":
+        values["derivative_attempts"] = StoredImage.derivative_attempts + 1
+    async with session_scope() as db:
+        await db.execute(
+            update(StoredImage)
+            .where(StoredImage.backend == backend, StoredImage.sha256 == digest)
+            .values(**values)
+        )
+        await db.commit()
+
+
+class DerivativePipeline:
+    """
+    Renders derivatives on a process pool and stores them.
+
+    At most `max_pending` jobs (each holding its upload's bytes) are queued
+    or running; uploads beyond that skip derivatives and keep serving the
+    original, as do renders whose files the saturated upload pool rejects.
+    Only one job per stored upload runs at a time.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._tasks: set[asyncio.Task] = set()
+        # (backend, digest) of every job queued or running
+        self._pending: set[tuple[str, str]] = set()
+        self.scheduled = 0
+        self.duplicates = 0
+        self.generated = 0
+        self.unsupported = 0
+        self.skipped = 0
+        self.failed = 0
+        self._render_time_total = 0.0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # Created on first use so importing the app (scripts, Alembic) never
+        # starts processes. Spawned, not forked: the parent has an event loop
+        # and open connections a fork would copy.
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def is_pending(self, backend: str, digest: str) -> bool:
+        """Whether a job for this stored upload is queued or running."""
+        return (backend, digest) in self._pending
+
+    def schedule(self, data: bytes, digest: str, source_url: str, storage: StorageBackend) -> bool:
+        """
+        Start rendering derivatives of an upload in the background.
+
+        Returns:
+            False if the upload already has a job, or the pipeline is at
+            capacity and the upload was skipped
+        """
+        key = (storage.name, digest)
+        if key in self._pending:
+            self.duplicates += 1
+            return False
+
+        if len(self._tasks) >= self.max_pending:
+            self.skipped += 1
+            log_warning(f"Image derivative queue full; serving the original for {source_url}")
+            return False
+
+        self.scheduled += 1
+        self._pending.add(key)
+        task = asyncio.get_running_loop().create_task(self._run(data, digest, source_url, storage))
+        self._tasks.add(task)
+
+        def finished(task: asyncio.Task) -> None:
+            self._tasks.discard(task)
+            self._pending.discard(key)
+
+        task.add_done_callback(finished)
+        return True
+
+    async def _run(self, data: bytes, digest: str, source_url: str, storage: StorageBackend) -> None:
+        try:
+            started_at = time.perf_counter()
+            rendered = await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), render_derivatives, data
+            )
+            self._render_time_total += time.perf_counter() - started_at
+            if not rendered:
+                self.unsupported += 1
+                await record_derivative_outcome(storage.name, digest, "unsupported")
+                return
+
+            urls = {}
+            for name, body in rendered.items():
+                urls[name] = await upload_pool.run(
+                    storage.save, io.BytesIO(body), f"{digest}_{name}", IMAGE_DERIVATIVE_CONTENT_TYPE
+                )
+            await record_derivatives(storage.name, digest, source_url, urls)
+            self.generated += 1
+        except asyncio.CancelledError:
+            raise
+        except UploadPoolSaturated:
+            # Shed like an upload; no attempt is counted, so the next
+            # upload of these bytes renders again
+            self.skipped += 1
+            log_warning(f"Upload pool saturated; serving the original for {source_url}")
+        except Exception as e:
+            self.failed += 1
+            log_error("Image derivatives", e)
+            try:
+                await record_derivative_outcome(storage.name, digest, "failed")
+            except Exception as record_error:
+                log_error("Image derivatives", record_error)
+
+    def shutdown(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        rendered = self.generated + self.unsupported
+        return {
+            "workers": self.workers,
+            "pending": len(self._tasks),
+            "scheduled": self.scheduled,
+            "duplicates": self.duplicates,
+            "generated": self.generated,
+            "unsupported": self.unsupported,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "avg_render_ms": round(self._render_time_total / rendered * 1000, 2) if rendered else 0.0,
+        }
+
+
+derivative_pipeline = DerivativePipeline(
+    workers=settings.IMAGE_DERIVATIVE_WORKERS,
+    max_pending=settings.IMAGE_DERIVATIVE_MAX_PENDING,
+)
@@ -0,0 +1,105 @@
+"""
+HTTP caching validators for read endpoints.
+
+Handlers derive a strong ETag from data they already have (ids and
+`updated_at` stamps, or pre-serialized bytes) before building the response,
+so a matching `If-None-Match` is answered with 304 without serializing the
+body.
+"""
+import hashlib
+import json
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional
+
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts: Any) -> str:
+    """Strong ETag over JSON-able parts (datetimes are rendered as ISO strings)."""
+    payload = json.dumps(parts, default=_encode_part, separators=(",", ":"))
+    return etag_for_bytes(payload.encode())
+
+
+def etag_for_bytes(body: bytes) -> str:
+    """Strong ETag for an exact response body."""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def _encode_part(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Whether If-None-Match names this ETag.
+
+    Uses the weak comparison required for If-None-Match, so a `W/` prefix
+    added by an intermediary (e.g. after recompression) still matches.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+def unmodified_since(request: Request, last_modified: datetime) -> bool:
+    """Whether If-Modified-Since is at or after `last_modified` (ignored when If-None-Match is sent)."""
+    if "if-none-match" in request.headers:
+        return False
+    header = request.headers.get("if-modified-since")
+    if not header:
+        return False
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return _to_http_precision(last_modified) <= since
+
+
+def _to_http_precision(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def cache_headers(
+    etag: str,
+    cache_control: str,
+    last_modified: Optional[datetime] = None,
+) -> dict:
+    """Validator and Cache-Control headers for a response."""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_to_http_precision(last_modified), usegmt=True)
+    return headers
+
+
+def not_modified(
+    request: Request,
+    response: Response,
+    etag: str,
+    cache_control: str,
+    last_modified: Optional[datetime] = None,
+) -> Optional[Response]:
+    """
+    Evaluate conditional request headers.
+
+    Returns a 304 response when the client's copy is current. Otherwise
+    sets the validators on `response` (the handler's injected Response,
+    whose headers FastAPI merges into the final response) and returns None,
+    and the handler carries on building the body.
+    """
+    headers = cache_headers(etag, cache_control, last_modified)
+    if etag_matches(request, etag) or (
+        last_modified is not None and unmodified_since(request, last_modified)
+    ):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
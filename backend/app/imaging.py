@@ -0,0 +1,52 @@
+"""
+Image derivative rendering.
+
+Runs inside the derivative process pool (see app.derivatives), so this module
+only depends on Pillow and constants: worker processes import it without
+loading settings, the database layer or the web app.
+"""
+import io
+
+from PIL import Image, ImageOps
+
+from app.constants import IMAGE_DERIVATIVE_QUALITY, IMAGE_DERIVATIVE_SIZES
+
+
+def render_derivatives(
+    data: bytes,
+    sizes: dict[str, int] = IMAGE_DERIVATIVE_SIZES,
+    quality: int = IMAGE_DERIVATIVE_QUALITY,
+) -> dict[str, bytes]:
+    """
+    Resize an image to each of `sizes` (longest edge, never upscaled) and
+    encode the results as WebP.
+
+    Animated images return {}: a single still frame would misrepresent
+    them, so clients keep the original.
+
+    Returns:
+        {variant name: WebP bytes}
+    """
+    with Image.open(io.BytesIO(data)) as image:
+        if getattr(image, "n_frames", 1) > 1:
+            return {}
+
+        largest = max(sizes.values())
+        # JPEG can decode straight at a reduced scale, which is far cheaper
+        # than decoding full size and resizing down
+        image.draft("RGB", (largest, largest))
+        image = ImageOps.exif_transpose(image)
+        has_alpha = image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+        image = image.convert("RGBA" if has_alpha else "RGB")
+
+        derivatives = {}
+        # Largest first, each resized from the previous one
+        source = image
+        for name, edge in sorted(sizes.items(), key=lambda item: item[1], reverse=True):
+            resized = source.copy()
+            resized.thumbnail((edge, edge), Image.Resampling.LANCZOS)
+            buffer = io.BytesIO()
+            resized.save(buffer, format="WEBP", quality=quality, method=4)
+            derivatives[name] = buffer.getvalue()
+            source = resized
+        return derivatives
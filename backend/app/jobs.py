@@ -0,0 +1,191 @@
+"""
+Batched background jobs.
+
+Deleting a topic with many questions in one request would either load every
+child row (ORM cascades) or hold one huge transaction open (database
+cascades). Instead the delete runs as a job: answers, then questions, then
+the topic are removed DELETE_JOB_BATCH_SIZE rows per transaction, and
+progress is written to the background_jobs row after every batch so any
+worker can report it (GET /jobs/{id}).
+
+Jobs run as tasks on the event loop of the worker that accepted the request.
+A job cut short by a shutdown is marked `interrupted`; repeating the delete
+starts a new job that picks up where it stopped. A worker that dies outright
+(killed, out of memory) can't mark its job, so every progress update doubles
+as a heartbeat: an unfinished job whose updated_at is older than
+JOB_STALE_AFTER_SECONDS is marked `abandoned` when the next request looks
+for it, and a new job starts. A job that finds its row abandoned stops.
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import session_scope
+from app.logger import log_error, log_warning
+from app.models.answer import Answer
+from app.models.background_job import BackgroundJob
+from app.models.question import Question
+from app.models.topic import Topic
+from app.queries import bump_question_counts
+from app.topic_catalog import bump_topics_version, topic_catalog
+
+JOB_DELETE_TOPIC = "delete_topic"
+
+UNFINISHED_STATUSES = ("pending", "running")
+
+# Strong references to running jobs, so they aren't garbage collected
+_tasks: set[asyncio.Task] = set()
+
+
+class JobAbandoned(Exception):
+    """The job's row was marked abandoned, so another job may own the target."""
+
+
+async def find_unfinished_job(db: AsyncSession, kind: str, target_id: int) -> Optional[BackgroundJob]:
+    """
+    A live pending or running job for the same target, if any. One whose
+    heartbeat is stale is marked abandoned first (and not returned).
+    """
+    stale_before = datetime.now(timezone.utc) - timedelta(seconds=settings.JOB_STALE_AFTER_SECONDS)
+    result = await db.execute(
+        update(BackgroundJob)
+        .where(
+            BackgroundJob.kind == kind,
+            BackgroundJob.target_id == target_id,
+            BackgroundJob.status.in_(UNFINISHED_STATUSES),
+            BackgroundJob.updated_at < stale_before,
+        )
+        .values(status="abandoned", finished_at=func.now())
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount:
+        await db.commit()
+        log_warning(f"Abandoned a stale {kind} job for target {target_id}")
+
+    return await db.scalar(
+        select(BackgroundJob)
+        .where(
+            BackgroundJob.kind == kind,
+            BackgroundJob.target_id == target_id,
+            BackgroundJob.status.in_(UNFINISHED_STATUSES),
+        )
+        .order_by(BackgroundJob.id.desc())
+        .limit(1)
+    )
+
+
+async def _set_job(job_id: int, **values) -> bool:
+    """Update a job that is still unfinished; False if it was abandoned meanwhile."""
+    async with session_scope() as db:
+        result = await db.execute(
+            update(BackgroundJob)
+            .where(BackgroundJob.id == job_id, BackgroundJob.status.in_(UNFINISHED_STATUSES))
+            .values(**values)
+        )
+        await db.commit()
+        return bool(result.rowcount)
+
+
+async def _heartbeat(job_id: int, **values) -> None:
+    """Record progress (moving updated_at); stop if the job was abandoned."""
+    if not await _set_job(job_id, **values):
+        raise JobAbandoned()
+
+
+async def count_topic_rows(db: AsyncSession, topic_id: int, limit: Optional[int] = None) -> int:
+    """
+    Questions plus answers in a topic: the rows deleting it removes, bar
+    the topic's own. With `limit`, counting stops once the total exceeds
+    it, so checking a huge topic against a threshold stays cheap.
+    """
+    def capped(statement, cap):
+        if cap is None:
+            return select(func.count()).select_from(statement.subquery())
+        return select(func.count()).select_from(statement.limit(cap + 1).subquery())
+
+    questions = await db.scalar(
+        capped(select(Question.id).where(Question.topic_id == topic_id), limit)
+    )
+    if limit is not None and questions > limit:
+        return questions
+    answers = await db.scalar(
+        capped(
+            select(Answer.id)
+            .join(Question, Answer.question_id == Question.id)
+            .where(Question.topic_id == topic_id),
+            None if limit is None else limit - questions,
+        )
+    )
+    return questions + answers
+
+
+async def _delete_batch(statement) -> int:
+    """Run one batch DELETE in its own transaction; returns rows removed."""
+    async with session_scope() as db:
+        result = await db.execute(statement.execution_options(synchronize_session=False))
+        await db.commit()
+        return result.rowcount
+
+
+async def _delete_topic_in_batches(job_id: int, topic_id: int) -> None:
+    batch = settings.DELETE_JOB_BATCH_SIZE
+    try:
+        async with session_scope() as db:
+            rows = await count_topic_rows(db, topic_id)
+        await _heartbeat(job_id, status="running", total=rows + 1)
+
+        processed = 0
+        # Answers first, so no question batch cascades into an unbounded delete
+        batches = (
+            delete(Answer).where(Answer.id.in_(
+                select(Answer.id)
+                .join(Question, Answer.question_id == Question.id)
+                .where(Question.topic_id == topic_id)
+                .limit(batch)
+            )),
+            delete(Question).where(Question.id.in_(
+                select(Question.id).where(Question.topic_id == topic_id).limit(batch)
+            )),
+        )
+        for statement in batches:
+            while True:
+                removed = await _delete_batch(statement)
+                if not removed:
+                    break
+                processed += removed
+                await bump_question_counts()
+                await _heartbeat(job_id, processed=processed)
+
+        async with session_scope() as db:
+            await db.execute(delete(Topic).where(Topic.id == topic_id))
+            await bump_topics_version(db)
+            await db.commit()
+        topic_catalog.invalidate()
+        await bump_question_counts()
+        await _set_job(job_id, status="completed", processed=processed + 1, finished_at=func.now())
+    except asyncio.CancelledError:
+        await _set_job(job_id, status="interrupted", finished_at=func.now())
+        raise
+    except JobAbandoned:
+        log_warning(f"Background job {job_id} was abandoned after a stale heartbeat; stopping")
+    except Exception as e:
+        log_error(f"Background job {job_id}", e)
+        await _set_job(job_id, status="failed", error=str(e), finished_at=func.now())
+
+
+def start_topic_deletion(job_id: int, topic_id: int) -> None:
+    """Run a committed delete_topic job in the background."""
+    task = asyncio.get_running_loop().create_task(_delete_topic_in_batches(job_id, topic_id))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+
+
+async def shutdown_jobs() -> None:
+    """Cancel running jobs and wait for them to record that they stopped."""
+    for task in list(_tasks):
+        task.cancel()
+    await asyncio.gather(*_tasks, return_exceptions=True)
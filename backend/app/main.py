@@ -1,14 +1,54 @@
 import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.staticfiles import StaticFiles
 from dotenv import load_dotenv
-from app.database import engine
-from app.auth import verify_token
-from app.routes import users_router, auth_router, topics_router, questions_router, answers_router, upload_router
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from app.config import settings
+from app.database import get_db, dispose_engines, pool_status, session_scope
+from app.auth import verify_token, jwks_store, verified_token_cache
+from app.body_limit import BodySizeLimitMiddleware
+from app.constants import UPLOAD_MAX_BODY_BYTES
+from app.compression import CompressionMiddleware, compression_options, compression_stats
+from app.dependencies import user_cache
+from app.derivatives import derivative_pipeline
+from app.jobs import shutdown_jobs
+from app.serializers import FastJSONResponse
+from app.topic_catalog import topic_catalog
+from app.upload_pool import upload_pool
+from app.routes import users_router, auth_router, topics_router, questions_router, answers_router, upload_router, search_router, jobs_router
 
 load_dotenv()
 
-app = FastAPI(title="QuestionAura API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown hooks."""
+    # Warm the JWKS cache so the first authenticated request doesn't pay for it
+    await run_in_threadpool(jwks_store.refresh)
+    jwks_store.start_background_refresh()
+    # Load topics up front; requests then only check the version stamp
+    async with session_scope() as db:
+        await topic_catalog.load(db)
+    yield
+    jwks_store.stop_background_refresh()
+    await shutdown_jobs()
+    upload_pool.shutdown()
+    derivative_pipeline.shutdown()
+    await dispose_engines()
+
+
+app = FastAPI(
+    title="QuestionAura API",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
+)
+
+# Reject oversized uploads while they stream in (inside CORS so the 413 is readable)
+app.add_middleware(BodySizeLimitMiddleware, limits={"/upload": UPLOAD_MAX_BODY_BYTES})
 
 # CORS configuration
 origins = os.getenv("CORS_ORIGINS", "http://localhost:5173").split(",")
@@ -21,12 +61,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(CompressionMiddleware, **compression_options())
+
 app.include_router(users_router)
 app.include_router(auth_router)
 app.include_router(topics_router)
 app.include_router(questions_router)
 app.include_router(answers_router)
 app.include_router(upload_router)
+app.include_router(search_router)
+app.include_router(jobs_router)
+
+# Serve files written by the local storage backend
+if settings.STORAGE_BACKEND == "local":
+    os.makedirs(settings.STORAGE_LOCAL_DIR, exist_ok=True)
+    app.mount("/media", StaticFiles(directory=settings.STORAGE_LOCAL_DIR), name="media")
 
 
 @app.get("/protected")
@@ -49,11 +98,32 @@ async def health_check():
     return {"status": "ok"}
 
 
+@app.get("/metrics")
+async def metrics():
+    """In-process cache and connection pool statistics."""
+    return {
+        "token_cache": verified_token_cache.stats(),
+        "jwks": jwks_store.stats(),
+        "user_cache": user_cache.stats(),
+        "topic_catalog": topic_catalog.stats(),
+        "compression": compression_stats.as_dict(),
+        "upload_pool": upload_pool.stats(),
+        "image_derivatives": derivative_pipeline.stats(),
+        "db_pool": pool_status(),
+    }
+
+
+@app.get("/db-pool")
+async def db_pool():
+    """Connection pool occupancy, waiters and checkout wait-time histogram."""
+    return pool_status()
+
+
 @app.get("/db-check")
-async def db_check():
-    """Database connectivity check."""
+async def db_check(db: AsyncSession = Depends(get_db)):
+    """Database connectivity check through the request pool, with pool health."""
     try:
-        with engine.connect():
-            return {"db": "connected"}
+        await db.execute(text("SELECT 1"))
+        return {"db": "connected", "pool": pool_status()}
     except Exception as e:
         return {"db": "error", "message": str(e)}
\ No newline at end of file
@@ -2,6 +2,9 @@ from app.models.user import User
 from app.models.topic import Topic
 from app.models.question import Question
 from app.models.answer import Answer
+from app.models.cache_version import CacheVersion
+from app.models.stored_image import StoredImage
+from app.models.background_job import BackgroundJob
 
-__all__ = ["User", "Topic", "Question", "Answer"]
+__all__ = ["User", "Topic", "Question", "Answer", "CacheVersion", "StoredImage", "BackgroundJob"]
 
@@ -1,5 +1,6 @@
 from datetime import datetime
-from sqlalchemy import String, Text, DateTime, ForeignKey, func
+from sqlalchemy import String, Text, DateTime, ForeignKey, Index, Computed, func, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -7,11 +8,25 @@ from app.database import Base
 
 class Answer(Base):
     __tablename__ = "answers"
+    __table_args__ = (
+        # Keyset pagination: oldest first, optionally scoped to a question
+        Index("ix_answers_created_at_id", "created_at", "id"),
+        Index("ix_answers_question_id_created_at_id", "question_id", "created_at", "id"),
+        Index("ix_answers_response_tsv", "response_tsv", postgresql_using="gin"),
+        # Rows to update when an image's derivatives finish rendering
+        Index(
+            "ix_answers_image_url", "image_url",
+            postgresql_where=text("image_url IS NOT NULL"),
+        ),
+    )
+    # Read server-generated timestamps back with RETURNING on INSERT and
+    # UPDATE, so write endpoints can respond without reloading the row
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
     question_id: Mapped[int] = mapped_column(
-        ForeignKey("questions.id"),
+        ForeignKey("questions.id", ondelete="CASCADE"),
         index=True,
         nullable=False,
     )
@@ -21,11 +36,35 @@ class Answer(Base):
         nullable=False,
     )
 
+    # Full-text search vector, maintained by Postgres; deferred so normal loads skip it
+    response_tsv: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('english', response)", persisted=True),
+        nullable=True,
+        deferred=True,
+    )
+
     image_url: Mapped[str | None] = mapped_column(
         String(500),
         nullable=True,
     )
 
+    # Resized WebP derivatives of image_url, filled in once they are rendered
+    image_thumb_url: Mapped[str | None] = mapped_column(
+        String(500),
+        nullable=True,
+    )
+
+    image_card_url: Mapped[str | None] = mapped_column(
+        String(500),
+        nullable=True,
+    )
+
+    image_full_url: Mapped[str | None] = mapped_column(
+        String(500),
+        nullable=True,
+    )
+
     responder_id: Mapped[int] = mapped_column(
         ForeignKey("users.id"),
         index=True,
@@ -45,6 +84,17 @@ class Answer(Base):
         nullable=False,
     )
 
+    @property
+    def image_variants(self) -> dict | None:
+        """Derivative URLs by variant name, or None until they are rendered."""
+        if not self.image_card_url:
+            return None
+        return {
+            "thumb": self.image_thumb_url,
+            "card": self.image_card_url,
+            "full": self.image_full_url,
+        }
+
     # Relationships
     question: Mapped["Question"] = relationship(
         "Question",
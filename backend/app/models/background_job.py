@@ -0,0 +1,86 @@
+from datetime import datetime
+from sqlalchemy import String, Text, DateTime, Integer, ForeignKey, Index, func, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class BackgroundJob(Base):
+    """
+    Progress of a long-running job (e.g. deleting a large topic in batches).
+
+    Kept in the database rather than in the worker that runs the job, so
+    any worker can report progress.
+    """
+    __tablename__ = "background_jobs"
+    __table_args__ = (
+        # At most one unfinished job per target, so concurrent requests
+        # can't both start one; also finds that job
+        Index(
+            "uq_background_jobs_unfinished_kind_target_id", "kind", "target_id",
+            unique=True,
+            postgresql_where=text("status IN ('pending', 'running')"),
+            sqlite_where=text("status IN ('pending', 'running')"),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    kind: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+    )
+
+    target_id: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+
+    # pending | running | completed | failed | interrupted | abandoned
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        default="pending",
+    )
+
+    # Rows to process (measured when the job starts) and rows done so far
+    total: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+
+    processed: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+
+    error: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+    )
+
+    requested_by_id: Mapped[int | None] = mapped_column(
+        ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    # Moves with every progress update: the job's heartbeat
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    finished_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
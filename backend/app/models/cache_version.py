@@ -0,0 +1,31 @@
+from datetime import datetime
+from sqlalchemy import String, DateTime, Integer, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class CacheVersion(Base):
+    """
+    Version stamp for a process-wide cache.
+
+    Writers bump the row in the same transaction as the data they change;
+    each worker compares its loaded version against the row to know when
+    its in-memory copy is stale.
+    """
+    __tablename__ = "cache_versions"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+
+    version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
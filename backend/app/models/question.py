@@ -1,5 +1,6 @@
 from datetime import datetime
-from sqlalchemy import String, Text, DateTime, ForeignKey, func
+from sqlalchemy import Integer, String, Text, DateTime, ForeignKey, Index, Computed, func, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -7,11 +8,39 @@ from app.database import Base
 
 class Question(Base):
     __tablename__ = "questions"
+    __table_args__ = (
+        # Keyset pagination: newest first, optionally scoped to a topic or asker
+        Index("ix_questions_created_at_id", "created_at", "id"),
+        Index("ix_questions_topic_id_created_at_id", "topic_id", "created_at", "id"),
+        Index("ix_questions_asker_id_created_at_id", "asker_id", "created_at", "id"),
+        # Recently active and most answered views
+        Index("ix_questions_last_activity_at_id", "last_activity_at", "id"),
+        Index("ix_questions_answer_count_id", "answer_count", "id"),
+        # Unanswered view, newest first; only holds questions with no answers
+        Index(
+            "ix_questions_unanswered_created_at_id", "created_at", "id",
+            postgresql_where=text("answer_count = 0"),
+        ),
+        Index("ix_questions_ask_tsv", "ask_tsv", postgresql_using="gin"),
+        # Rows to update when an image's derivatives finish rendering
+        Index(
+            "ix_questions_image_url", "image_url",
+            postgresql_where=text("image_url IS NOT NULL"),
+        ),
+        # Substring matching for search suggestions (pg_trgm)
+        Index(
+            "ix_questions_ask_trgm", "ask",
+            postgresql_using="gin", postgresql_ops={"ask": "gin_trgm_ops"},
+        ),
+    )
+    # Read server-generated timestamps back with RETURNING on INSERT and
+    # UPDATE, so write endpoints can respond without reloading the row
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
     topic_id: Mapped[int] = mapped_column(
-        ForeignKey("topics.id"),
+        ForeignKey("topics.id", ondelete="CASCADE"),
         index=True,
         nullable=False,
     )
@@ -21,11 +50,35 @@ class Question(Base):
         nullable=False,
     )
 
+    # Full-text search vector, maintained by Postgres; deferred so normal loads skip it
+    ask_tsv: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('english', ask)", persisted=True),
+        nullable=True,
+        deferred=True,
+    )
+
     image_url: Mapped[str | None] = mapped_column(
         String(500),
         nullable=True,
     )
 
+    # Resized WebP derivatives of image_url, filled in once they are rendered
+    image_thumb_url: Mapped[str | None] = mapped_column(
+        String(500),
+        nullable=True,
+    )
+
+    image_card_url: Mapped[str | None] = mapped_column(
+        String(500),
+        nullable=True,
+    )
+
+    image_full_url: Mapped[str | None] = mapped_column(
+        String(500),
+        nullable=True,
+    )
+
     asker_id: Mapped[int] = mapped_column(
         ForeignKey("users.id"),
         index=True,
@@ -45,6 +98,32 @@ class Question(Base):
         nullable=False,
     )
 
+    # Denormalized from answers and kept in step by app.question_activity
+    # in the same transaction as every answer write
+    answer_count: Mapped[int] = mapped_column(
+        Integer,
+        server_default="0",
+        nullable=False,
+    )
+
+    # Latest of created_at and the newest answer's created_at
+    last_activity_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    @property
+    def image_variants(self) -> dict | None:
+        """Derivative URLs by variant name, or None until they are rendered."""
+        if not self.image_card_url:
+            return None
+        return {
+            "thumb": self.image_thumb_url,
+            "card": self.image_card_url,
+            "full": self.image_full_url,
+        }
+
     # Relationships
     topic: Mapped["Topic"] = relationship(
         "Topic",
@@ -59,6 +138,9 @@ class Question(Base):
     answers: Mapped[list["Answer"]] = relationship(
         "Answer",
         back_populates="question",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        # The foreign key cascades in the database; deleting a parent
+        # doesn't load its children
+        passive_deletes=True
     )
 
@@ -0,0 +1,88 @@
+from datetime import datetime
+from sqlalchemy import String, DateTime, Integer, ForeignKey, Index, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class StoredImage(Base):
+    """
+    Content-addressed index of uploaded images.
+
+    One row per (backend, SHA-256) pair, so re-uploading identical bytes
+    returns the stored URL without another transfer.
+    """
+    __tablename__ = "stored_images"
+    __table_args__ = (
+        UniqueConstraint("backend", "sha256", name="uq_stored_images_backend_sha256"),
+        # Questions and answers reference images by URL
+        Index("ix_stored_images_url", "url"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    sha256: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+    )
+
+    backend: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+    )
+
+    url: Mapped[str] = mapped_column(
+        String(500),
+        nullable=False,
+    )
+
+    content_type: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+    )
+
+    size_bytes: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+
+    # Resized WebP derivatives, filled in once they are rendered
+    thumb_url: Mapped[str | None] = mapped_column(
+        String(500),
+        nullable=True,
+    )
+
+    card_url: Mapped[str | None] = mapped_column(
+        String(500),
+        nullable=True,
+    )
+
+    full_url: Mapped[str | None] = mapped_column(
+        String(500),
+        nullable=True,
+    )
+
+    # None until a render finishes, then "ready", "unsupported" (animated
+    # or undecodable; never retried) or "failed"
+    derivative_status: Mapped[str | None] = mapped_column(
+        String(20),
+        nullable=True,
+    )
+
+    # Failed renders so far; re-uploads retry until IMAGE_DERIVATIVE_MAX_ATTEMPTS
+    derivative_attempts: Mapped[int] = mapped_column(
+        Integer,
+        server_default="0",
+        nullable=False,
+    )
+
+    uploaded_by_id: Mapped[int | None] = mapped_column(
+        ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
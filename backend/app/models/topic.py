@@ -1,4 +1,4 @@
-from sqlalchemy import String
+from sqlalchemy import String, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -6,6 +6,13 @@ from app.database import Base
 
 class Topic(Base):
     __tablename__ = "topics"
+    __table_args__ = (
+        # Substring matching for search suggestions (pg_trgm)
+        Index(
+            "ix_topics_name_trgm", "name",
+            postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
@@ -25,6 +32,9 @@ class Topic(Base):
     questions: Mapped[list["Question"]] = relationship(
         "Question",
         back_populates="topic",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        # The foreign key cascades in the database; deleting a parent
+        # doesn't load its children
+        passive_deletes=True
     )
 
@@ -0,0 +1,61 @@
+"""
+Keyset (cursor) pagination helpers.
+
+A cursor is the sort key of the last row on a page, encoded as opaque
+URL-safe base64 JSON. The next page is everything strictly after that key
+in sort order, which an index on the sort columns serves directly no matter
+how deep the page is.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Sequence
+from fastapi import HTTPException, status
+from sqlalchemy import tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode a row's sort key as an opaque cursor."""
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, *types: type) -> list:
+    """
+    Decode a cursor back into its sort key values.
+
+    Args:
+        cursor: Cursor produced by encode_cursor
+        types: Expected type of each value (datetime values are parsed)
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or len(payload) != len(types):
+            raise ValueError("wrong number of values")
+        return [
+            datetime.fromisoformat(value) if expected is datetime else expected(value)
+            for value, expected in zip(payload, types)
+        ]
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+def after_cursor(
+    columns: Sequence[ColumnElement],
+    values: Sequence[Any],
+    descending: bool = True,
+) -> ColumnElement:
+    """Row-value condition selecting rows that sort after the cursor key."""
+    if descending:
+        return tuple_(*columns) < tuple_(*values)
+    return tuple_(*columns) > tuple_(*values)
@@ -0,0 +1,161 @@
+"""
+Connection pool instrumentation.
+
+Pool classes here behave exactly like SQLAlchemy's QueuePool variants but
+record pool saturation: how many callers are blocked because every
+connection the pool may open is checked out, how long they waited for one
+to come back, and how many gave up. Opening a new connection is timed
+separately, so slow connects don't read as saturation.
+"""
+import threading
+import time
+from contextvars import ContextVar
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# Upper bounds (ms) of the checkout wait histogram buckets
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# QueuePool._do_get retries by calling itself; only the outermost call is measured
+_in_checkout: ContextVar[bool] = ContextVar("pool_in_checkout", default=False)
+
+
+class PoolMetrics:
+    """Saturation counters, a wait-time histogram and connect times for one pool."""
+
+    def __init__(self):
+        self.waiting = 0
+        self.checkouts = 0
+        self.waits = 0
+        self.timeouts = 0
+        self.wait_ms_sum = 0.0
+        self.wait_ms_max = 0.0
+        self.bucket_counts = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self.connects = 0
+        self.connect_ms_sum = 0.0
+        self.connect_ms_max = 0.0
+        self._lock = threading.Lock()
+
+    def start_wait(self) -> None:
+        with self._lock:
+            self.waiting += 1
+
+    def end_wait(self, wait_seconds: float, timed_out: bool) -> None:
+        wait_ms = wait_seconds * 1000
+        with self._lock:
+            self.waiting -= 1
+            if timed_out:
+                self.timeouts += 1
+                return
+            self.waits += 1
+            self.wait_ms_sum += wait_ms
+            self.wait_ms_max = max(self.wait_ms_max, wait_ms)
+            for index, bound in enumerate(WAIT_BUCKETS_MS):
+                if wait_ms <= bound:
+                    self.bucket_counts[index] += 1
+                    break
+            else:
+                self.bucket_counts[-1] += 1
+
+    def record_checkout(self) -> None:
+        with self._lock:
+            self.checkouts += 1
+
+    def record_connect(self, connect_seconds: float) -> None:
+        connect_ms = connect_seconds * 1000
+        with self._lock:
+            self.connects += 1
+            self.connect_ms_sum += connect_ms
+            self.connect_ms_max = max(self.connect_ms_max, connect_ms)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            labels = [f"le_{bound}ms" for bound in WAIT_BUCKETS_MS] + ["gt_5000ms"]
+            return {
+                "waiters": self.waiting,
+                "checkouts": self.checkouts,
+                "waits": self.waits,
+                "timeouts": self.timeouts,
+                "wait_ms": {
+                    "mean": round(self.wait_ms_sum / self.waits, 3) if self.waits else 0.0,
+                    "max": round(self.wait_ms_max, 3),
+                    "histogram": dict(zip(labels, self.bucket_counts)),
+                },
+                "connects": self.connects,
+                "connect_ms": {
+                    "mean": round(self.connect_ms_sum / self.connects, 3) if self.connects else 0.0,
+                    "max": round(self.connect_ms_max, 3),
+                },
+            }
+
+
+class InstrumentedPoolMixin:
+    """
+    Measures checkouts made while the pool is exhausted; metrics survive
+    engine.dispose() (pool recreate).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _saturated(self) -> bool:
+        # Every connection the pool may hold is in use, so this caller
+        # blocks until one is returned (unbounded overflow never blocks)
+        return self._max_overflow > -1 and self.checkedout() >= self.size() + self._max_overflow
+
+    def _do_get(self):
+        if _in_checkout.get():
+            return super()._do_get()
+
+        token = _in_checkout.set(True)
+        saturated = self._saturated()
+        if saturated:
+            self.metrics.start_wait()
+        start = time.perf_counter()
+        connect_seconds = 0.0
+        timed_out = False
+        try:
+            record = super()._do_get()
+            # Set by _create_connection when the checkout had to open one
+            connect_seconds = record.__dict__.pop("_connect_seconds", 0.0)
+            self.metrics.record_checkout()
+            return record
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            _in_checkout.reset(token)
+            if saturated:
+                self.metrics.end_wait(time.perf_counter() - start - connect_seconds, timed_out)
+
+    def _create_connection(self):
+        start = time.perf_counter()
+        record = super()._create_connection()
+        connect_seconds = time.perf_counter() - start
+        record._connect_seconds = connect_seconds
+        self.metrics.record_connect(connect_seconds)
+        return record
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def status_dict(self) -> dict:
+        """Current occupancy plus accumulated metrics."""
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": self.overflow(),
+            **self.metrics.snapshot(),
+        }
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    """QueuePool with checkout metrics, for sync engines."""
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool with checkout metrics, for async engines."""
@@ -0,0 +1,195 @@
+"""
+Query helpers shared by several routers.
+"""
+import json
+import uuid
+from datetime import datetime
+from typing import Optional, Sequence, Tuple
+from sqlalchemy import Row, Select, false, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from app.cache import create_cache_backend
+from app.config import settings
+from app.models.answer import Answer
+from app.models.question import Question
+from app.models.topic import Topic
+from app.models.user import User
+from app.pagination import after_cursor, decode_cursor, encode_cursor
+
+
+# Strategies that read question_count_cache, so only they pay for bumps
+CACHED_COUNT_STRATEGIES = ("cached", "estimated")
+QUESTION_COUNTS_VERSION_KEY = "version"
+
+# "<version>:<filter key>" -> total matching questions, plus the current
+# version token under QUESTION_COUNTS_VERSION_KEY. A bump stores a fresh
+# token, which retires every entry at once; with Redis the token is shared,
+# so a write in one worker retires every worker's counts.
+question_count_cache = create_cache_backend("question_counts", maxsize=1024)
+
+
+async def bump_question_counts() -> None:
+    """
+    Retire cached counts. Call after committing any write that changes
+    which questions match a filter; it costs no database statement and is
+    skipped unless the configured count strategy uses the cache.
+    """
+    if settings.QUESTIONS_COUNT_STRATEGY not in CACHED_COUNT_STRATEGIES:
+        return
+    # Outlives every entry keyed by the token it replaces
+    await question_count_cache.set(
+        QUESTION_COUNTS_VERSION_KEY,
+        uuid.uuid4().hex,
+        ttl=settings.QUESTION_COUNT_CACHE_TTL_SECONDS,
+    )
+
+
+async def question_count_key(filter_key: tuple) -> str:
+    """Cache key for a (topic_id, asker_id, search, answered) filter at the current version."""
+    version = await question_count_cache.get(QUESTION_COUNTS_VERSION_KEY) or "0"
+    return f"{version}:{json.dumps(filter_key)}"
+
+
+def question_version(question: Question) -> tuple:
+    """
+    Everything that changes a serialized question: its own row, the asker's
+    row, and the topic fields (topics carry no timestamp). Used for ETags.
+    """
+    return (
+        question.id,
+        question.updated_at,
+        question.asker.updated_at,
+        question.topic.id,
+        question.topic.name,
+        question.topic.image_url,
+    )
+
+
+def question_row_version(row: Row) -> tuple:
+    """question_version() for a projected question row."""
+    return (
+        row.id,
+        row.updated_at,
+        row.asker_updated_at,
+        row.topic_id,
+        row.topic_name,
+        row.topic_image_url,
+    )
+
+
+def answer_version(answer: Answer) -> tuple:
+    """Everything that changes a serialized answer summary. Used for ETags."""
+    return (answer.id, answer.updated_at, answer.responder.updated_at)
+
+
+def answer_row_version(row: Row) -> tuple:
+    """answer_version() for a fetch_answer_page() row."""
+    return (row.id, row.updated_at, row.responder_updated_at)
+
+
+def _user_columns(prefix: str) -> tuple:
+    return (
+        User.auth0_id.label(f"{prefix}_auth0_id"),
+        User.email.label(f"{prefix}_email"),
+        User.first_name.label(f"{prefix}_first_name"),
+        User.last_name.label(f"{prefix}_last_name"),
+        User.created_at.label(f"{prefix}_created_at"),
+        User.updated_at.label(f"{prefix}_updated_at"),
+    )
+
+
+def question_rows_query(preview: Optional[int] = None) -> Select:
+    """
+    Projection of exactly the columns a question list item needs, joined to
+    its topic and asker, as flat row tuples (no ORM entities or identity
+    map). With `preview`, `ask` is cut to that many characters in the
+    database and `ask_truncated` says whether anything was cut.
+    """
+    if preview is None:
+        ask = Question.ask
+        truncated = false()
+    else:
+        ask = func.substr(Question.ask, 1, preview)
+        truncated = func.length(Question.ask) > preview
+
+    return (
+        select(
+            Question.id,
+            Question.topic_id,
+            Question.asker_id,
+            Question.image_url,
+            Question.image_thumb_url,
+            Question.image_card_url,
+            Question.image_full_url,
+            Question.created_at,
+            Question.updated_at,
+            Question.answer_count,
+            Question.last_activity_at,
+            ask.label("ask"),
+            truncated.label("ask_truncated"),
+            Topic.name.label("topic_name"),
+            Topic.image_url.label("topic_image_url"),
+            *_user_columns("asker"),
+        )
+        .join(Topic, Question.topic_id == Topic.id)
+        .join(User, Question.asker_id == User.id)
+    )
+
+
+async def load_question(db: AsyncSession, question_id: int) -> Optional[Question]:
+    """Load a question with the relationships its response model needs."""
+    return await db.scalar(
+        select(Question)
+        .options(joinedload(Question.topic), joinedload(Question.asker))
+        .where(Question.id == question_id)
+    )
+
+
+async def fetch_answer_page(
+    db: AsyncSession,
+    question_id: Optional[int],
+    cursor: Optional[str],
+    page_size: int,
+) -> Tuple[Sequence[Row], Optional[str]]:
+    """
+    Fetch one page of answers, oldest first, as projected rows carrying the
+    answer columns and the responder's columns (`responder_*`).
+
+    Returns:
+        (answers, next_cursor); next_cursor is None on the last page.
+    """
+    query = (
+        select(
+            Answer.id,
+            Answer.question_id,
+            Answer.responder_id,
+            Answer.response,
+            Answer.image_url,
+            Answer.image_thumb_url,
+            Answer.image_card_url,
+            Answer.image_full_url,
+            Answer.created_at,
+            Answer.updated_at,
+            *_user_columns("responder"),
+        )
+        .join(User, Answer.responder_id == User.id)
+        .order_by(Answer.created_at, Answer.id)
+    )
+
+    if question_id is not None:
+        query = query.where(Answer.question_id == question_id)
+
+    if cursor:
+        created_at, last_id = decode_cursor(cursor, datetime, int)
+        query = query.where(
+            after_cursor((Answer.created_at, Answer.id), (created_at, last_id), descending=False)
+        )
+
+    # Fetch one extra row to learn whether another page exists
+    rows = (await db.execute(query.limit(page_size + 1))).all()
+    answers = rows[:page_size]
+    next_cursor = None
+    if len(rows) > page_size:
+        last = answers[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+    return answers, next_cursor
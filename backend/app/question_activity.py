@@ -0,0 +1,155 @@
+"""
+Denormalized answer activity on questions.
+
+questions.answer_count and questions.last_activity_at let the feed show and
+sort by answers without a GROUP BY over answers (see the `sort` and
+`answered` options of GET /questions). Every answer write adjusts them with
+one UPDATE of the question row in the same transaction, so they commit or
+roll back together with the answer; the row lock that UPDATE takes also
+serializes concurrent answers to the same question. A write that adjusts
+two questions (moving an answer) must adjust them in ascending id order so
+concurrent writes can't lock the pair in opposite orders. The UPDATE moves
+updated_at too, so cached question pages revalidate.
+
+check_question_activity.py finds questions whose columns have drifted from
+their answers (rows written outside the API) and repairs them.
+"""
+from datetime import datetime
+from typing import Optional, Sequence
+
+from sqlalchemy import Row, Select, Update, func, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models.answer import Answer
+from app.models.question import Question
+
+# Returned by every adjustment and copied onto the loaded question, if any
+ACTIVITY_COLUMNS = (Question.answer_count, Question.last_activity_at, Question.updated_at)
+
+
+def actual_answer_count():
+    """Correlated subquery: the question's answers, counted."""
+    return (
+        select(func.count())
+        .select_from(Answer)
+        .where(Answer.question_id == Question.id)
+        .scalar_subquery()
+    )
+
+
+def actual_last_activity_at():
+    """Correlated expression: the question's creation or newest answer, whichever is later."""
+    newest_answer_at = (
+        select(func.max(Answer.created_at))
+        .where(Answer.question_id == Question.id)
+        .scalar_subquery()
+    )
+    # greatest() ignores the NULL of an unanswered question
+    return func.greatest(Question.created_at, newest_answer_at)
+
+
+def recount_statement(question_ids: Optional[Sequence[int]] = None) -> Update:
+    """
+    Recompute both columns from answers for `question_ids` (every question
+    if None). Each question reads only its own answers through
+    ix_answers_question_id_created_at_id.
+    """
+    statement = update(Question).values(
+        answer_count=actual_answer_count(),
+        last_activity_at=actual_last_activity_at(),
+    )
+    if question_ids is not None:
+        statement = statement.where(Question.id.in_(question_ids))
+    return statement.execution_options(synchronize_session=False)
+
+
+def drift_scan_query(after_id: int, limit: int) -> Select:
+    """
+    The next `limit` questions after `after_id` with their stored columns
+    and the values their answers imply (`actual_answer_count`,
+    `newest_answer_at`), for the consistency checker.
+    """
+    return (
+        select(
+            Question.id,
+            Question.created_at,
+            Question.answer_count,
+            Question.last_activity_at,
+            func.count(Answer.id).label("actual_answer_count"),
+            func.max(Answer.created_at).label("newest_answer_at"),
+        )
+        .outerjoin(Answer, Answer.question_id == Question.id)
+        .where(Question.id > after_id)
+        .group_by(Question.id)
+        .order_by(Question.id)
+        .limit(limit)
+    )
+
+
+def has_drifted(row: Row) -> bool:
+    """Whether a drift_scan_query() row's stored columns disagree with its answers."""
+    expected_last_activity_at = row.created_at
+    if row.newest_answer_at is not None and row.newest_answer_at > row.created_at:
+        expected_last_activity_at = row.newest_answer_at
+    return (
+        row.answer_count != row.actual_answer_count
+        or row.last_activity_at != expected_last_activity_at
+    )
+
+
+async def _adjust(db: AsyncSession, statement: Update, question: Optional[Question]) -> int:
+    row = (await db.execute(statement.returning(*ACTIVITY_COLUMNS))).one()
+    if question is not None:
+        # The response is built from the question in hand; give it the new
+        # values without marking it dirty or reloading it
+        set_committed_value(question, "answer_count", row.answer_count)
+        set_committed_value(question, "last_activity_at", row.last_activity_at)
+        set_committed_value(question, "updated_at", row.updated_at)
+    return row.answer_count
+
+
+async def record_answer_added(
+    db: AsyncSession,
+    question_id: int,
+    answered_at: datetime,
+    question: Optional[Question] = None,
+) -> int:
+    """
+    Count a new (or moved-in) answer created at `answered_at`. An O(1)
+    increment; the answer's own row needn't be read. `question`, when
+    loaded, receives the new values.
+
+    Returns:
+        The question's new answer_count
+    """
+    return await _adjust(
+        db,
+        update(Question)
+        .where(Question.id == question_id)
+        .values(
+            answer_count=Question.answer_count + 1,
+            last_activity_at=func.greatest(
+                Question.last_activity_at, literal(answered_at, Question.last_activity_at.type)
+            ),
+        )
+        .execution_options(synchronize_session=False),
+        question,
+    )
+
+
+async def record_answer_removed(
+    db: AsyncSession,
+    question_id: int,
+    question: Optional[Question] = None,
+) -> int:
+    """
+    Account for a deleted (or moved-out) answer, after it has been flushed.
+    last_activity_at has to fall back to the next newest answer, so both
+    columns are recomputed from the question's remaining answers, which
+    also corrects any drift on that question.
+
+    Returns:
+        The question's new answer_count
+    """
+    return await _adjust(db, recount_statement([question_id]), question)
@@ -4,5 +4,7 @@ from app.routes.topics import router as topics_router
 from app.routes.questions import router as questions_router
 from app.routes.answers import router as answers_router
 from app.routes.upload import router as upload_router
+from app.routes.search import router as search_router
+from app.routes.jobs import router as jobs_router
 
-__all__ = ["users_router", "auth_router", "topics_router", "questions_router", "answers_router", "upload_router"]
\ No newline at end of file
+__all__ = ["users_router", "auth_router", "topics_router", "questions_router", "answers_router", "upload_router", "search_router", "jobs_router"]
\ No newline at end of file
@@ -1,63 +1,158 @@
-from fastapi import APIRouter, Depends, status, HTTPException, Query
-from sqlalchemy.orm import Session, joinedload
-from typing import List, Optional
-from app.database import get_db
+from fastapi import APIRouter, Depends, status, HTTPException, Query, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from typing import Optional
+from app.config import settings
+from app.database import get_db, get_read_db
 from app.dependencies import get_current_user
+from app.derivatives import image_variant_columns
 from app.models.user import User
 from app.models.answer import Answer
 from app.models.question import Question
-from app.schemas.answer import AnswerResponse, AnswerCreate, AnswerUpdate
+from app.http_cache import make_etag, not_modified
+from app.queries import (
+    answer_row_version,
+    answer_version,
+    bump_question_counts,
+    fetch_answer_page,
+    load_question,
+    question_version,
+)
+from app.question_activity import record_answer_added, record_answer_removed
+from app.schemas.answer import AnswerResponse, AnswerCreate, AnswerUpdate, PaginatedAnswerResponse
+from app.schemas.image import ImageSize
+from app.serializers import answer_dict, answers_page_dict, json_response
 
 router = APIRouter(prefix="/answers", tags=["answers"])
 
+# The parent question with the topic and asker its response embeds
+ANSWER_QUESTION_LOAD_OPTIONS = (
+    joinedload(Answer.question).joinedload(Question.topic),
+    joinedload(Answer.question).joinedload(Question.asker),
+)
 
-@router.get("", response_model=List[AnswerResponse])
+# Relationships the AnswerResponse model serializes
+ANSWER_LOAD_OPTIONS = (
+    *ANSWER_QUESTION_LOAD_OPTIONS,
+    joinedload(Answer.responder),
+)
+
+
+async def _load_answer(db: AsyncSession, answer_id: int) -> Optional[Answer]:
+    """Load an answer with the relationships its response model needs."""
+    return await db.scalar(
+        select(Answer).options(*ANSWER_LOAD_OPTIONS).where(Answer.id == answer_id)
+    )
+
+
+async def _load_answer_for_update(db: AsyncSession, answer_id: int) -> Optional[Answer]:
+    """
+    Load an answer with its question (topic and asker) for a write by its
+    responder; the responder is the current user, so it isn't loaded.
+    """
+    return await db.scalar(
+        select(Answer).options(*ANSWER_QUESTION_LOAD_OPTIONS).where(Answer.id == answer_id)
+    )
+
+
+@router.get("", response_model=PaginatedAnswerResponse)
 async def get_all_answers(
+    request: Request,
+    response: Response,
     question_id: Optional[int] = Query(None, description="Filter by question ID"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    page_size: int = Query(20, ge=1, le=100, description="Items per page (max 100)"),
+    include_question: bool = Query(True, description="Include the parent question once when filtering by question_id"),
+    image_size: ImageSize = Query(
+        settings.IMAGE_LIST_VARIANT,
+        description="Image variant returned in image_url: thumb, card, full or original"
+    ),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get all answers with optional filter."""
-    query = db.query(Answer).options(
-        joinedload(Answer.question).joinedload(Question.topic),
-        joinedload(Answer.question).joinedload(Question.asker),
-        joinedload(Answer.responder)
-    )
+    """
+    Get answers, oldest first, with cursor pagination.
+    
+    Answers reference their question by `question_id` instead of embedding
+    it; when filtering by `question_id` the question is returned once in
+    `question`. Sends an ETag built from the page's ids and `updated_at`
+    stamps; a matching `If-None-Match` gets 304 without serializing.
+    Each answer's `image_url` points at the `image_size` variant (feed
+    cards by default) once it has been rendered.
+    """
+    answers, next_cursor = await fetch_answer_page(db, question_id, cursor, page_size)
     
-    if question_id is not None:
-        query = query.filter(Answer.question_id == question_id)
+    question = None
+    if question_id is not None and include_question:
+        question = await load_question(db, question_id)
+    
+    etag = make_etag(
+        question_version(question) if question else None,
+        next_cursor,
+        image_size,
+        [answer_row_version(a) for a in answers],
+    )
+    cached = not_modified(request, response, etag, settings.CACHE_CONTROL_ANSWERS)
+    if cached:
+        return cached
     
-    answers = query.all()
-    return answers
+    return json_response(answers_page_dict(
+        answers,
+        question=question,
+        page_size=page_size,
+        next_cursor=next_cursor,
+        image_size=image_size
+    ), response)
 
 
 @router.get("/{answer_id}", response_model=AnswerResponse)
 async def get_answer_by_id(
     answer_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get answer by ID."""
-    answer = db.query(Answer).options(
-        joinedload(Answer.question).joinedload(Question.topic),
-        joinedload(Answer.question).joinedload(Question.asker),
-        joinedload(Answer.responder)
-    ).filter(Answer.id == answer_id).first()
+    """Get answer by ID. Supports If-None-Match / If-Modified-Since."""
+    answer = await _load_answer(db, answer_id)
     if not answer:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Answer not found"
         )
+    
+    # The answer response embeds its question, so both feed the validators
+    cached = not_modified(
+        request,
+        response,
+        make_etag(answer_version(answer), question_version(answer.question)),
+        settings.CACHE_CONTROL_ANSWERS,
+        last_modified=max(
+            answer.updated_at,
+            answer.responder.updated_at,
+            answer.question.updated_at,
+            answer.question.asker.updated_at,
+        ),
+    )
+    if cached:
+        return cached
     return answer
 
 
 @router.post("", response_model=AnswerResponse, status_code=status.HTTP_201_CREATED)
 async def create_answer(
     answer_data: AnswerCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Create a new answer. Requires authentication. responder_id is set from current user."""
+    """
+    Create a new answer. Requires authentication. responder_id is set from current user.
+    
+    Costs three statements: the question lookup (joined to the topic and
+    asker the response embeds), an INSERT ... RETURNING, and the UPDATE
+    that counts the answer on its question.
+    """
     # Verify question exists
-    question = db.query(Question).filter(Question.id == answer_data.question_id).first()
+    question = await load_question(db, answer_data.question_id)
     if not question:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -69,14 +164,22 @@ async def create_answer(
             question_id=answer_data.question_id,
             response=answer_data.response,
             image_url=answer_data.image_url,
-            responder_id=current_user.id
+            responder_id=current_user.id,
+            **await image_variant_columns(db, answer_data.image_url)
         )
         db.add(answer)
-        db.commit()
-        db.refresh(answer)
-        return answer
+        # INSERT ... RETURNING id and timestamps; serialize before commit
+        # expires anything
+        await db.flush()
+        answer_count = await record_answer_added(db, question.id, answer.created_at, question)
+        body = answer_dict(answer, question=question, responder=current_user)
+        await db.commit()
+        if answer_count == 1:
+            # The question just stopped matching answered=false
+            await bump_question_counts()
+        return json_response(body, status_code=status.HTTP_201_CREATED)
     except Exception:
-        db.rollback()
+        await db.rollback()
         raise
 
 
@@ -84,11 +187,18 @@ async def create_answer(
 async def update_answer(
     answer_id: int,
     answer_data: AnswerUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Update an answer. Requires authentication. Only the responder can update."""
-    answer = db.query(Answer).filter(Answer.id == answer_id).first()
+    """
+    Update an answer. Requires authentication. Only the responder can update.
+    
+    Costs the answer lookup (joined to its question) plus an UPDATE ...
+    RETURNING updated_at. Moving the answer to another question adds the
+    new question's lookup and moves the answer between the two questions'
+    counts.
+    """
+    answer = await _load_answer_for_update(db, answer_id)
     if not answer:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -102,42 +212,60 @@ async def update_answer(
             detail="You can only update your own answers"
         )
     
+    question = answer.question
+    previous_question_id = answer.question_id
     try:
-        if answer_data.question_id is not None:
+        if answer_data.question_id is not None and answer_data.question_id != answer.question_id:
             # Verify question exists
-            question = db.query(Question).filter(Question.id == answer_data.question_id).first()
+            question = await load_question(db, answer_data.question_id)
             if not question:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Question not found"
                 )
-            answer.question_id = answer_data.question_id
+            answer.question_id = question.id
         
         if answer_data.response is not None:
             answer.response = answer_data.response
         
-        if answer_data.image_url is not None:
+        if answer_data.image_url is not None and answer_data.image_url != answer.image_url:
             answer.image_url = answer_data.image_url
+            for column, value in (await image_variant_columns(db, answer_data.image_url)).items():
+                setattr(answer, column, value)
         
-        db.commit()
-        db.refresh(answer)
-        return answer
+        await db.flush()
+        answered_changed = False
+        if answer.question_id != previous_question_id:
+            # Each adjustment row-locks its question; take the two in id
+            # order so moves in opposite directions can't deadlock
+            if previous_question_id < question.id:
+                remaining = await record_answer_removed(db, previous_question_id)
+                answer_count = await record_answer_added(db, question.id, answer.created_at, question)
+            else:
+                answer_count = await record_answer_added(db, question.id, answer.created_at, question)
+                remaining = await record_answer_removed(db, previous_question_id)
+            answered_changed = remaining == 0 or answer_count == 1
+        body = answer_dict(answer, question=question, responder=current_user)
+        await db.commit()
+        if answered_changed:
+            await bump_question_counts()
+        return json_response(body)
     except HTTPException:
-        db.rollback()
+        await db.rollback()
         raise
     except Exception:
-        db.rollback()
+        await db.rollback()
         raise
 
 
 @router.delete("/{answer_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_answer(
     answer_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Delete an answer. Requires authentication. Only the responder can delete."""
-    answer = db.query(Answer).filter(Answer.id == answer_id).first()
+    answer = await db.get(Answer, answer_id)
     if not answer:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -152,10 +280,15 @@ async def delete_answer(
         )
     
     try:
-        db.delete(answer)
-        db.commit()
+        await db.delete(answer)
+        await db.flush()
+        remaining = await record_answer_removed(db, answer.question_id)
+        await db.commit()
+        if remaining == 0:
+            # The question is unanswered again
+            await bump_question_counts()
         return None
     except Exception:
-        db.rollback()
+        await db.rollback()
         raise
 
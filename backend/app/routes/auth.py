@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
 from app.models.user import User
 from pydantic import BaseModel
@@ -17,13 +18,13 @@ class DemoLoginResponse(BaseModel):
 
 
 @router.post("/demo-login", response_model=DemoLoginResponse)
-async def demo_login(db: Session = Depends(get_db)):
+async def demo_login(db: AsyncSession = Depends(get_db)):
     """
     Demo login endpoint that returns a JWT token for the demo user.
     This bypasses Auth0 for demo purposes only.
     """
     # Find the demo user
-    demo_user = db.query(User).filter(User.auth0_id == "demo-user-12345").first()
+    demo_user = await db.scalar(select(User).where(User.auth0_id == "demo-user-12345"))
     
     if not demo_user:
         raise HTTPException(
@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, status, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_db
+from app.dependencies import get_current_user
+from app.models.background_job import BackgroundJob
+from app.models.user import User
+from app.schemas.job import JobResponse
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get a background job's status and progress. Requires authentication.
+    
+    `processed` counts rows removed so far out of `total`; poll until
+    `status` is completed, failed, interrupted or abandoned. Reads the primary, since
+    the job updates its row after every batch.
+    """
+    job = await db.get(BackgroundJob, job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    return job
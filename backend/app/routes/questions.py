@@ -1,98 +1,317 @@
-from fastapi import APIRouter, Depends, status, HTTPException, Query
-from sqlalchemy.orm import Session, joinedload
-from typing import List, Optional
-from app.database import get_db
+from fastapi import APIRouter, Depends, status, HTTPException, Query, Request, Response
+from sqlalchemy import func, literal_column, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from typing import List, Literal, Optional, Tuple
+from app.config import settings
+from app.constants import QUESTION_PREVIEW_MAX_LENGTH, QUESTION_PREVIEW_MIN_LENGTH
+from app.database import engine, get_db, get_read_db
 from app.dependencies import get_current_user
+from app.derivatives import image_variant_columns
 from app.models.user import User
 from app.models.question import Question
-from app.models.topic import Topic
+from app.pagination import after_cursor, decode_cursor, encode_cursor
+from app.http_cache import make_etag, not_modified
+from app.queries import (
+    answer_row_version,
+    bump_question_counts,
+    fetch_answer_page,
+    load_question,
+    question_count_cache,
+    question_count_key,
+    question_row_version,
+    question_rows_query,
+    question_version,
+)
 from app.schemas.question import QuestionResponse, QuestionCreate, QuestionUpdate, PaginatedQuestionResponse
+from app.schemas.answer import QuestionFullResponse
+from app.schemas.image import ImageSize
+from app.serializers import json_response, question_dict, question_full_dict, questions_page_dict
+from app.topic_catalog import topic_catalog
 
 router = APIRouter(prefix="/questions", tags=["questions"])
 
+CountStrategy = Literal["exact", "cached", "estimated", "none"]
+
+QuestionSort = Literal["newest", "active", "answers"]
+
+# Descending sort key for each `sort` option, and its cursor value types;
+# every key has a matching (key, id) index
+QUESTION_SORT_KEYS = {
+    "newest": ((Question.created_at, Question.id), (datetime, int)),
+    "active": ((Question.last_activity_at, Question.id), (datetime, int)),
+    "answers": ((Question.answer_count, Question.id), (int, int)),
+}
+
+# Rendered with a literal 0 rather than a bound parameter, so the planner
+# can match ix_questions_unanswered_created_at_id's predicate even in a
+# generic plan for a prepared statement
+UNANSWERED = Question.answer_count == literal_column("0")
+
+async def _count_questions(
+    db: AsyncSession,
+    strategy: CountStrategy,
+    conditions: list,
+    filter_key: tuple,
+) -> Tuple[Optional[int], bool]:
+    """
+    Count questions matching the filters using the requested strategy.
+
+    Returns:
+        (total, is_estimate); total is None for the "none" strategy.
+    """
+    if strategy == "none":
+        return None, False
+    
+    if strategy == "estimated":
+        if not conditions and engine.dialect.name == "postgresql":
+            # Planner statistics: free, but only as fresh as the last ANALYZE
+            estimate = await db.scalar(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'questions'::regclass")
+            )
+            if estimate is not None and estimate >= 0:
+                return estimate, True
+        # Filtered lists have no planner estimate; a cached count is the next cheapest
+        strategy = "cached"
+    
+    if strategy == "cached":
+        cache_key = await question_count_key(filter_key)
+        total = await question_count_cache.get(cache_key)
+        if total is not None:
+            return total, False
+    
+    total = await db.scalar(
+        select(func.count()).select_from(Question).where(*conditions)
+    )
+    if strategy == "cached":
+        await question_count_cache.set(cache_key, total, ttl=settings.QUESTION_COUNT_CACHE_TTL_SECONDS)
+    return total, False
+
 
 @router.get("", response_model=PaginatedQuestionResponse)
 async def get_all_questions(
+    request: Request,
+    response: Response,
     topic_id: Optional[int] = Query(None, description="Filter by topic ID"),
     asker_id: Optional[int] = Query(None, description="Filter by asker ID"),
     search: Optional[str] = Query(None, description="Search questions by text"),
-    page: int = Query(1, ge=1, description="Page number (starts at 1)"),
+    answered: Optional[bool] = Query(None, description="Only questions with (true) or without (false) answers"),
+    sort: QuestionSort = Query("newest", description="Order: newest, active (latest answer first) or answers (most answered first)"),
+    pagination: Literal["offset", "cursor"] = Query("offset", description="Pagination mode"),
+    page: int = Query(1, ge=1, description="Page number (starts at 1, offset mode only)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (cursor mode only)"),
     page_size: int = Query(10, ge=1, le=100, description="Items per page (max 100)"),
-    db: Session = Depends(get_db)
+    preview: Optional[int] = Query(
+        None, ge=QUESTION_PREVIEW_MIN_LENGTH, le=QUESTION_PREVIEW_MAX_LENGTH,
+        description="Truncate each ask to this many characters (feed cards)"
+    ),
+    count: CountStrategy = Query(
+        settings.QUESTIONS_COUNT_STRATEGY,
+        description="How to compute total: exact, cached, estimated (planner statistics) or none"
+    ),
+    image_size: ImageSize = Query(
+        settings.IMAGE_LIST_VARIANT,
+        description="Image variant returned in image_url: thumb, card, full or original"
+    ),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
-    Get all questions with optional filters and pagination.
+    Get all questions with optional filters, sorting and pagination.
     
     - **topic_id**: Filter by topic
     - **asker_id**: Filter by question author
     - **search**: Search questions by text content
+    - **answered**: `false` lists unanswered questions, `true` answered ones
+    - **sort**: `newest` (by creation), `active` (by `last_activity_at`, the
+      newest answer or else creation) or `answers` (by `answer_count`);
+      always descending, ties broken by id
+    - **pagination**: `offset` (page numbers) or `cursor` (keyset; constant cost at any depth)
     - **page**: Page number (starts at 1)
+    - **cursor**: Opaque cursor returned as `next_cursor`; omit for the first page
     - **page_size**: Number of items per page (max 100)
-    """
-    # Base query with relationships
-    query = db.query(Question).options(
-        joinedload(Question.topic),
-        joinedload(Question.asker)
-    )
+    - **preview**: Return only the first N characters of each `ask`
+      (`ask_truncated` marks shortened items); the full text is read
+      through GET /questions/{id}
+    - **count**: `exact` runs COUNT(*); `cached` reuses a recent count for the same filters;
+      `estimated` uses planner statistics for unfiltered lists; `none` skips counting
+      (use `has_more` to drive "load more")
+    - **image_size**: Which resized variant `image_url` points at (feed cards
+      by default); falls back to the original until variants are rendered.
+      All variants are listed in `image_variants`
     
+    Sends an ETag derived from the page's ids and `updated_at` stamps;
+    a matching `If-None-Match` gets 304 without serializing the page.
+    Rows are selected as flat column tuples (no ORM entities) and
+    serialized once.
+    """
     # Apply filters
+    conditions = []
     if topic_id is not None:
-        query = query.filter(Question.topic_id == topic_id)
+        conditions.append(Question.topic_id == topic_id)
     
     if asker_id is not None:
-        query = query.filter(Question.asker_id == asker_id)
+        conditions.append(Question.asker_id == asker_id)
     
-    if search is not None and search.strip():
-        search_term = f"%{search.strip()}%"
-        query = query.filter(Question.ask.ilike(search_term))
+    search_text = search.strip() if search else ""
+    if search_text:
+        search_term = f"%{search_text}%"
+        conditions.append(Question.ask.ilike(search_term))
     
-    # Get total count before pagination
-    total = query.count()
+    # Denormalized answer_count (see app.question_activity), so no join to answers
+    if answered is False:
+        conditions.append(UNANSWERED)
+    elif answered:
+        conditions.append(Question.answer_count > 0)
     
-    # Apply pagination
-    offset = (page - 1) * page_size
-    questions = query.offset(offset).limit(page_size).all()
+    total, total_is_estimate = await _count_questions(
+        db, count, conditions, (topic_id, asker_id, search_text, answered)
+    )
+    
+    # Projected columns only, in a deterministic order
+    sort_columns, cursor_types = QUESTION_SORT_KEYS[sort]
+    query = question_rows_query(preview).where(*conditions).order_by(
+        *(column.desc() for column in sort_columns)
+    )
     
     # Calculate total pages
-    total_pages = (total + page_size - 1) // page_size if total > 0 else 1
+    total_pages = None
+    if total is not None:
+        total_pages = (total + page_size - 1) // page_size if total > 0 else 1
+    
+    if pagination == "cursor":
+        if cursor:
+            query = query.where(
+                after_cursor(sort_columns, decode_cursor(cursor, *cursor_types))
+            )
+        
+        # Fetch one extra row to learn whether another page exists
+        rows = (await db.execute(query.limit(page_size + 1))).all()
+        questions = rows[:page_size]
+        next_cursor = None
+        if len(rows) > page_size:
+            last = questions[-1]
+            next_cursor = encode_cursor(*(getattr(last, column.key) for column in sort_columns))
+        
+        etag = make_etag(total, total_is_estimate, next_cursor, image_size, [question_row_version(q) for q in questions])
+        cached = not_modified(request, response, etag, settings.CACHE_CONTROL_QUESTIONS)
+        if cached:
+            return cached
+        
+        return json_response(questions_page_dict(
+            questions,
+            total=total,
+            total_is_estimate=total_is_estimate,
+            page=None,
+            page_size=page_size,
+            total_pages=total_pages,
+            has_more=next_cursor is not None,
+            next_cursor=next_cursor,
+            image_size=image_size
+        ), response)
+    
+    # Apply pagination, fetching one extra row to learn whether another page exists
+    offset = (page - 1) * page_size
+    rows = (await db.execute(query.offset(offset).limit(page_size + 1))).all()
+    questions = rows[:page_size]
+    has_more = len(rows) > page_size
+    
+    etag = make_etag(total, total_is_estimate, has_more, image_size, [question_row_version(q) for q in questions])
+    cached = not_modified(request, response, etag, settings.CACHE_CONTROL_QUESTIONS)
+    if cached:
+        return cached
     
-    return PaginatedQuestionResponse(
-        items=questions,
+    return json_response(questions_page_dict(
+        questions,
         total=total,
+        total_is_estimate=total_is_estimate,
         page=page,
         page_size=page_size,
-        total_pages=total_pages
-    )
+        total_pages=total_pages,
+        has_more=has_more,
+        image_size=image_size
+    ), response)
 
 
 @router.get("/{question_id}", response_model=QuestionResponse)
 async def get_question_by_id(
     question_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get question by ID."""
-    question = db.query(Question).options(
-        joinedload(Question.topic),
-        joinedload(Question.asker)
-    ).filter(Question.id == question_id).first()
+    """Get question by ID. Supports If-None-Match / If-Modified-Since."""
+    question = await load_question(db, question_id)
     if not question:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Question not found"
         )
+    
+    cached = not_modified(
+        request,
+        response,
+        make_etag(question_version(question)),
+        settings.CACHE_CONTROL_QUESTIONS,
+        last_modified=max(question.updated_at, question.asker.updated_at),
+    )
+    if cached:
+        return cached
     return question
 
 
+@router.get("/{question_id}/full", response_model=QuestionFullResponse)
+async def get_question_full(
+    question_id: int,
+    request: Request,
+    response: Response,
+    answers_cursor: Optional[str] = Query(None, description="answers_next_cursor from the previous response"),
+    answers_page_size: int = Query(20, ge=1, le=100, description="Answers per page (max 100)"),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Get a question with its topic, asker and a page of answers in one call.
+    
+    Runs two queries regardless of answer count: the question joined to its
+    topic and asker, then one page of answers joined to their responders.
+    The question is serialized once; answers reference it by id.
+    """
+    question = await load_question(db, question_id)
+    if not question:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Question not found"
+        )
+    
+    answers, next_cursor = await fetch_answer_page(db, question_id, answers_cursor, answers_page_size)
+    
+    etag = make_etag(question_version(question), next_cursor, [answer_row_version(a) for a in answers])
+    cached = not_modified(request, response, etag, settings.CACHE_CONTROL_QUESTIONS)
+    if cached:
+        return cached
+    
+    return json_response(question_full_dict(
+        question,
+        answers,
+        answers_page_size=answers_page_size,
+        answers_next_cursor=next_cursor
+    ), response)
+
+
 @router.post("", response_model=QuestionResponse, status_code=status.HTTP_201_CREATED)
 async def create_question(
     question_data: QuestionCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Create a new question. Requires authentication. asker_id is set from current user."""
+    """
+    Create a new question. Requires authentication. asker_id is set from current user.
+    
+    Costs a single INSERT ... RETURNING: the topic comes from the topics
+    catalog and the asker is the current user, so nothing is reloaded.
+    """
     # Verify topic exists
-    topic = db.query(Topic).filter(Topic.id == question_data.topic_id).first()
-    if not topic:
+    topic = await topic_catalog.get(db, question_data.topic_id)
+    if topic is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Topic not found"
@@ -103,14 +322,19 @@ async def create_question(
             topic_id=question_data.topic_id,
             ask=question_data.ask,
             image_url=question_data.image_url,
-            asker_id=current_user.id
+            asker_id=current_user.id,
+            **await image_variant_columns(db, question_data.image_url)
         )
         db.add(question)
-        db.commit()
-        db.refresh(question)
-        return question
+        # INSERT ... RETURNING id and timestamps; serialize before commit
+        # expires anything
+        await db.flush()
+        body = question_dict(question, topic=topic, asker=current_user)
+        await db.commit()
+        await bump_question_counts()
+        return json_response(body, status_code=status.HTTP_201_CREATED)
     except Exception:
-        db.rollback()
+        await db.rollback()
         raise
 
 
@@ -118,11 +342,17 @@ async def create_question(
 async def update_question(
     question_id: int,
     question_data: QuestionUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Update a question. Requires authentication. Only the asker can update."""
-    question = db.query(Question).filter(Question.id == question_id).first()
+    """
+    Update a question. Requires authentication. Only the asker can update.
+    
+    Costs the ownership lookup plus an UPDATE ... RETURNING updated_at;
+    the response is built from the row in hand, the catalog topic and the
+    current user.
+    """
+    question = await db.get(Question, question_id)
     if not question:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -139,8 +369,7 @@ async def update_question(
     try:
         if question_data.topic_id is not None:
             # Verify topic exists
-            topic = db.query(Topic).filter(Topic.id == question_data.topic_id).first()
-            if not topic:
+            if not await topic_catalog.exists(db, question_data.topic_id):
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Topic not found"
@@ -150,28 +379,37 @@ async def update_question(
         if question_data.ask is not None:
             question.ask = question_data.ask
         
-        if question_data.image_url is not None:
+        if question_data.image_url is not None and question_data.image_url != question.image_url:
             question.image_url = question_data.image_url
+            for column, value in (await image_variant_columns(db, question_data.image_url)).items():
+                setattr(question, column, value)
         
-        db.commit()
-        db.refresh(question)
-        return question
+        await db.flush()
+        body = question_dict(
+            question,
+            topic=await topic_catalog.get(db, question.topic_id),
+            asker=current_user
+        )
+        await db.commit()
+        if question_data.topic_id is not None or question_data.ask is not None:
+            await bump_question_counts()
+        return json_response(body)
     except HTTPException:
-        db.rollback()
+        await db.rollback()
         raise
     except Exception:
-        db.rollback()
+        await db.rollback()
         raise
 
 
 @router.delete("/{question_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_question(
     question_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Delete a question. Requires authentication. Only the asker can delete."""
-    question = db.query(Question).filter(Question.id == question_id).first()
+    question = await db.get(Question, question_id)
     if not question:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -186,10 +424,11 @@ async def delete_question(
         )
     
     try:
-        db.delete(question)
-        db.commit()
+        await db.delete(question)
+        await db.commit()
+        await bump_question_counts()
         return None
     except Exception:
-        db.rollback()
+        await db.rollback()
         raise
 
@@ -0,0 +1,198 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import func, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from typing import Optional
+from app.constants import (
+    SEARCH_ANSWER_RANK_WEIGHT,
+    SEARCH_SNIPPETS_PER_QUESTION,
+    SEARCH_TEXT_CONFIG,
+    SUGGEST_MIN_QUESTION_TERM_LENGTH,
+    SUGGEST_QUESTION_CANDIDATES,
+    SUGGEST_TITLE_LENGTH,
+)
+from app.database import get_read_db
+from app.models.answer import Answer
+from app.models.question import Question
+from app.schemas.search import (
+    QuestionSuggestion,
+    SearchAnswerSnippet,
+    SearchQuestionHit,
+    SearchResponse,
+    SuggestResponse,
+    TopicSuggestion,
+)
+from app.topic_catalog import topic_catalog
+from app.validators import escape_like
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+QUESTION_HEADLINE_OPTIONS = "MaxWords=35, MinWords=15, HighlightAll=FALSE"
+ANSWER_SNIPPET_OPTIONS = "MaxWords=30, MinWords=10, MaxFragments=2"
+
+
+@router.get("", response_model=SearchResponse)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200, description="Search terms (web search syntax)"),
+    topic_id: Optional[int] = Query(None, description="Restrict to a topic"),
+    limit: int = Query(20, ge=1, le=50, description="Questions per page (max 50)"),
+    offset: int = Query(0, ge=0, le=1000, description="Questions to skip"),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Full-text search over questions and answers.
+    
+    Questions are ranked by how well their text matches, plus a weighted
+    bonus for their best matching answer. Each hit includes a highlighted
+    headline and up to a few matching answer snippets.
+    
+    - **q**: Search terms; supports "quoted phrases", `or` and `-exclusions`
+    - **topic_id**: Restrict results to one topic
+    - **limit** / **offset**: Page through results
+    """
+    tsquery = func.websearch_to_tsquery(SEARCH_TEXT_CONFIG, q)
+    
+    # Rank question matches and answer matches separately so each side can
+    # use its own GIN index, then merge them per question.
+    question_hits = select(
+        Question.id.label("question_id"),
+        func.ts_rank_cd(Question.ask_tsv, tsquery).label("rank")
+    ).where(Question.ask_tsv.op("@@")(tsquery))
+    
+    answer_hits = select(
+        Answer.question_id.label("question_id"),
+        (func.max(func.ts_rank_cd(Answer.response_tsv, tsquery)) * SEARCH_ANSWER_RANK_WEIGHT).label("rank")
+    ).where(Answer.response_tsv.op("@@")(tsquery)).group_by(Answer.question_id)
+    
+    if topic_id is not None:
+        question_hits = question_hits.where(Question.topic_id == topic_id)
+        answer_hits = answer_hits.join(Question, Question.id == Answer.question_id).where(
+            Question.topic_id == topic_id
+        )
+    
+    hits = union_all(question_hits, answer_hits).subquery()
+    score = func.sum(hits.c.rank).label("score")
+    ranked = (
+        await db.execute(
+            select(hits.c.question_id, score)
+            .group_by(hits.c.question_id)
+            .order_by(score.desc(), hits.c.question_id.desc())
+            .limit(limit + 1)
+            .offset(offset)
+        )
+    ).all()
+    
+    has_more = len(ranked) > limit
+    ranked = ranked[:limit]
+    question_ids = [row.question_id for row in ranked]
+    if not question_ids:
+        return SearchResponse(query=q, items=[], limit=limit, offset=offset, has_more=False)
+    
+    # Load the page of questions with their highlighted headlines
+    headline = func.ts_headline(SEARCH_TEXT_CONFIG, Question.ask, tsquery, QUESTION_HEADLINE_OPTIONS)
+    question_rows = (
+        await db.execute(
+            select(Question, headline.label("headline"))
+            .options(joinedload(Question.topic), joinedload(Question.asker))
+            .where(Question.id.in_(question_ids))
+        )
+    ).all()
+    questions = {row.Question.id: row for row in question_rows}
+    
+    # Best matching answers per question on this page; ts_headline only runs on those
+    answer_rank = func.ts_rank_cd(Answer.response_tsv, tsquery)
+    top_answers = (
+        select(
+            Answer.id,
+            Answer.question_id,
+            Answer.responder_id,
+            Answer.response,
+            func.row_number().over(
+                partition_by=Answer.question_id,
+                order_by=(answer_rank.desc(), Answer.id.desc())
+            ).label("position")
+        )
+        .where(Answer.question_id.in_(question_ids), Answer.response_tsv.op("@@")(tsquery))
+        .subquery()
+    )
+    snippet_rows = (
+        await db.execute(
+            select(
+                top_answers.c.id,
+                top_answers.c.question_id,
+                top_answers.c.responder_id,
+                func.ts_headline(
+                    SEARCH_TEXT_CONFIG, top_answers.c.response, tsquery, ANSWER_SNIPPET_OPTIONS
+                ).label("snippet")
+            )
+            .where(top_answers.c.position <= SEARCH_SNIPPETS_PER_QUESTION)
+            .order_by(top_answers.c.question_id, top_answers.c.position)
+        )
+    ).all()
+    snippets: dict[int, list[SearchAnswerSnippet]] = {}
+    for row in snippet_rows:
+        snippets.setdefault(row.question_id, []).append(
+            SearchAnswerSnippet(id=row.id, responder_id=row.responder_id, snippet=row.snippet)
+        )
+    
+    items = [
+        SearchQuestionHit(
+            question=questions[row.question_id].Question,
+            headline=questions[row.question_id].headline,
+            score=row.score,
+            answers=snippets.get(row.question_id, []),
+        )
+        for row in ranked
+        if row.question_id in questions
+    ]
+    return SearchResponse(query=q, items=items, limit=limit, offset=offset, has_more=has_more)
+
+
+@router.get("/suggest", response_model=SuggestResponse)
+async def suggest(
+    q: str = Query(..., min_length=1, max_length=100, description="Partial search text"),
+    limit: int = Query(8, ge=1, le=20, description="Suggestions per kind (max 20)"),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Typeahead suggestions for the search box.
+    
+    Returns question ids with a truncated title (found through the pg_trgm
+    GIN index, best word match among the first candidates first) and
+    matching topic names (from the in-memory topics catalog, prefix matches
+    first). No
+    asker/topic objects are joined, so the payload stays small enough to
+    call on every keystroke. Questions are only suggested once the term is
+    long enough for the trigram index.
+    """
+    term = q.strip()
+    if not term:
+        return SuggestResponse(questions=[], topics=[])
+    pattern = f"%{escape_like(term)}%"
+    
+    await topic_catalog.ensure_fresh(db)
+    topic_rows = topic_catalog.match(term, limit)
+    
+    question_rows = []
+    if len(term) >= SUGGEST_MIN_QUESTION_TERM_LENGTH:
+        # The GIN index finds matches but can't return them by similarity,
+        # so only a bounded set of them is scored and sorted: a common term
+        # costs the same as a rare one
+        candidates = (
+            select(Question.id, Question.ask)
+            .where(Question.ask.ilike(pattern, escape="\\"))
+            .limit(SUGGEST_QUESTION_CANDIDATES)
+            .subquery()
+        )
+        question_rows = (
+            await db.execute(
+                select(candidates.c.id, func.left(candidates.c.ask, SUGGEST_TITLE_LENGTH).label("title"))
+                .order_by(func.word_similarity(term, candidates.c.ask).desc(), candidates.c.id.desc())
+                .limit(limit)
+            )
+        ).all()
+    
+    return SuggestResponse(
+        questions=[QuestionSuggestion(id=row.id, title=row.title) for row in question_rows],
+        topics=[TopicSuggestion(id=row.id, name=row.name) for row in topic_rows],
+    )
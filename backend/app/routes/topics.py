@@ -1,44 +1,70 @@
-from fastapi import APIRouter, Depends, status, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, Request, Response, status, HTTPException
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
-from typing import List
-from app.database import get_db
+from typing import List, Optional
+from app.config import settings
+from app.database import get_db, get_read_db
 from app.dependencies import get_current_user
+from app.http_cache import cache_headers, etag_matches
+from app.jobs import JOB_DELETE_TOPIC, count_topic_rows, find_unfinished_job, start_topic_deletion
+from app.models.background_job import BackgroundJob
 from app.models.user import User
 from app.models.topic import Topic
+from app.queries import bump_question_counts
+from app.schemas.job import JobResponse
 from app.schemas.topic import TopicResponse, TopicCreate, TopicUpdate
+from app.serializers import json_response, topic_dict
+from app.topic_catalog import bump_topics_version, topic_catalog
 
 router = APIRouter(prefix="/topics", tags=["topics"])
 
 
+def _catalog_response(request: Request, body: bytes, etag: str) -> Response:
+    """Pre-serialized catalog JSON, or 304 if the client's copy is current."""
+    headers = cache_headers(etag, settings.CACHE_CONTROL_TOPICS)
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @router.get("", response_model=List[TopicResponse])
 async def get_all_topics(
-    db: Session = Depends(get_db)
+    request: Request,
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get all topics."""
-    topics = db.query(Topic).all()
-    return topics
+    """
+    Get all topics.
+    
+    Served from the in-memory topics catalog as pre-serialized JSON with a
+    precomputed ETag; the database is only touched for the periodic
+    version check.
+    """
+    await topic_catalog.ensure_fresh(db)
+    return _catalog_response(request, topic_catalog.list_json, topic_catalog.list_etag)
 
 
 @router.get("/{topic_id}", response_model=TopicResponse)
 async def get_topic_by_id(
     topic_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get topic by ID."""
-    topic = db.query(Topic).filter(Topic.id == topic_id).first()
-    if not topic:
+    """Get topic by ID (served from the topics catalog)."""
+    if not await topic_catalog.exists(db, topic_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Topic not found"
         )
-    return topic
+    return _catalog_response(
+        request, topic_catalog.item_json[topic_id], topic_catalog.item_etags[topic_id]
+    )
 
 
 @router.post("", response_model=TopicResponse, status_code=status.HTTP_201_CREATED)
 async def create_topic(
     topic_data: TopicCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Create a new topic. Requires authentication."""
@@ -48,17 +74,21 @@ async def create_topic(
             image_url=topic_data.image_url
         )
         db.add(topic)
-        db.commit()
-        db.refresh(topic)
-        return topic
+        # INSERT ... RETURNING id
+        await db.flush()
+        body = topic_dict(topic)
+        await bump_topics_version(db)
+        await db.commit()
+        topic_catalog.invalidate()
+        return json_response(body, status_code=status.HTTP_201_CREATED)
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Topic name already exists"
         )
     except Exception:
-        db.rollback()
+        await db.rollback()
         raise
 
 
@@ -66,11 +96,11 @@ async def create_topic(
 async def update_topic(
     topic_id: int,
     topic_data: TopicUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Update a topic. Requires authentication."""
-    topic = db.query(Topic).filter(Topic.id == topic_id).first()
+    topic = await db.get(Topic, topic_id)
     if not topic:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -82,39 +112,97 @@ async def update_topic(
             topic.name = topic_data.name
         if topic_data.image_url is not None:
             topic.image_url = topic_data.image_url
-        db.commit()
-        db.refresh(topic)
-        return topic
+        # Topics have no server-side defaults; the row in hand is current
+        body = topic_dict(topic)
+        await bump_topics_version(db)
+        await db.commit()
+        topic_catalog.invalidate()
+        return json_response(body)
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Topic name already exists"
         )
     except Exception:
-        db.rollback()
+        await db.rollback()
         raise
 
 
-@router.delete("/{topic_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/{topic_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={status.HTTP_202_ACCEPTED: {"model": JobResponse, "description": "Deletion started as a background job"}}
+)
 async def delete_topic(
     topic_id: int,
-    db: Session = Depends(get_db),
+    response: Response,
+    background: Optional[bool] = Query(
+        None,
+        description="Force (true) or prevent (false) a background job; by default large topics use one"
+    ),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Delete a topic. Requires authentication."""
-    topic = db.query(Topic).filter(Topic.id == topic_id).first()
-    if not topic:
+    """
+    Delete a topic with its questions and answers. Requires authentication.
+    
+    Small topics are deleted in one statement; the database cascades to
+    questions and answers without loading them. Topics with more than
+    TOPIC_DELETE_INLINE_MAX_ROWS questions and answers together are deleted
+    by a batched background job instead: the response is 202 with the job, and
+    GET /jobs/{id} reports progress. Repeating the request while a job is
+    running returns that job; a job whose worker died (no progress for
+    JOB_STALE_AFTER_SECONDS) is abandoned and a new one started.
+    """
+    if not await topic_catalog.exists(db, topic_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Topic not found"
         )
     
+    job = await find_unfinished_job(db, JOB_DELETE_TOPIC, topic_id)
+    if job is None and background is None:
+        # Answers count too: the cascade deletes them in this transaction
+        limit = settings.TOPIC_DELETE_INLINE_MAX_ROWS
+        background = await count_topic_rows(db, topic_id, limit) > limit
+    
+    if job is not None or background:
+        if job is None:
+            job = BackgroundJob(
+                kind=JOB_DELETE_TOPIC,
+                target_id=topic_id,
+                requested_by_id=current_user.id
+            )
+            db.add(job)
+            try:
+                await db.flush()
+            except IntegrityError:
+                # A concurrent request started a job first; report that one
+                await db.rollback()
+                job = await find_unfinished_job(db, JOB_DELETE_TOPIC, topic_id)
+                if job is None:
+                    raise HTTPException(
+                        status_code=status.HTTP_409_CONFLICT,
+                        detail="Topic deletion is already being started; try again"
+                    )
+                body = JobResponse.model_validate(job).model_dump()
+            else:
+                body = JobResponse.model_validate(job).model_dump()
+                await db.commit()
+                start_topic_deletion(job.id, topic_id)
+        else:
+            body = JobResponse.model_validate(job).model_dump()
+        response.headers["Location"] = f"/jobs/{body['id']}"
+        return json_response(body, response, status_code=status.HTTP_202_ACCEPTED)
+    
     try:
-        db.delete(topic)
-        db.commit()
+        await db.execute(delete(Topic).where(Topic.id == topic_id))
+        await bump_topics_version(db)
+        await db.commit()
+        topic_catalog.invalidate()
+        await bump_question_counts()
         return None
     except Exception:
-        db.rollback()
+        await db.rollback()
         raise
-
@@ -1,20 +1,24 @@
 import os
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status
-from typing import Dict
-import cloudinary
-import cloudinary.uploader
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from typing import BinaryIO, Dict, Optional
+from app.config import settings
+from app.constants import IMAGE_SNIFF_BYTES
+from app.database import get_db
 from app.dependencies import get_current_user
+from app.derivatives import derivative_pipeline, needs_derivatives
+from app.exceptions import ConfigurationError
+from app.models.stored_image import StoredImage
 from app.models.user import User
+from app.storage import StorageBackend, get_storage_backend, sha256_stream
+from app.upload_pool import UploadPoolSaturated, upload_pool
+from app.validators import sniff_image_type
 
 router = APIRouter(prefix="/upload", tags=["upload"])
 
-# Configure Cloudinary
-cloudinary.config(
-    cloud_name=os.getenv("CLOUDINARY_CLOUD_NAME"),
-    api_key=os.getenv("CLOUDINARY_API_KEY"),
-    api_secret=os.getenv("CLOUDINARY_API_SECRET")
-)
-
 # Image Upload Limits and Constraints
 # Maximum file size allowed per image (5MB)
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB in bytes
@@ -29,28 +33,74 @@ ALLOWED_IMAGE_TYPES = {
     "image/webp"
 }
 
-# Allowed image file extensions (for additional validation)
-ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
-
 # User-friendly format names for error messages
 ALLOWED_FORMATS_DISPLAY = "JPEG, PNG, GIF, WebP"
 
 
+def get_storage() -> StorageBackend:
+    """
+    Storage backend for uploads. Override this dependency to store into a
+    fake or local backend in tests.
+    """
+    try:
+        return get_storage_backend()
+    except ConfigurationError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Upload service not configured"
+        )
+
+
+async def _find_stored_image(db: AsyncSession, backend: str, digest: str) -> Optional[StoredImage]:
+    return await db.scalar(
+        select(StoredImage).where(StoredImage.backend == backend, StoredImage.sha256 == digest)
+    )
+
+
+def _read_upload(stream: BinaryIO) -> bytes:
+    stream.seek(0)
+    return stream.read()
+
+
+async def _schedule_derivatives(file: UploadFile, digest: str, url: str, storage: StorageBackend) -> None:
+    """Hand the upload's bytes to the background derivative pipeline."""
+    if derivative_pipeline.is_pending(storage.name, digest):
+        return
+    # The renderer needs the whole image, so this is the one full read
+    data = await run_in_threadpool(_read_upload, file.file)
+    derivative_pipeline.schedule(data, digest, url, storage)
+
+
 @router.post("/image", response_model=Dict[str, str])
 async def upload_image(
     file: UploadFile = File(...),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    storage: StorageBackend = Depends(get_storage),
+    db: AsyncSession = Depends(get_db)
 ):
     """
-    Upload an image to Cloudinary.
+    Upload an image to the configured storage backend.
     
     Enforces the following limits:
-    - Maximum file size: 5MB
-    - Allowed formats: JPEG, PNG, GIF, WebP
+    - Maximum file size: 5MB (oversized request bodies are cut off while
+      streaming by BodySizeLimitMiddleware, before they are buffered)
+    - Allowed formats: JPEG, PNG, GIF, WebP, identified from the file's
+      leading bytes rather than the client's filename or content type
     - Maximum count: 1 image per upload
     
+    Hashing and storing stream the spooled temporary file the multipart
+    parser wrote (memory up to 1MB, then disk) rather than buffering it.
+    Files are content-addressed by SHA-256; bytes that were stored before
+    return the existing URL without another transfer. New files are
+    uploaded on a bounded upload pool; when the pool is saturated the
+    request fails fast with 503 and a Retry-After header. Resized WebP
+    derivatives (thumb, card, full) are rendered afterwards in the
+    background, which reads the file (at most 5MB) into memory once for
+    the render; re-uploads of stored bytes only render again if no render
+    has finished or a failed one has attempts left. See app.derivatives.
+    
     Requires authentication.
-    Returns the Cloudinary URL.
+    Returns the stored image URL.
     """
     # Validate filename exists
     if not file.filename:
@@ -59,52 +109,85 @@ async def upload_image(
             detail="No file provided"
         )
     
-    # Validate file extension
-    file_ext = os.path.splitext(file.filename)[1].lower()
-    if file_ext not in ALLOWED_EXTENSIONS:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid file format. Please upload a {ALLOWED_FORMATS_DISPLAY} image."
-        )
+    # Identify the format from the magic bytes
+    header = await file.read(IMAGE_SNIFF_BYTES)
     
-    # Validate MIME type
-    if file.content_type not in ALLOWED_IMAGE_TYPES:
+    # Validate file is not empty
+    if not header:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid file type detected. Please upload a {ALLOWED_FORMATS_DISPLAY} image."
+            detail="The uploaded file is empty. Please select a valid image."
         )
     
-    # Read file content
-    contents = await file.read()
-    
-    # Validate file is not empty
-    if len(contents) == 0:
+    content_type = sniff_image_type(header)
+    if content_type not in ALLOWED_IMAGE_TYPES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="The uploaded file is empty. Please select a valid image."
+            detail=f"Invalid file type detected. Please upload a {ALLOWED_FORMATS_DISPLAY} image."
         )
     
-    # Validate file size
-    file_size_mb = len(contents) / (1024 * 1024)
-    if len(contents) > MAX_FILE_SIZE:
+    # Validate file size (the body limit leaves room for multipart framing)
+    file_size = file.size
+    if file_size is None:
+        file.file.seek(0, os.SEEK_END)
+        file_size = file.file.tell()
+    if file_size > MAX_FILE_SIZE:
+        file_size_mb = file_size / (1024 * 1024)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"File too large: {file_size_mb:.1f}MB exceeds the {MAX_FILE_SIZE_MB}MB limit."
         )
     
-    try:
-        # Upload to Cloudinary
-        result = cloudinary.uploader.upload(
-            contents,
-            folder="questionaura",
-            resource_type="image"
-        )
-        
+    # Content address; reading the spooled file is blocking I/O
+    digest = await run_in_threadpool(sha256_stream, file.file)
+    
+    existing = await _find_stored_image(db, storage.name, digest)
+    if existing:
+        if needs_derivatives(existing):
+            # An earlier render was skipped or failed; try again
+            await _schedule_derivatives(file, digest, existing.url, storage)
         return {
-            "url": result["secure_url"]
+            "url": existing.url
         }
+    
+    try:
+        # Upload off the event loop
+        url = await upload_pool.run(storage.save, file.file, digest, content_type)
+    except UploadPoolSaturated:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many uploads in progress. Please try again shortly.",
+            headers={"Retry-After": str(settings.UPLOAD_RETRY_AFTER_SECONDS)}
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to upload image: {str(e)}"
         )
+    
+    try:
+        db.add(StoredImage(
+            sha256=digest,
+            backend=storage.name,
+            url=url,
+            content_type=content_type,
+            size_bytes=file_size,
+            uploaded_by_id=current_user.id
+        ))
+        await db.commit()
+    except IntegrityError:
+        # The same bytes were uploaded concurrently; keep the first row
+        # (its upload renders the derivatives)
+        await db.rollback()
+        existing = await _find_stored_image(db, storage.name, digest)
+        if existing:
+            url = existing.url
+    except Exception:
+        await db.rollback()
+        raise
+    else:
+        await _schedule_derivatives(file, digest, url, storage)
+    
+    return {
+        "url": url
+    }
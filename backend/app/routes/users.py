@@ -1,14 +1,19 @@
 from fastapi import APIRouter, Depends, status, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from app.database import get_db
 from app.auth import verify_token
-from app.dependencies import get_current_user
+from app.dependencies import get_cached_user, get_current_user, remember_user, snapshot_user
 from app.models.user import User
 from app.schemas.user import UserResponse, UserCreate
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+# Profile fields /users/sync copies from the identity provider
+SYNCED_USER_FIELDS = ("email", "first_name", "last_name")
+
 
 @router.get("/me", response_model=UserResponse)
 async def get_user_profile(current_user: User = Depends(get_current_user)):
@@ -19,12 +24,19 @@ async def get_user_profile(current_user: User = Depends(get_current_user)):
 @router.post("/sync", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def sync_user(
     user_data: UserCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     payload: dict = Depends(verify_token)
 ):
     """
     Sync or create user from Auth0 authentication.
     Requires user data in request body including first_name and last_name.
+    
+    A login whose profile matches the cached user row returns without
+    touching the database. Otherwise a single INSERT ... ON CONFLICT
+    (auth0_id) DO UPDATE ... RETURNING creates or updates the row; the
+    update only fires when a field actually changed, so repeat logins
+    don't rewrite the row or bump updated_at. Concurrent first logins
+    resolve to the same row instead of failing.
     """
     # Security: Ensure token matches the user being synced
     if user_data.auth0_id != payload["sub"]:
@@ -33,31 +45,32 @@ async def sync_user(
             detail="Invalid authentication credentials"
         )
 
+    profile = {field: getattr(user_data, field) for field in SYNCED_USER_FIELDS}
+    
+    # Fast path: nothing changed since the row was cached
+    cached = await get_cached_user(user_data.auth0_id)
+    if cached is not None and all(getattr(cached, field) == value for field, value in profile.items()):
+        return cached
+
+    insert = pg_insert(User).values(auth0_id=user_data.auth0_id, **profile)
+    upsert = insert.on_conflict_do_update(
+        index_elements=[User.auth0_id],
+        set_={**{field: insert.excluded[field] for field in SYNCED_USER_FIELDS}, "updated_at": func.now()},
+        where=or_(*(
+            getattr(User, field).is_distinct_from(insert.excluded[field]) for field in SYNCED_USER_FIELDS
+        )),
+    ).returning(User)
+
     try:
-        # Check if user exists by auth0_id
-        user = db.query(User).filter(User.auth0_id == user_data.auth0_id).first()
-        
-        if not user:
-            # Create new user
-            user = User(
-                auth0_id=user_data.auth0_id,
-                first_name=user_data.first_name,
-                last_name=user_data.last_name,
-                email=user_data.email
-            )
-            db.add(user)
-        else:
-            # Update existing user
-            user.email = user_data.email
-            user.first_name = user_data.first_name
-            user.last_name = user_data.last_name
-        
-        db.commit()
-        db.refresh(user)
-        return user
-        
+        user = await db.scalar(upsert, execution_options={"populate_existing": True})
+        if user is None:
+            # Existing row and nothing to change; the conflict WHERE skipped the update
+            user = await db.scalar(select(User).where(User.auth0_id == user_data.auth0_id))
+        # Copy the row before commit expires it
+        snapshot = snapshot_user(user)
+        await db.commit()
     except IntegrityError as e:
-        db.rollback()
+        await db.rollback()
         # Handle unique constraint violations
         if "email" in str(e.orig):
             raise HTTPException(
@@ -65,9 +78,8 @@ async def sync_user(
                 detail="Email is already registered"
             )
         raise
-    except HTTPException:
-        db.rollback()
-        raise
     except Exception:
-        db.rollback()
+        await db.rollback()
         raise
+    
+    return await remember_user(snapshot)
@@ -1,7 +1,8 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
+from app.schemas.image import ImageVariants
 from app.schemas.user import UserResponse
 from app.schemas.question import QuestionResponse
 
@@ -33,7 +34,41 @@ class AnswerResponse(AnswerBase):
     updated_at: datetime
     question: QuestionResponse
     responder: UserResponse
+    # Resized derivatives of image_url; None until rendered or for external images
+    image_variants: Optional[ImageVariants] = None
 
     class Config:
         from_attributes = True
 
+
+
+class AnswerSummaryResponse(AnswerBase):
+    """Answer without its parent question, for lists that reference it by id."""
+    id: int
+    responder_id: int
+    created_at: datetime
+    updated_at: datetime
+    responder: UserResponse
+    # Resized derivatives of image_url; None until rendered or for external images
+    image_variants: Optional[ImageVariants] = None
+
+    class Config:
+        from_attributes = True
+
+
+class PaginatedAnswerResponse(BaseModel):
+    """Cursor-paginated answers. The parent question is included once when filtering by it."""
+    items: List[AnswerSummaryResponse]
+    question: Optional[QuestionResponse] = None
+    page_size: int
+    has_more: bool
+    next_cursor: Optional[str] = None
+
+
+class QuestionFullResponse(BaseModel):
+    """A question with a page of its answers, each entity serialized once."""
+    question: QuestionResponse
+    answers: List[AnswerSummaryResponse]
+    answers_page_size: int
+    answers_has_more: bool
+    answers_next_cursor: Optional[str] = None
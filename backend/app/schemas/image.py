@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+from typing import Literal, Optional
+
+# Which image list endpoints put in `image_url`: a derivative or the upload itself
+ImageSize = Literal["thumb", "card", "full", "original"]
+
+
+class ImageVariants(BaseModel):
+    """URLs of the resized WebP derivatives of an uploaded image."""
+    thumb: Optional[str] = None
+    card: Optional[str] = None
+    full: Optional[str] = None
@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional
+
+
+class JobResponse(BaseModel):
+    """Status and progress of a background job."""
+    id: int
+    kind: str
+    target_id: int
+    status: str
+    total: int
+    processed: int
+    error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -2,6 +2,7 @@ from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Optional, List
 
+from app.schemas.image import ImageVariants
 from app.schemas.user import UserResponse
 from app.schemas.topic import TopicResponse
 
@@ -31,8 +32,15 @@ class QuestionResponse(QuestionBase):
     asker_id: int
     created_at: datetime
     updated_at: datetime
+    # Number of answers, and the later of created_at and the newest answer
+    answer_count: int = 0
+    last_activity_at: Optional[datetime] = None
     topic: TopicResponse
     asker: UserResponse
+    # Resized derivatives of image_url; None until rendered or for external images
+    image_variants: Optional[ImageVariants] = None
+    # True when `ask` is a preview cut short by the list endpoint's `preview` option
+    ask_truncated: bool = False
 
     class Config:
         from_attributes = True
@@ -41,10 +49,13 @@ class QuestionResponse(QuestionBase):
 class PaginatedQuestionResponse(BaseModel):
     """Paginated questions response."""
     items: List[QuestionResponse]
-    total: int
-    page: int
+    total: Optional[int] = None
+    total_is_estimate: bool = False
+    page: Optional[int] = None
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    has_more: bool = False
+    next_cursor: Optional[str] = None
 
     class Config:
         from_attributes = True
@@ -0,0 +1,46 @@
+from pydantic import BaseModel
+from typing import List
+
+from app.schemas.question import QuestionResponse
+
+
+class SearchAnswerSnippet(BaseModel):
+    """An answer matching the search, reduced to a highlighted excerpt."""
+    id: int
+    responder_id: int
+    snippet: str
+
+
+class SearchQuestionHit(BaseModel):
+    """A question matching the search, directly or through its answers."""
+    question: QuestionResponse
+    headline: str
+    score: float
+    answers: List[SearchAnswerSnippet]
+
+
+class SearchResponse(BaseModel):
+    """Ranked full-text search results."""
+    query: str
+    items: List[SearchQuestionHit]
+    limit: int
+    offset: int
+    has_more: bool
+
+
+class QuestionSuggestion(BaseModel):
+    """Slim question reference for typeahead."""
+    id: int
+    title: str
+
+
+class TopicSuggestion(BaseModel):
+    """Slim topic reference for typeahead."""
+    id: int
+    name: str
+
+
+class SuggestResponse(BaseModel):
+    """Typeahead suggestions."""
+    questions: List[QuestionSuggestion]
+    topics: List[TopicSuggestion]
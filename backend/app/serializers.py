@@ -0,0 +1,242 @@
+"""
+Direct JSON serialization for hot read endpoints.
+
+Builds plain dicts with the same shape as the response schemas straight
+from ORM entities or projected row tuples (see app.queries) and encodes
+them once with orjson. Returning the result as a Response skips FastAPI's
+response_model pass, which would otherwise validate every nested model
+again and encode through the stdlib json module. The response_model stays
+on the route for OpenAPI.
+"""
+from typing import Any, Optional, Sequence
+
+import orjson
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+
+# Pydantic renders UTC datetimes with a "Z" suffix; match it
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+class FastJSONResponse(ORJSONResponse):
+    """orjson response; the app's default response class."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+def json_response(
+    content: Any,
+    response: Optional[Response] = None,
+    status_code: int = 200,
+) -> FastJSONResponse:
+    """
+    Encode `content` once. Headers already set on the handler's injected
+    Response (ETag, Cache-Control) are carried over, since FastAPI only
+    merges them into responses it builds itself (the route's status_code
+    isn't applied either, hence the argument).
+    """
+    rendered = FastJSONResponse(content, status_code=status_code)
+    if response is not None:
+        rendered.headers.raw.extend(response.headers.raw)
+    return rendered
+
+
+def user_dict(user: Any) -> dict:
+    """UserResponse shape."""
+    return {
+        "email": user.email,
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "auth0_id": user.auth0_id,
+        "id": user.id,
+        "created_at": user.created_at,
+        "updated_at": user.updated_at,
+    }
+
+
+def _prefixed_user_dict(row: Any, prefix: str, user_id: int) -> dict:
+    """UserResponse shape from a projected row's `<prefix>_*` columns."""
+    return {
+        "email": getattr(row, f"{prefix}_email"),
+        "first_name": getattr(row, f"{prefix}_first_name"),
+        "last_name": getattr(row, f"{prefix}_last_name"),
+        "auth0_id": getattr(row, f"{prefix}_auth0_id"),
+        "id": user_id,
+        "created_at": getattr(row, f"{prefix}_created_at"),
+        "updated_at": getattr(row, f"{prefix}_updated_at"),
+    }
+
+
+def image_variants_dict(item: Any) -> Optional[dict]:
+    """ImageVariants shape from an entity or row's image_*_url columns."""
+    if not item.image_card_url:
+        return None
+    return {
+        "thumb": item.image_thumb_url,
+        "card": item.image_card_url,
+        "full": item.image_full_url,
+    }
+
+
+def _image_url(item: Any, variants: Optional[dict], image_size: str) -> Optional[str]:
+    """The requested variant's URL, falling back to the original upload."""
+    if variants is None or image_size == "original":
+        return item.image_url
+    return variants[image_size] or item.image_url
+
+
+def topic_dict(topic: Any) -> dict:
+    """TopicResponse shape."""
+    return {
+        "name": topic.name,
+        "image_url": topic.image_url,
+        "id": topic.id,
+    }
+
+
+def question_dict(question: Any, topic: Any = None, asker: Any = None) -> dict:
+    """
+    QuestionResponse shape. Uses the loaded topic and asker relationships
+    unless they are passed in (write paths pass the catalog topic and the
+    current user rather than loading them).
+    """
+    topic = topic if topic is not None else question.topic
+    asker = asker if asker is not None else question.asker
+    return {
+        "topic_id": question.topic_id,
+        "ask": question.ask,
+        "image_url": question.image_url,
+        "id": question.id,
+        "asker_id": question.asker_id,
+        "created_at": question.created_at,
+        "updated_at": question.updated_at,
+        "answer_count": question.answer_count,
+        "last_activity_at": question.last_activity_at,
+        "topic": topic_dict(topic),
+        "asker": user_dict(asker),
+        "image_variants": image_variants_dict(question),
+        "ask_truncated": False,
+    }
+
+
+def question_row_dict(row: Any, image_size: str = "original") -> dict:
+    """QuestionResponse shape from a question_rows_query() row."""
+    variants = image_variants_dict(row)
+    return {
+        "topic_id": row.topic_id,
+        "ask": row.ask,
+        "image_url": _image_url(row, variants, image_size),
+        "id": row.id,
+        "asker_id": row.asker_id,
+        "created_at": row.created_at,
+        "updated_at": row.updated_at,
+        "answer_count": row.answer_count,
+        "last_activity_at": row.last_activity_at,
+        "topic": {
+            "name": row.topic_name,
+            "image_url": row.topic_image_url,
+            "id": row.topic_id,
+        },
+        "asker": _prefixed_user_dict(row, "asker", row.asker_id),
+        "image_variants": variants,
+        "ask_truncated": bool(row.ask_truncated),
+    }
+
+
+def answer_dict(answer: Any, question: Any, responder: Any) -> dict:
+    """AnswerResponse shape; `question` needs its topic and asker loaded."""
+    return {
+        "question_id": answer.question_id,
+        "response": answer.response,
+        "image_url": answer.image_url,
+        "id": answer.id,
+        "responder_id": answer.responder_id,
+        "created_at": answer.created_at,
+        "updated_at": answer.updated_at,
+        "question": question_dict(question),
+        "responder": user_dict(responder),
+        "image_variants": image_variants_dict(answer),
+    }
+
+
+def answer_row_dict(row: Any, image_size: str = "original") -> dict:
+    """AnswerSummaryResponse shape from a fetch_answer_page() row."""
+    variants = image_variants_dict(row)
+    return {
+        "question_id": row.question_id,
+        "response": row.response,
+        "image_url": _image_url(row, variants, image_size),
+        "id": row.id,
+        "responder_id": row.responder_id,
+        "created_at": row.created_at,
+        "updated_at": row.updated_at,
+        "responder": _prefixed_user_dict(row, "responder", row.responder_id),
+        "image_variants": variants,
+    }
+
+
+def questions_page_dict(
+    questions: Sequence[Any],
+    *,
+    total: Optional[int],
+    total_is_estimate: bool,
+    page: Optional[int],
+    page_size: int,
+    total_pages: Optional[int],
+    has_more: bool,
+    next_cursor: Optional[str] = None,
+    image_size: str = "original",
+) -> dict:
+    """
+    PaginatedQuestionResponse shape from question_rows_query() rows, with
+    each item's image_url pointing at the `image_size` variant.
+    """
+    return {
+        "items": [question_row_dict(row, image_size) for row in questions],
+        "total": total,
+        "total_is_estimate": total_is_estimate,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": total_pages,
+        "has_more": has_more,
+        "next_cursor": next_cursor,
+    }
+
+
+def answers_page_dict(
+    answers: Sequence[Any],
+    *,
+    question: Optional[Any],
+    page_size: int,
+    next_cursor: Optional[str],
+    image_size: str = "original",
+) -> dict:
+    """
+    PaginatedAnswerResponse shape from fetch_answer_page() rows, with each
+    item's image_url pointing at the `image_size` variant.
+    """
+    return {
+        "items": [answer_row_dict(row, image_size) for row in answers],
+        "question": question_dict(question) if question is not None else None,
+        "page_size": page_size,
+        "has_more": next_cursor is not None,
+        "next_cursor": next_cursor,
+    }
+
+
+def question_full_dict(
+    question: Any,
+    answers: Sequence[Any],
+    *,
+    answers_page_size: int,
+    answers_next_cursor: Optional[str],
+) -> dict:
+    """QuestionFullResponse shape."""
+    return {
+        "question": question_dict(question),
+        "answers": [answer_row_dict(row) for row in answers],
+        "answers_page_size": answers_page_size,
+        "answers_has_more": answers_next_cursor is not None,
+        "answers_next_cursor": answers_next_cursor,
+    }
@@ -0,0 +1,47 @@
+"""
+Pluggable image storage.
+
+STORAGE_BACKEND selects Cloudinary (default) or the local filesystem.
+"""
+from typing import Optional
+
+from app.config import settings
+from app.exceptions import ConfigurationError
+from app.storage.base import IMAGE_EXTENSIONS, StorageBackend, sha256_stream
+from app.storage.cloudinary_storage import CloudinaryStorage
+from app.storage.local import LocalStorage
+
+_storage: Optional[StorageBackend] = None
+
+
+def create_storage_backend() -> StorageBackend:
+    """Build the backend selected by STORAGE_BACKEND."""
+    if settings.STORAGE_BACKEND == "local":
+        return LocalStorage(settings.STORAGE_LOCAL_DIR, settings.STORAGE_LOCAL_BASE_URL)
+
+    if not settings.cloudinary_configured:
+        raise ConfigurationError("STORAGE_BACKEND is 'cloudinary' but Cloudinary credentials are not set")
+    return CloudinaryStorage(
+        settings.CLOUDINARY_CLOUD_NAME,
+        settings.CLOUDINARY_API_KEY,
+        settings.CLOUDINARY_API_SECRET,
+    )
+
+
+def get_storage_backend() -> StorageBackend:
+    """Process-wide backend, created on first use."""
+    global _storage
+    if _storage is None:
+        _storage = create_storage_backend()
+    return _storage
+
+
+__all__ = [
+    "IMAGE_EXTENSIONS",
+    "StorageBackend",
+    "CloudinaryStorage",
+    "LocalStorage",
+    "create_storage_backend",
+    "get_storage_backend",
+    "sha256_stream",
+]
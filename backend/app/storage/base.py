@@ -0,0 +1,51 @@
+"""
+Storage backend interface and shared helpers.
+"""
+import hashlib
+from typing import BinaryIO
+
+from app.constants import UPLOAD_HASH_CHUNK_SIZE
+
+# File extension stored for each accepted image type
+IMAGE_EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+}
+
+
+class StorageBackend:
+    """
+    Stores image files and returns their public URLs.
+
+    `save` is blocking (SDK network calls, disk writes) and is run on the
+    upload pool. Keys are content hashes, so saving the same key twice
+    stores the same bytes.
+    """
+
+    name: str = ""
+
+    def save(self, stream: BinaryIO, key: str, content_type: str) -> str:
+        """
+        Store the stream's contents under `key`.
+
+        Args:
+            stream: Readable binary stream positioned at the start
+            key: Content-addressed key (SHA-256 hex digest)
+            content_type: Sniffed MIME type of the image
+
+        Returns:
+            Public URL of the stored file
+        """
+        raise NotImplementedError
+
+
+def sha256_stream(stream: BinaryIO) -> str:
+    """Hex SHA-256 of a seekable stream, read in chunks; rewinds it afterwards."""
+    digest = hashlib.sha256()
+    stream.seek(0)
+    for chunk in iter(lambda: stream.read(UPLOAD_HASH_CHUNK_SIZE), b""):
+        digest.update(chunk)
+    stream.seek(0)
+    return digest.hexdigest()
@@ -0,0 +1,34 @@
+"""
+Cloudinary storage backend.
+"""
+from typing import BinaryIO
+
+import cloudinary
+import cloudinary.uploader
+
+from app.storage.base import StorageBackend
+
+
+class CloudinaryStorage(StorageBackend):
+    """Uploads to Cloudinary, using the content hash as the public id."""
+
+    name = "cloudinary"
+
+    def __init__(self, cloud_name: str, api_key: str, api_secret: str, folder: str = "questionaura"):
+        self.folder = folder
+        cloudinary.config(
+            cloud_name=cloud_name,
+            api_key=api_key,
+            api_secret=api_secret,
+            secure=True,
+        )
+
+    def save(self, stream: BinaryIO, key: str, content_type: str) -> str:
+        result = cloudinary.uploader.upload(
+            stream,
+            folder=self.folder,
+            public_id=key,
+            overwrite=False,
+            resource_type="image"
+        )
+        return result["secure_url"]
@@ -0,0 +1,43 @@
+"""
+Local filesystem storage backend, for development and offline load tests.
+"""
+import os
+import shutil
+import tempfile
+from typing import BinaryIO
+
+from app.storage.base import IMAGE_EXTENSIONS, StorageBackend
+
+
+class LocalStorage(StorageBackend):
+    """
+    Writes files under `root_dir`, fanned out by the first two hex digits
+    of the key, and returns URLs under `base_url` (served by the app's
+    /media mount).
+    """
+
+    name = "local"
+
+    def __init__(self, root_dir: str, base_url: str):
+        self.root_dir = os.path.abspath(root_dir)
+        self.base_url = base_url.rstrip("/")
+        os.makedirs(self.root_dir, exist_ok=True)
+
+    def save(self, stream: BinaryIO, key: str, content_type: str) -> str:
+        relative_path = f"{key[:2]}/{key}{IMAGE_EXTENSIONS.get(content_type, '')}"
+        path = os.path.join(self.root_dir, relative_path)
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temp file and rename, so readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".part")
+            try:
+                with os.fdopen(fd, "wb") as out:
+                    shutil.copyfileobj(stream, out)
+                os.replace(tmp_path, path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+        return f"{self.base_url}/{relative_path}"
@@ -0,0 +1,137 @@
+"""
+Process-wide topics catalog.
+
+Topics change rarely but are read on every page load and checked on every
+question write, so each worker keeps them in memory. Writers bump the
+"topics" row in `cache_versions` in the same transaction as the topic
+change; workers compare that stamp against the version they loaded (at
+most once per TOPIC_CATALOG_CHECK_INTERVAL_SECONDS) and reload on change.
+"""
+import asyncio
+import time
+from typing import Optional
+
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache_versions import bump_cache_version, read_cache_version
+from app.config import settings
+from app.http_cache import etag_for_bytes
+from app.models.topic import Topic
+from app.schemas.topic import TopicResponse
+
+CATALOG_NAME = "topics"
+
+_topic_list_adapter = TypeAdapter(list[TopicResponse])
+
+
+class TopicCatalog:
+    """In-memory topics keyed by id and by name, with pre-serialized JSON."""
+
+    def __init__(self, check_interval: float):
+        self.check_interval = check_interval
+        self.version: Optional[int] = None
+        self.by_id: dict[int, TopicResponse] = {}
+        self.by_name: dict[str, TopicResponse] = {}
+        self.list_json: bytes = b"[]"
+        self.item_json: dict[int, bytes] = {}
+        self.list_etag: str = etag_for_bytes(self.list_json)
+        self.item_etags: dict[int, str] = {}
+        self.reloads = 0
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self.version is not None
+
+    async def _current_version(self, db: AsyncSession) -> int:
+        return await read_cache_version(db, CATALOG_NAME)
+
+    async def load(self, db: AsyncSession) -> None:
+        """Read every topic and rebuild the indexes and JSON payloads."""
+        version = await self._current_version(db)
+        topics = (await db.scalars(select(Topic).order_by(Topic.name))).all()
+        entries = [TopicResponse.model_validate(topic) for topic in topics]
+
+        # Swap whole objects so concurrent readers never see a half-built catalog
+        self.by_id = {entry.id: entry for entry in entries}
+        self.by_name = {entry.name: entry for entry in entries}
+        self.item_json = {entry.id: entry.model_dump_json().encode() for entry in entries}
+        self.list_json = _topic_list_adapter.dump_json(entries)
+        self.item_etags = {topic_id: etag_for_bytes(body) for topic_id, body in self.item_json.items()}
+        self.list_etag = etag_for_bytes(self.list_json)
+        self.version = version
+        self._checked_at = time.monotonic()
+        self.reloads += 1
+
+    async def ensure_fresh(self, db: AsyncSession, force: bool = False) -> None:
+        """
+        Reload if another worker (or this one) changed topics.
+
+        The version check is throttled to one query per check interval
+        unless `force` is set; loading happens under a lock so a burst of
+        requests after a change triggers a single reload.
+        """
+        if self.loaded and not force and time.monotonic() - self._checked_at < self.check_interval:
+            return
+
+        async with self._lock:
+            if self.loaded and not force and time.monotonic() - self._checked_at < self.check_interval:
+                return
+            if self.loaded and await self._current_version(db) == self.version:
+                self._checked_at = time.monotonic()
+                return
+            await self.load(db)
+
+    def invalidate(self) -> None:
+        """Force the next ensure_fresh() to compare versions."""
+        self._checked_at = 0.0
+
+    async def get(self, db: AsyncSession, topic_id: int) -> Optional[TopicResponse]:
+        """
+        Look up a topic by id.
+
+        A miss re-checks the version before answering, so a topic created in
+        another worker moments ago is still found.
+        """
+        await self.ensure_fresh(db)
+        entry = self.by_id.get(topic_id)
+        if entry is None:
+            await self.ensure_fresh(db, force=True)
+            entry = self.by_id.get(topic_id)
+        return entry
+
+    async def exists(self, db: AsyncSession, topic_id: int) -> bool:
+        return await self.get(db, topic_id) is not None
+
+    def match(self, term: str, limit: int) -> list[TopicResponse]:
+        """Topics whose name contains `term` (case-insensitive), prefix matches first."""
+        needle = term.casefold()
+        hits = []
+        for name, entry in self.by_name.items():
+            position = name.casefold().find(needle)
+            if position >= 0:
+                hits.append((position != 0, len(name), name, entry))
+        hits.sort(key=lambda hit: hit[:3])
+        return [hit[3] for hit in hits[:limit]]
+
+    def stats(self) -> dict:
+        return {
+            "version": self.version,
+            "topics": len(self.by_id),
+            "reloads": self.reloads,
+        }
+
+
+async def bump_topics_version(db: AsyncSession) -> None:
+    """
+    Mark the topics catalog stale for every worker.
+
+    Call inside the transaction that changes topics, before commit.
+    """
+    await bump_cache_version(db, CATALOG_NAME)
+
+
+topic_catalog = TopicCatalog(check_interval=settings.TOPIC_CATALOG_CHECK_INTERVAL_SECONDS)
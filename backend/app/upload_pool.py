@@ -0,0 +1,115 @@
+"""
+Bounded thread pool for blocking storage uploads.
+
+Storage SDK calls (Cloudinary) block for the whole network transfer. Running
+them on the event loop stalls every other request on the worker, and
+running them on Starlette's shared threadpool lets a burst of uploads starve
+the database calls that also use it. Uploads get their own small pool with
+a fixed number of queue slots; when every slot is taken, submit() fails
+immediately so the endpoint can answer 503 instead of piling up work.
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+from app.config import settings
+
+
+class UploadPoolSaturated(Exception):
+    """Every worker is busy and the queue is full."""
+
+
+class UploadPool:
+    """
+    Thread pool with admission control.
+
+    At most `workers` uploads run at once and at most `max_queue` more wait
+    for a worker; anything beyond that is rejected.
+    """
+
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="upload")
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._running = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self._queue_wait_total = 0.0
+        self._run_time_total = 0.0
+
+    @property
+    def capacity(self) -> int:
+        return self.workers + self.max_queue
+
+    async def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run `fn` on the pool and await its result.
+
+        Raises:
+            UploadPoolSaturated: if no queue slot is free
+        """
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                self.rejected += 1
+                raise UploadPoolSaturated()
+            self._in_flight += 1
+            self.submitted += 1
+
+        queued_at = time.perf_counter()
+
+        def task() -> Any:
+            started_at = time.perf_counter()
+            with self._lock:
+                self._running += 1
+                self._queue_wait_total += started_at - queued_at
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._run_time_total += time.perf_counter() - started_at
+
+        future = self._executor.submit(task)
+        # Release the slot when the work finishes, even if the awaiting
+        # request was cancelled (the thread can't be)
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, future: Future) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if future.cancelled() or future.exception() is not None:
+                self.failed += 1
+            else:
+                self.completed += 1
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            finished = self.completed + self.failed
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "running": self._running,
+                "queued": self._in_flight - self._running,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "avg_queue_wait_ms": round(self._queue_wait_total / finished * 1000, 2) if finished else 0.0,
+                "avg_run_ms": round(self._run_time_total / finished * 1000, 2) if finished else 0.0,
+            }
+
+
+upload_pool = UploadPool(
+    workers=settings.UPLOAD_POOL_WORKERS,
+    max_queue=settings.UPLOAD_POOL_MAX_QUEUE,
+)
@@ -30,6 +30,45 @@ def sanitize_text(text: str, max_length: Optional[int] = None) -> str:
     return sanitized
 
 
+def escape_like(term: str, escape: str = "\\") -> str:
+    """
+    Escape LIKE/ILIKE wildcards so user input matches literally.
+    
+    Args:
+        term: Raw search term
+        escape: Escape character to pass along with the pattern
+        
+    Returns:
+        Term with %, _ and the escape character escaped
+    """
+    return (
+        term.replace(escape, escape * 2)
+        .replace("%", f"{escape}%")
+        .replace("_", f"{escape}_")
+    )
+
+
+def sniff_image_type(header: bytes) -> Optional[str]:
+    """
+    Identify an image format from its leading bytes.
+    
+    Args:
+        header: The first IMAGE_SNIFF_BYTES bytes of the file
+        
+    Returns:
+        MIME type for JPEG, PNG, GIF or WebP, or None if unrecognized
+    """
+    if header.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if header.startswith((b"GIF87a", b"GIF89a")):
+        return "image/gif"
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
 def validate_username(username: str) -> str:
     """
     Validate and sanitize username.
@@ -0,0 +1,86 @@
+"""
+Concurrency benchmark: latency of fast requests while slow requests are in flight.
+
+Fires a steady stream of slow requests (a full-text ILIKE scan over questions)
+alongside fast ones (/health) and reports p50/p95/p99 for each class. On a
+worker whose handlers block the event loop, the fast requests queue behind the
+slow ones and their p99 tracks the slow query time; with a non-blocking
+database path they stay flat.
+
+Run it against a server started at the baseline commit ("before") and again
+against the current tree ("after"), using the same database:
+
+    uvicorn app.main:app --workers 1 --port 8000
+    python benchmarks/concurrency_bench.py --base-url http://localhost:8000 --label after
+
+Requires httpx (pip install httpx).
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+SLOW_PATH = "/questions?search=a&page_size=100"
+FAST_PATH = "/health"
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def worker(client: httpx.AsyncClient, path: str, deadline: float, samples: list[float]) -> None:
+    """Issue requests back to back until the deadline, recording latencies."""
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        response = await client.get(path)
+        response.raise_for_status()
+        samples.append((time.perf_counter() - start) * 1000)
+
+
+async def run(base_url: str, duration: float, slow_workers: int, fast_workers: int) -> dict:
+    slow: list[float] = []
+    fast: list[float] = []
+    limits = httpx.Limits(max_connections=slow_workers + fast_workers)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        deadline = time.perf_counter() + duration
+        await asyncio.gather(
+            *(worker(client, SLOW_PATH, deadline, slow) for _ in range(slow_workers)),
+            *(worker(client, FAST_PATH, deadline, fast) for _ in range(fast_workers)),
+        )
+    return {"slow": slow, "fast": fast}
+
+
+def report(label: str, results: dict) -> None:
+    print(f"\n{label}")
+    print(f"{'class':<8}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'mean ms':>10}")
+    for name, samples in results.items():
+        mean = statistics.fmean(samples) if samples else 0.0
+        print(
+            f"{name:<8}{len(samples):>8}"
+            f"{percentile(samples, 50):>10.1f}{percentile(samples, 95):>10.1f}"
+            f"{percentile(samples, 99):>10.1f}{mean:>10.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mixed slow/fast request latency benchmark")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds to run")
+    parser.add_argument("--slow", type=int, default=8, help="Concurrent slow-request workers")
+    parser.add_argument("--fast", type=int, default=32, help="Concurrent fast-request workers")
+    parser.add_argument("--label", default="run", help="Label printed with the results")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.base_url, args.duration, args.slow, args.fast))
+    report(f"{args.label}: {args.slow} slow + {args.fast} fast workers for {args.duration:.0f}s", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Image derivative benchmark: throughput of app.imaging.render_derivatives.
+
+Renders the thumb/card/full WebP variants of synthetic uploads (a large
+photo-like JPEG and a screenshot-like PNG) and reports images per second:
+
+- inline: one process, no pool, the per-core baseline
+- pool:   a spawned ProcessPoolExecutor with 1..N workers, as the app runs
+          it, so you can see how close to linear the scaling is
+
+Use the per-core figure to size IMAGE_DERIVATIVE_WORKERS against the
+expected upload rate. Needs no database. Run from the backend directory:
+
+    python benchmarks/derivatives_bench.py --images 24 --workers 4
+"""
+import argparse
+import io
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from PIL import Image, ImageDraw, ImageFilter  # noqa: E402
+
+from app.constants import IMAGE_DERIVATIVE_SIZES  # noqa: E402
+from app.imaging import render_derivatives  # noqa: E402
+
+
+def make_photo(width: int, height: int) -> bytes:
+    """Noisy gradient JPEG; noise keeps the encoder from getting an easy ride."""
+    gradient = Image.linear_gradient("L").resize((width, height))
+    noise = Image.effect_noise((width, height), 40)
+    image = Image.merge("RGB", (gradient, noise, gradient.transpose(Image.Transpose.FLIP_LEFT_RIGHT)))
+    image = image.filter(ImageFilter.GaussianBlur(1))
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=90)
+    return buffer.getvalue()
+
+
+def make_screenshot(width: int, height: int) -> bytes:
+    """Flat-colour PNG with text-like stripes and transparency."""
+    image = Image.new("RGBA", (width, height), (245, 245, 245, 255))
+    draw = ImageDraw.Draw(image)
+    for y in range(0, height, 24):
+        draw.rectangle((40, y + 6, width - 40 - (y * 7) % 300, y + 14), fill=(40, 40, 40, 255))
+    draw.rectangle((0, 0, width // 4, height // 4), fill=(0, 0, 0, 0))
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def run_inline(uploads: list[bytes]) -> float:
+    """Seconds to render every upload in this process."""
+    start = time.perf_counter()
+    for data in uploads:
+        render_derivatives(data)
+    return time.perf_counter() - start
+
+
+def run_pool(uploads: list[bytes], workers: int) -> float:
+    """Seconds to render every upload on a pool of `workers` processes (startup excluded)."""
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        # Start every worker and import Pillow before timing
+        list(pool.map(render_derivatives, uploads[:workers]))
+        start = time.perf_counter()
+        list(pool.map(render_derivatives, uploads))
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Image derivative throughput benchmark")
+    parser.add_argument("--images", type=int, default=24, help="Uploads rendered per run")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Largest pool size to try")
+    parser.add_argument("--width", type=int, default=3000, help="Photo width in pixels")
+    parser.add_argument("--height", type=int, default=2000, help="Photo height in pixels")
+    args = parser.parse_args()
+
+    photo = make_photo(args.width, args.height)
+    screenshot = make_screenshot(1920, 1080)
+    uploads = [photo if i % 2 == 0 else screenshot for i in range(args.images)]
+
+    sizes = ", ".join(f"{name} {edge}px" for name, edge in IMAGE_DERIVATIVE_SIZES.items())
+    print(f"\nvariants: {sizes}")
+    print(f"uploads: {args.images} (photo {args.width}x{args.height} JPEG {len(photo) // 1024}KB, "
+          f"screenshot 1920x1080 PNG {len(screenshot) // 1024}KB, alternating)")
+    variant_bytes = sum(len(body) for body in render_derivatives(photo).values())
+    print(f"photo variants total {variant_bytes // 1024}KB\n")
+
+    inline_seconds = run_inline(uploads)
+    inline_rate = args.images / inline_seconds
+    print(f"{'mode':<16}{'images/s':>10}{'images/s/core':>16}{'ms/image':>11}")
+    print(f"{'inline':<16}{inline_rate:>10.1f}{inline_rate:>16.1f}{inline_seconds / args.images * 1000:>11.1f}")
+
+    workers = 1
+    while workers <= args.workers:
+        seconds = run_pool(uploads, workers)
+        rate = args.images / seconds
+        print(f"{f'pool x{workers}':<16}{rate:>10.1f}{rate / workers:>16.1f}{seconds / args.images * 1000:>11.1f}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+Search benchmark: ILIKE substring scan vs. the tsvector/GIN full-text path.
+
+Loads synthetic questions and answers into the database at DATABASE_URL,
+then times the query GET /questions?search= runs today (ILIKE '%term%')
+against the full-text query behind GET /search, for a handful of terms.
+
+Use a scratch database migrated to head; synthetic rows hang off a
+dedicated topic and user and are removed with --cleanup:
+
+    DATABASE_URL=postgresql://localhost/questionaura_bench alembic upgrade head
+    DATABASE_URL=postgresql://localhost/questionaura_bench python benchmarks/search_bench.py --rows 2000000
+    DATABASE_URL=postgresql://localhost/questionaura_bench python benchmarks/search_bench.py --cleanup
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+from sqlalchemy import create_engine, text
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from app.constants import SEARCH_TEXT_CONFIG  # noqa: E402
+
+BENCH_TOPIC = "__search_bench__"
+BENCH_AUTH0_ID = "search-bench-user"
+BATCH_SIZE = 100_000
+REPEATS = 5
+
+# A small vocabulary gives realistic match rates for common and rare terms
+WORDS = (
+    "algorithm recursion finance budget invest stock book novel history war "
+    "philosophy ethics nature hiking river mountain music guitar jazz career "
+    "interview salary technology computer network python database index query "
+    "psychology memory habit art painting museum crime court justice science "
+    "galaxy planet ocean climate energy garden recipe coffee travel language"
+).split()
+RARE_WORDS = ["zeitgeist", "quasar", "serendipity", "obsidian"]
+
+TERMS = ["python", "mountain river", "serendipity", "quasar", "jazz guitar"]
+
+
+def ensure_fixtures(conn) -> tuple[int, int]:
+    topic_id = conn.execute(
+        text("INSERT INTO topics (name) VALUES (:name) "
+             "ON CONFLICT (name) DO UPDATE SET name = EXCLUDED.name RETURNING id"),
+        {"name": BENCH_TOPIC},
+    ).scalar_one()
+    user_id = conn.execute(
+        text("INSERT INTO users (auth0_id, email, first_name, last_name) "
+             "VALUES (:sub, :email, 'Search', 'Bench') "
+             "ON CONFLICT (auth0_id) DO UPDATE SET email = EXCLUDED.email RETURNING id"),
+        {"sub": BENCH_AUTH0_ID, "email": "search-bench@questionaura.invalid"},
+    ).scalar_one()
+    return topic_id, user_id
+
+
+def load_rows(engine, rows: int) -> None:
+    """Insert `rows` questions, each with one answer, in batches."""
+    vocabulary = WORDS + RARE_WORDS
+    with engine.begin() as conn:
+        topic_id, user_id = ensure_fixtures(conn)
+
+    loaded = 0
+    while loaded < rows:
+        batch = min(BATCH_SIZE, rows - loaded)
+        start = time.perf_counter()
+        with engine.begin() as conn:
+            # The correlated `g > 0` makes Postgres rebuild the word array per row
+            conn.execute(
+                text("""
+                    WITH new_questions AS (
+                        INSERT INTO questions (topic_id, ask, asker_id)
+                        SELECT :topic_id,
+                               array_to_string(ARRAY(
+                                   SELECT (:words)[1 + floor(random() * :word_count)::int]
+                                   FROM generate_series(1, 14) WHERE g > 0
+                               ), ' ') || '?',
+                               :user_id
+                        FROM generate_series(1, :batch) AS g
+                        RETURNING id
+                    )
+                    INSERT INTO answers (question_id, response, responder_id)
+                    SELECT id,
+                           array_to_string(ARRAY(
+                               SELECT (:words)[1 + floor(random() * :word_count)::int]
+                               FROM generate_series(1, 40) WHERE id > 0
+                           ), ' '),
+                           :user_id
+                    FROM new_questions
+                """),
+                {
+                    "topic_id": topic_id,
+                    "user_id": user_id,
+                    "words": vocabulary,
+                    "word_count": len(vocabulary),
+                    "batch": batch,
+                },
+            )
+        loaded += batch
+        print(f"  loaded {loaded:,}/{rows:,} questions (+answers) in {time.perf_counter() - start:.1f}s")
+
+    with engine.connect() as conn:
+        conn.execution_options(isolation_level="AUTOCOMMIT").execute(text("ANALYZE questions, answers"))
+
+
+def time_query(engine, sql: str, params: dict) -> tuple[float, int]:
+    """Median wall time in ms over REPEATS runs (after one warm-up) and row count."""
+    samples = []
+    with engine.connect() as conn:
+        count = len(conn.execute(text(sql), params).all())
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            conn.execute(text(sql), params).all()
+            samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), count
+
+
+ILIKE_SQL = """
+    SELECT id FROM questions
+    WHERE ask ILIKE :pattern
+    ORDER BY created_at DESC, id DESC
+    LIMIT 20
+"""
+
+FTS_SQL = f"""
+    WITH hits AS (
+        SELECT id AS question_id, ts_rank_cd(ask_tsv, query) AS rank
+        FROM questions, websearch_to_tsquery('{SEARCH_TEXT_CONFIG}', :q) AS query
+        WHERE ask_tsv @@ query
+        UNION ALL
+        SELECT question_id, max(ts_rank_cd(response_tsv, query)) * 0.5
+        FROM answers, websearch_to_tsquery('{SEARCH_TEXT_CONFIG}', :q) AS query
+        WHERE response_tsv @@ query
+        GROUP BY question_id
+    )
+    SELECT question_id, sum(rank) AS score
+    FROM hits GROUP BY question_id
+    ORDER BY score DESC, question_id DESC
+    LIMIT 20
+"""
+
+FTS_QUESTIONS_ONLY_SQL = f"""
+    SELECT id FROM questions
+    WHERE ask_tsv @@ websearch_to_tsquery('{SEARCH_TEXT_CONFIG}', :q)
+    ORDER BY ts_rank_cd(ask_tsv, websearch_to_tsquery('{SEARCH_TEXT_CONFIG}', :q)) DESC, id DESC
+    LIMIT 20
+"""
+
+
+def run_benchmark(engine) -> None:
+    with engine.connect() as conn:
+        total = conn.execute(text("SELECT count(*) FROM questions")).scalar_one()
+    print(f"\nquestions in table: {total:,}  (median of {REPEATS} runs, ms)")
+    print(f"{'term':<16}{'ILIKE':>12}{'FTS questions':>16}{'FTS q+answers':>16}")
+    for term in TERMS:
+        # ILIKE only supports substring matching, so use the first word
+        ilike_ms, _ = time_query(engine, ILIKE_SQL, {"pattern": f"%{term.split()[0]}%"})
+        fts_q_ms, _ = time_query(engine, FTS_QUESTIONS_ONLY_SQL, {"q": term})
+        fts_ms, _ = time_query(engine, FTS_SQL, {"q": term})
+        print(f"{term:<16}{ilike_ms:>12.1f}{fts_q_ms:>16.1f}{fts_ms:>16.1f}")
+
+
+def cleanup(engine) -> None:
+    with engine.begin() as conn:
+        topic_id = conn.execute(text("SELECT id FROM topics WHERE name = :name"), {"name": BENCH_TOPIC}).scalar()
+        if topic_id is None:
+            print("Nothing to clean up.")
+            return
+        conn.execute(text(
+            "DELETE FROM answers WHERE question_id IN (SELECT id FROM questions WHERE topic_id = :t)"
+        ), {"t": topic_id})
+        conn.execute(text("DELETE FROM questions WHERE topic_id = :t"), {"t": topic_id})
+        conn.execute(text("DELETE FROM topics WHERE id = :t"), {"t": topic_id})
+        conn.execute(text("DELETE FROM users WHERE auth0_id = :sub"), {"sub": BENCH_AUTH0_ID})
+    print("Removed synthetic search benchmark rows.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ILIKE vs full-text search benchmark")
+    parser.add_argument("--rows", type=int, default=0, help="Synthetic questions to load before timing")
+    parser.add_argument("--cleanup", action="store_true", help="Delete synthetic rows and exit")
+    args = parser.parse_args()
+
+    engine = create_engine(os.environ["DATABASE_URL"])
+    if args.cleanup:
+        cleanup(engine)
+        return
+
+    if args.rows:
+        print(f"Loading {args.rows:,} synthetic questions...")
+        load_rows(engine, args.rows)
+    run_benchmark(engine)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Serialization benchmark: response_model path vs. direct orjson serializers.
+
+Times turning a page of questions (with topic and asker loaded) into
+response bytes, per 100 items:
+
+- before: the handler builds PaginatedQuestionResponse from ORM objects,
+  FastAPI dumps and re-validates it against the response_model, then
+  encodes with the stdlib json module (what JSONResponse does)
+- after: app.serializers builds the payload dict once and orjson encodes it
+
+Needs no database; rows are synthetic attribute objects shaped like both the
+ORM entities and the projected list rows. Run from the backend directory:
+
+    python benchmarks/serialization_bench.py --items 100 --repeats 200
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import orjson  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+from app.schemas.question import PaginatedQuestionResponse  # noqa: E402
+from app.serializers import ORJSON_OPTIONS, questions_page_dict  # noqa: E402
+
+
+def make_questions(count: int) -> list[SimpleNamespace]:
+    now = datetime.now(timezone.utc)
+    topics = [SimpleNamespace(id=i, name=f"Topic {i}", image_url=None) for i in range(1, 11)]
+    users = [
+        SimpleNamespace(
+            id=i,
+            auth0_id=f"auth0|bench{i}",
+            email=f"bench{i}@example.com",
+            first_name="Bench",
+            last_name=f"User{i}",
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(1, 21)
+    ]
+    questions = []
+    for i in range(count):
+        topic = topics[i % len(topics)]
+        asker = users[i % len(users)]
+        questions.append(SimpleNamespace(
+            id=i + 1,
+            topic_id=topic.id,
+            asker_id=asker.id,
+            ask=f"How would you approach problem number {i}? " * 4,
+            ask_truncated=False,
+            image_url=None,
+            image_thumb_url=None,
+            image_card_url=None,
+            image_full_url=None,
+            answer_count=i % 4,
+            created_at=now - timedelta(minutes=i),
+            updated_at=now - timedelta(minutes=i),
+            last_activity_at=now - timedelta(minutes=i),
+            topic=topic,
+            asker=asker,
+            # Flat columns, as question_rows_query() projects them
+            topic_name=topic.name,
+            topic_image_url=topic.image_url,
+            **{f"asker_{field}": getattr(asker, field) for field in (
+                "auth0_id", "email", "first_name", "last_name", "created_at", "updated_at"
+            )},
+        ))
+    return questions
+
+
+def before(questions: list, adapter: TypeAdapter) -> bytes:
+    model = PaginatedQuestionResponse(
+        items=questions, total=1000, page=1, page_size=len(questions),
+        total_pages=10, has_more=True,
+    )
+    # FastAPI: dump the returned model, validate against response_model, serialize
+    content = model.model_dump(by_alias=True)
+    validated = adapter.validate_python(content)
+    payload = adapter.dump_python(validated, mode="json")
+    return json.dumps(
+        payload, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def after(questions: list) -> bytes:
+    payload = questions_page_dict(
+        questions, total=1000, total_is_estimate=False, page=1,
+        page_size=len(questions), total_pages=10, has_more=True,
+    )
+    return orjson.dumps(payload, option=ORJSON_OPTIONS)
+
+
+def time_it(fn, repeats: int) -> float:
+    """Median milliseconds per call."""
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Question page serialization benchmark")
+    parser.add_argument("--items", type=int, default=100, help="Questions per page")
+    parser.add_argument("--repeats", type=int, default=200, help="Timed runs per path")
+    args = parser.parse_args()
+
+    questions = make_questions(args.items)
+    adapter = TypeAdapter(PaginatedQuestionResponse)
+
+    # Both paths must produce the same document
+    if json.loads(before(questions, adapter)) != json.loads(after(questions)):
+        print("WARNING: payloads differ between the two paths")
+
+    before_ms = time_it(lambda: before(questions, adapter), args.repeats)
+    after_ms = time_it(lambda: after(questions), args.repeats)
+    scale = 100 / args.items
+
+    print(f"\n{args.items} questions per page (median of {args.repeats} runs)")
+    print(f"{'path':<36}{'ms/page':>10}{'ms/100 items':>14}")
+    print(f"{'response_model + json (before)':<36}{before_ms:>10.2f}{before_ms * scale:>14.2f}")
+    print(f"{'direct dicts + orjson (after)':<36}{after_ms:>10.2f}{after_ms * scale:>14.2f}")
+    print(f"\nspeedup: {before_ms / after_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
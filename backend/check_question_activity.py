@@ -0,0 +1,79 @@
+"""
+Consistency check for the denormalized questions.answer_count and
+questions.last_activity_at columns (see app/question_activity.py).
+
+Scans questions in id order, a batch per query, compares both columns with
+what the question's answers imply and reports every question that has
+drifted. With --repair, drifted questions are recomputed from their answers
+and committed batch by batch, so the table is never locked for the whole
+scan and an interrupted run keeps the batches it finished.
+
+Run: python check_question_activity.py [--repair] [--batch-size N]
+"""
+import sys
+import argparse
+from app.database import SessionLocal
+from app.question_activity import drift_scan_query, has_drifted, recount_statement
+
+
+def check(db, repair: bool, batch_size: int) -> int:
+    """Scan every question; returns the number that had drifted."""
+    scanned = 0
+    drifted = 0
+    last_id = 0
+
+    while True:
+        rows = db.execute(drift_scan_query(last_id, batch_size)).all()
+        if not rows:
+            break
+        scanned += len(rows)
+        last_id = rows[-1].id
+
+        bad = [row for row in rows if has_drifted(row)]
+        for row in bad:
+            print(
+                f"  question {row.id}: answer_count {row.answer_count} (actual {row.actual_answer_count}), "
+                f"last_activity_at {row.last_activity_at} (newest answer {row.newest_answer_at})"
+            )
+        drifted += len(bad)
+
+        if repair and bad:
+            db.execute(recount_statement([row.id for row in bad]))
+            db.commit()
+        else:
+            # End the read transaction between batches
+            db.rollback()
+
+    print(f"\nScanned {scanned} questions, {drifted} drifted.")
+    return drifted
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check question answer counts and activity times")
+    parser.add_argument("--repair", action="store_true", help="Recompute drifted questions from their answers")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Questions scanned per query")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+
+    try:
+        drifted = check(db, args.repair, args.batch_size)
+        if drifted and args.repair:
+            print("Repaired.")
+        elif drifted:
+            # Non-zero exit so scheduled runs can alert
+            print("Run with --repair to fix.")
+            sys.exit(1)
+
+    except Exception as e:
+        db.rollback()
+        print(f"\nError: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
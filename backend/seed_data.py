@@ -10,6 +10,7 @@ from app.models.user import User
 from app.models.topic import Topic
 from app.models.question import Question
 from app.models.answer import Answer
+from app.question_activity import recount_statement
 
 TOPICS = [
     {"id": 1, "name": "Programming", "image_url": "https://images.unsplash.com/photo-1516321318423-f06f85e504b3?w=400&h=400&fit=crop"},
@@ -227,6 +228,11 @@ def seed_answers(db, question_map, user_map):
     print(f"  Created {created} answers")
 
 
+def update_question_activity(db):
+    """Recompute answer_count and last_activity_at from the seeded answers."""
+    db.execute(recount_statement())
+
+
 def reset_sequences(db):
     """Reset database sequences."""
     try:
@@ -262,6 +268,7 @@ def main():
         user_map = seed_users(db)
         question_map = seed_questions(db, topic_map, user_map)
         seed_answers(db, question_map, user_map)
+        update_question_activity(db)
         reset_sequences(db)
         
         db.commit()
@@ -0,0 +1,15 @@
+"""
+Test settings: the required variables get throwaway values before any app
+module is imported, so the tests never need a .env or a real database.
+"""
+import os
+import sys
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("DATABASE_ASYNC", "false")
+os.environ.setdefault("AUTH0_DOMAIN", "example.invalid")
+os.environ.setdefault("AUTH0_API_AUDIENCE", "test-audience")
+os.environ.setdefault("DEMO_JWT_SECRET", "test-secret-test-secret-test-secret-0")
+os.environ.setdefault("ENVIRONMENT", "test")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
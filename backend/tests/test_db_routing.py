@@ -0,0 +1,144 @@
+"""
+Replica routing (RoutingSession.get_bind) and the read-your-writes window
+(client_key / wrote_recently), against two in-memory SQLite databases
+standing in for the primary and a replica. Each holds one `marker` row
+naming it, so a read shows which database served it.
+"""
+import asyncio
+
+import pytest
+from sqlalchemy import String, create_engine, select, update
+from sqlalchemy.orm import Mapped, declarative_base, mapped_column
+from sqlalchemy.pool import StaticPool
+from starlette.requests import Request
+
+from app import database
+from app.database import RoutingSession, client_key, wrote_recently
+
+MarkerBase = declarative_base()
+
+
+class Marker(MarkerBase):
+    __tablename__ = "marker"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(20))
+
+
+def _fake_database(name: str):
+    # StaticPool: every connection sees the same in-memory database
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    MarkerBase.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(Marker.__table__.insert().values(id=1, name=name))
+    return engine
+
+
+@pytest.fixture
+def binds():
+    primary, replica = _fake_database("primary"), _fake_database("replica")
+    yield primary, replica
+    primary.dispose()
+    replica.dispose()
+
+
+@pytest.fixture(autouse=True)
+def clear_recent_writers():
+    database.recent_writers.clear()
+    yield
+    database.recent_writers.clear()
+
+
+def _session(binds, use_replica=True, key=None) -> RoutingSession:
+    primary, replica = binds
+    session = RoutingSession(info={"primary": primary, "replicas": [replica]})
+    session.info["use_replica"] = use_replica
+    session.info["client_key"] = key
+    return session
+
+
+def _served_by(session: RoutingSession) -> str:
+    return session.scalar(select(Marker.name).where(Marker.id == 1))
+
+
+def _request(authorization=None) -> Request:
+    headers = [(b"authorization", authorization.encode())] if authorization else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def test_reads_use_the_replica_when_allowed(binds):
+    with _session(binds) as session:
+        assert _served_by(session) == "replica"
+
+
+def test_primary_only_sessions_never_touch_the_replica(binds):
+    with _session(binds, use_replica=False) as session:
+        assert _served_by(session) == "primary"
+
+
+def test_dml_goes_to_the_primary_and_pins_later_reads(binds):
+    with _session(binds) as session:
+        session.execute(update(Marker).where(Marker.id == 1).values(name="primary, updated"))
+        assert session.info["wrote"]
+        assert _served_by(session) == "primary, updated"
+
+
+def test_flush_goes_to_the_primary_and_pins_later_reads(binds):
+    primary, replica = binds
+    with _session(binds) as session:
+        session.add(Marker(id=2, name="new"))
+        session.flush()
+        assert _served_by(session) == "primary"
+        session.commit()
+
+    with primary.connect() as connection:
+        assert connection.scalar(select(Marker.name).where(Marker.id == 2)) == "new"
+    with replica.connect() as connection:
+        assert connection.scalar(select(Marker.name).where(Marker.id == 2)) is None
+
+
+def test_client_key_is_a_stable_token_digest():
+    assert client_key(_request()) is None
+    key = client_key(_request("Bearer token-a"))
+    assert key == client_key(_request("Bearer token-a"))
+    assert key != client_key(_request("Bearer token-b"))
+    assert "token-a" not in key
+
+
+def test_committed_write_opens_the_read_your_writes_window(binds):
+    writer = client_key(_request("Bearer writer"))
+    reader = client_key(_request("Bearer reader"))
+
+    with _session(binds, key=writer) as session:
+        session.add(Marker(id=2, name="new"))
+        session.commit()
+
+    assert asyncio.run(wrote_recently(writer))
+    assert not asyncio.run(wrote_recently(reader))
+    assert not asyncio.run(wrote_recently(None))
+
+
+def test_reads_and_rolled_back_writes_do_not_open_the_window(binds):
+    key = client_key(_request("Bearer client"))
+
+    with _session(binds, key=key) as session:
+        _served_by(session)
+        session.commit()
+    assert not asyncio.run(wrote_recently(key))
+
+    with _session(binds, key=key) as session:
+        session.add(Marker(id=2, name="new"))
+        session.flush()
+        session.rollback()
+    assert not asyncio.run(wrote_recently(key))
+
+
+def test_window_closes_after_its_ttl(binds, monkeypatch):
+    key = client_key(_request("Bearer writer"))
+    monkeypatch.setattr(database.recent_writers, "default_ttl", 0)
+
+    with _session(binds, key=key) as session:
+        session.add(Marker(id=2, name="new"))
+        session.commit()
+
+    assert not asyncio.run(wrote_recently(key))
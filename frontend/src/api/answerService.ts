@@ -3,6 +3,10 @@ import type { components, operations } from "../types/api";
 
 // Use generated types from OpenAPI schema
 export type AnswerResponse = components["schemas"]["AnswerResponse"];
+export type AnswerSummaryResponse =
+  components["schemas"]["AnswerSummaryResponse"];
+export type PaginatedAnswerResponse =
+  components["schemas"]["PaginatedAnswerResponse"];
 export type AnswerCreate = components["schemas"]["AnswerCreate"];
 export type AnswerUpdate = components["schemas"]["AnswerUpdate"];
 
@@ -12,14 +16,16 @@ export type AnswerQueryParams =
 
 export const answerService = {
   /**
-   * Get all answers with optional filter.
+   * Get a page of answers (oldest first) with optional filter.
+   * Pass the returned next_cursor as `cursor` to fetch the following page.
    */
   getAllAnswers: async (
     params?: AnswerQueryParams
-  ): Promise<AnswerResponse[]> => {
-    const { data } = await axiosInstance.get<AnswerResponse[]>("/answers", {
-      params,
-    });
+  ): Promise<PaginatedAnswerResponse> => {
+    const { data } = await axiosInstance.get<PaginatedAnswerResponse>(
+      "/answers",
+      { params }
+    );
     return data;
   },
 
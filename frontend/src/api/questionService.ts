@@ -7,6 +7,8 @@ export type QuestionCreate = components["schemas"]["QuestionCreate"];
 export type QuestionUpdate = components["schemas"]["QuestionUpdate"];
 export type PaginatedQuestionResponse =
   components["schemas"]["PaginatedQuestionResponse"];
+export type QuestionFullResponse =
+  components["schemas"]["QuestionFullResponse"];
 
 // Extract query parameters from the generated operation type
 export type QuestionQueryParams =
@@ -38,6 +40,20 @@ export const questionService = {
     return data;
   },
 
+  /**
+   * Get a question together with its first page of answers in one request.
+   */
+  getQuestionFull: async (
+    id: number,
+    params?: { answers_cursor?: string; answers_page_size?: number }
+  ): Promise<QuestionFullResponse> => {
+    const { data } = await axiosInstance.get<QuestionFullResponse>(
+      `/questions/${id}/full`,
+      { params }
+    );
+    return data;
+  },
+
   /**
    * Create a new question. Requires authentication.
    * asker_id is automatically set from the current user.
@@ -3,7 +3,7 @@ import { useNavigate } from "react-router-dom";
 import { useAuth0 } from "@auth0/auth0-react";
 import { answerService } from "../api/answerService";
 import type { QuestionResponse } from "../api/questionService";
-import type { AnswerResponse } from "../api/answerService";
+import type { AnswerSummaryResponse } from "../api/answerService";
 import styles from "./QuestionCard.module.css";
 import type { UserResponse } from "../api/userService";
 import { useAuth } from "../hooks/useAuth";
@@ -16,7 +16,8 @@ export default function QuestionCard({ question }: QuestionCardProps) {
   const navigate = useNavigate();
   const { user, isAuthenticated } = useAuth0();
   const { demoAuth } = useAuth();
-  const [answers, setAnswers] = useState<AnswerResponse[]>([]);
+  const [answers, setAnswers] = useState<AnswerSummaryResponse[]>([]);
+  const [answersCursor, setAnswersCursor] = useState<string | null>(null);
   const [isLoadingAnswers, setIsLoadingAnswers] = useState(false);
   const [isDropdownOpen, setIsDropdownOpen] = useState(false);
 
@@ -30,8 +31,11 @@ export default function QuestionCard({ question }: QuestionCardProps) {
       try {
         const answersData = await answerService.getAllAnswers({
           question_id: question.id,
+          include_question: false,
+          page_size: 100,
         });
-        setAnswers(answersData);
+        setAnswers(answersData.items);
+        setAnswersCursor(answersData.next_cursor ?? null);
       } catch (err) {
         console.error("Failed to load answers:", err);
       } finally {
@@ -42,6 +46,26 @@ export default function QuestionCard({ question }: QuestionCardProps) {
     loadAnswers();
   }, [question.id]);
 
+  const handleLoadMoreAnswers = async (e: React.MouseEvent) => {
+    e.stopPropagation();
+    if (!answersCursor) return;
+    setIsLoadingAnswers(true);
+    try {
+      const answersData = await answerService.getAllAnswers({
+        question_id: question.id,
+        include_question: false,
+        page_size: 100,
+        cursor: answersCursor,
+      });
+      setAnswers((previous) => [...previous, ...answersData.items]);
+      setAnswersCursor(answersData.next_cursor ?? null);
+    } catch (err) {
+      console.error("Failed to load more answers:", err);
+    } finally {
+      setIsLoadingAnswers(false);
+    }
+  };
+
   // Close dropdown when clicking outside
   useEffect(() => {
     const handleClickOutside = () => {
@@ -180,6 +204,15 @@ export default function QuestionCard({ question }: QuestionCardProps) {
               )}
             </div>
           ))}
+          {answersCursor && (
+            <button
+              className={styles.loadMoreButton}
+              onClick={handleLoadMoreAnswers}
+              disabled={isLoadingAnswers}
+            >
+              {isLoadingAnswers ? "Loading..." : "Load more answers"}
+            </button>
+          )}
         </div>
       )}
 
@@ -4,7 +4,7 @@ import { useAuth0 } from "@auth0/auth0-react";
 import { questionService } from "../api/questionService";
 import { answerService } from "../api/answerService";
 import type { QuestionResponse } from "../api/questionService";
-import type { AnswerResponse } from "../api/answerService";
+import type { AnswerSummaryResponse } from "../api/answerService";
 import type { UserResponse } from "../api/userService";
 import Loading from "../components/Loading";
 import AnswerFormModal from "../components/AnswerFormModal";
@@ -22,7 +22,9 @@ export default function QuestionDetail() {
   const currentUser = isDemoMode ? demoAuth.user : user;
 
   const [question, setQuestion] = useState<QuestionResponse | null>(null);
-  const [answers, setAnswers] = useState<AnswerResponse[]>([]);
+  const [answers, setAnswers] = useState<AnswerSummaryResponse[]>([]);
+  const [answersCursor, setAnswersCursor] = useState<string | null>(null);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
   const [isLoading, setIsLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [isAnswerModalOpen, setIsAnswerModalOpen] = useState(false);
@@ -31,29 +33,54 @@ export default function QuestionDetail() {
     try {
       const answersData = await answerService.getAllAnswers({
         question_id: questionId,
+        include_question: false,
+        page_size: 100,
       });
-      setAnswers(answersData);
+      setAnswers(answersData.items);
+      setAnswersCursor(answersData.next_cursor ?? null);
     } catch (err) {
       console.error("Failed to load answers:", err);
     }
   }, []);
 
+  const loadMoreAnswers = async () => {
+    if (!question || !answersCursor) return;
+    setIsLoadingMore(true);
+    try {
+      const answersData = await answerService.getAllAnswers({
+        question_id: question.id,
+        include_question: false,
+        page_size: 100,
+        cursor: answersCursor,
+      });
+      setAnswers((previous) => [...previous, ...answersData.items]);
+      setAnswersCursor(answersData.next_cursor ?? null);
+    } catch (err) {
+      console.error("Failed to load more answers:", err);
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
+
   const loadQuestion = useCallback(async () => {
     if (!id) return;
     setIsLoading(true);
     setError(null);
     try {
       const questionId = parseInt(id, 10);
-      const questionData = await questionService.getQuestionById(questionId);
-      setQuestion(questionData);
-      await loadAnswers(questionId);
+      const detail = await questionService.getQuestionFull(questionId, {
+        answers_page_size: 100,
+      });
+      setQuestion(detail.question);
+      setAnswers(detail.answers);
+      setAnswersCursor(detail.answers_next_cursor ?? null);
     } catch (err) {
       console.error("Failed to load question:", err);
       setError("Question not found");
     } finally {
       setIsLoading(false);
     }
-  }, [id, loadAnswers]);
+  }, [id]);
 
   useEffect(() => {
     if (id) {
@@ -145,6 +172,11 @@ export default function QuestionDetail() {
     );
   }
 
+  // Only the loaded pages are in `answers` until the cursor runs out
+  const answerTotal = answersCursor
+    ? Math.max(question.answer_count ?? 0, answers.length)
+    : answers.length;
+
   return (
     <>
       <div className={styles.mainContent}>
@@ -192,7 +224,7 @@ export default function QuestionDetail() {
           <div className={styles.answersSection}>
             <div className={styles.answersHeader}>
               <h3 className={styles.answersTitle}>
-                {answers.length} {answers.length === 1 ? "Answer" : "Answers"}
+                {answerTotal} {answerTotal === 1 ? "Answer" : "Answers"}
               </h3>
             </div>
             {answers.length > 0 ? (
@@ -226,6 +258,15 @@ export default function QuestionDetail() {
                 No answers yet. Be the first to answer!
               </div>
             )}
+            {answersCursor && (
+              <button
+                className={styles.loadMoreButton}
+                onClick={loadMoreAnswers}
+                disabled={isLoadingMore}
+              >
+                {isLoadingMore ? "Loading..." : "Load more answers"}
+              </button>
+            )}
           </div>
         </div>
       </div>
@@ -359,6 +359,37 @@ export interface components {
             updated_at: string;
             question: components["schemas"]["QuestionResponse"];
             responder: components["schemas"]["UserResponse"];
+            /** @description Resized derivatives of image_url; null until rendered or for external images */
+            image_variants?: components["schemas"]["ImageVariants"] | null;
+        };
+        /**
+         * AnswerSummaryResponse
+         * @description Answer without its parent question, for lists that reference it by id.
+         */
+        AnswerSummaryResponse: {
+            /** Question Id */
+            question_id: number;
+            /** Response */
+            response: string;
+            /** Image Url */
+            image_url?: string | null;
+            /** Id */
+            id: number;
+            /** Responder Id */
+            responder_id: number;
+            /**
+             * Created At
+             * Format: date-time
+             */
+            created_at: string;
+            /**
+             * Updated At
+             * Format: date-time
+             */
+            updated_at: string;
+            responder: components["schemas"]["UserResponse"];
+            /** @description Resized derivatives of image_url; null until rendered or for external images */
+            image_variants?: components["schemas"]["ImageVariants"] | null;
         };
         /**
          * AnswerUpdate
@@ -396,6 +427,65 @@ export interface components {
             /** Detail */
             detail?: components["schemas"]["ValidationError"][];
         };
+        /**
+         * ImageVariants
+         * @description URLs of the resized WebP derivatives of an uploaded image.
+         */
+        ImageVariants: {
+            /** Thumb */
+            thumb?: string | null;
+            /** Card */
+            card?: string | null;
+            /** Full */
+            full?: string | null;
+        };
+        /**
+         * JobResponse
+         * @description Status and progress of a background job.
+         */
+        JobResponse: {
+            /** Id */
+            id: number;
+            /** Kind */
+            kind: string;
+            /** Target Id */
+            target_id: number;
+            /** Status */
+            status: string;
+            /** Total */
+            total: number;
+            /** Processed */
+            processed: number;
+            /** Error */
+            error?: string | null;
+            /**
+             * Created At
+             * Format: date-time
+             */
+            created_at: string;
+            /**
+             * Updated At
+             * Format: date-time
+             */
+            updated_at: string;
+            /** Finished At */
+            finished_at?: string | null;
+        };
+        /**
+         * PaginatedAnswerResponse
+         * @description Cursor-paginated answers. The parent question is included once when filtering by it.
+         */
+        PaginatedAnswerResponse: {
+            /** Items */
+            items: components["schemas"]["AnswerSummaryResponse"][];
+            question?: components["schemas"]["QuestionResponse"] | null;
+            /** Page Size */
+            page_size: number;
+            /** Has More */
+            has_more: boolean;
+            /** Next Cursor */
+            next_cursor?: string | null;
+        };
         /**
          * PaginatedQuestionResponse
          * @description Paginated questions response.
@@ -424,6 +514,21 @@ export interface components {
             /** Image Url */
             image_url?: string | null;
         };
+        /**
+         * QuestionFullResponse
+         * @description A question with a page of its answers, each entity serialized once.
+         */
+        QuestionFullResponse: {
+            question: components["schemas"]["QuestionResponse"];
+            /** Answers */
+            answers: components["schemas"]["AnswerSummaryResponse"][];
+            /** Answers Page Size */
+            answers_page_size: number;
+            /** Answers Has More */
+            answers_has_more: boolean;
+            /** Answers Next Cursor */
+            answers_next_cursor?: string | null;
+        };
         /**
          * QuestionResponse
          * @description Complete question response with database fields.
@@ -449,8 +554,25 @@ export interface components {
              * Format: date-time
              */
             updated_at: string;
+            /**
+             * Answer Count
+             * @default 0
+             */
+            answer_count?: number;
+            /**
+             * Last Activity At
+             * Format: date-time
+             */
+            last_activity_at?: string | null;
             topic: components["schemas"]["TopicResponse"];
             asker: components["schemas"]["UserResponse"];
+            /** @description Resized derivatives of image_url; null until rendered or for external images */
+            image_variants?: components["schemas"]["ImageVariants"] | null;
+            /**
+             * Ask Truncated
+             * @default false
+             */
+            ask_truncated?: boolean;
         };
         /**
          * QuestionUpdate
@@ -754,7 +876,10 @@ export interface operations {
     };
     delete_topic_topics__topic_id__delete: {
         parameters: {
-            query?: never;
+            query?: {
+                /** @description Force (true) or prevent (false) a background job; by default large topics use one */
+                background?: boolean | null;
+            };
             header?: never;
             path: {
                 topic_id: number;
@@ -770,6 +895,15 @@ export interface operations {
                 };
                 content?: never;
             };
+            /** @description Deletion started as a background job */
+            202: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["JobResponse"];
+                };
+            };
             /** @description Validation Error */
             422: {
                 headers: {
@@ -790,10 +924,18 @@ export interface operations {
                 asker_id?: number | null;
                 /** @description Search questions by text */
                 search?: string | null;
+                /** @description Only questions with (true) or without (false) answers */
+                answered?: boolean | null;
+                /** @description Order: newest, active (latest answer first) or answers (most answered first) */
+                sort?: "newest" | "active" | "answers";
                 /** @description Page number (starts at 1) */
                 page?: number;
                 /** @description Items per page (max 100) */
                 page_size?: number;
+                /** @description Truncate each ask to this many characters (feed cards) */
+                preview?: number | null;
+                /** @description Image variant returned in image_url: thumb, card, full or original */
+                image_size?: "thumb" | "card" | "full" | "original";
             };
             header?: never;
             path?: never;
@@ -954,6 +1096,14 @@ export interface operations {
             query?: {
                 /** @description Filter by question ID */
                 question_id?: number | null;
+                /** @description next_cursor from the previous page */
+                cursor?: string | null;
+                /** @description Items per page (max 100) */
+                page_size?: number;
+                /** @description Include the parent question once when filtering by question_id */
+                include_question?: boolean;
+                /** @description Image variant returned in image_url: thumb, card, full or original */
+                image_size?: "thumb" | "card" | "full" | "original";
             };
             header?: never;
             path?: never;
@@ -967,7 +1117,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["AnswerResponse"][];
+                    "application/json": components["schemas"]["PaginatedAnswerResponse"];
                 };
             };
             /** @description Validation Error */